@@ -34,7 +34,7 @@ def run_comparison():
     s = DNAStorage(ecc_method='rs', backend='python')
     times.append(measure(s.encode, data))
     
-    # 4. C++ RS (Mapping only accelerated)
+    # 4. C++ RS (native RS + mapping)
     s = DNAStorage(ecc_method='rs', backend='cpp')
     times.append(measure(s.encode, data))
     
@@ -0,0 +1,58 @@
+import argparse
+import os
+import random
+import sys
+import timeit
+
+# Add root to path
+sys.path.append(os.getcwd())
+
+from dna_storage.chunking import ChunkManager
+
+# Previous implementations, kept here as the reference for speed and output
+def scramble_reference(data, nonce):
+    if nonce == 0:
+        return data
+    mask = random.Random(nonce).randbytes(len(data))
+    return bytes(a ^ b for a, b in zip(data, mask))
+
+def header_mask_reference(header):
+    return bytes(a ^ b for a, b in zip(header, ChunkManager.HEADER_MASK))
+
+def run_scramble(chunk_size, nonces, repeat):
+    payload = os.urandom(chunk_size)
+    header = os.urandom(ChunkManager.HEADER_SIZE)
+
+    for nonce in range(nonces):
+        assert ChunkManager._apply_scramble(payload, nonce) == scramble_reference(payload, nonce)
+    assert ChunkManager._apply_header_mask(header) == header_mask_reference(header)
+
+    def cycle(scramble):
+        # One retry sweep: every nonce scrambled, as pack/parse do
+        for nonce in range(1, nonces + 1):
+            scramble(payload, nonce)
+
+    cases = [
+        ("scramble (reference)", lambda: cycle(scramble_reference)),
+        ("scramble (cached int XOR)", lambda: cycle(ChunkManager._apply_scramble)),
+        ("header mask (reference)", lambda: header_mask_reference(header)),
+        ("header mask (int XOR)", lambda: ChunkManager._apply_header_mask(header)),
+    ]
+    print(f"Chunk size {chunk_size} B, {nonces} nonces per sweep, best of {repeat}")
+    results = {}
+    for name, fn in cases:
+        number = 20 if name.startswith("scramble") else 20000
+        best = min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+        results[name] = best
+        print(f"  {name:28s} {best * 1e6:10.2f} us")
+
+    print(f"  scramble speedup:    {results['scramble (reference)'] / results['scramble (cached int XOR)']:.1f}x")
+    print(f"  header mask speedup: {results['header mask (reference)'] / results['header mask (int XOR)']:.1f}x")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=128)
+    parser.add_argument("--nonces", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run_scramble(args.chunk_size, args.nonces, args.repeat)
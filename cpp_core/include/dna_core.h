@@ -22,8 +22,34 @@ namespace dna_core {
     std::vector<uint8_t> pack_dna(const std::string& dna);
     std::string unpack_dna(const std::vector<uint8_t>& packed, size_t length);
 
+    // Rotating (homopolymer-free) encoding over packed bits (MSB first).
+    // block=false: legacy whole-packet base-3 conversion ('rotating').
+    // block=true:  11 bits -> 7 trits per block ('rotating_block').
+    std::string rotating_encode(const std::vector<uint8_t>& data, size_t bit_length, bool block);
+    std::vector<uint8_t> rotating_decode(const std::string& dna, size_t bit_length, bool block);
+
+    // Reed-Solomon RS(255, 255 - nsym), wire-compatible with reedsolo.RSCodec(nsym).
+    // Messages longer than 255 - nsym bytes are split into blocks like reedsolo does.
+    std::vector<uint8_t> rs_encode(const std::vector<uint8_t>& data, int nsym);
+
+    struct RSDecodeResult {
+        std::vector<uint8_t> data;
+        size_t errata;     // symbols corrected (errors + erasures)
+        std::string error; // empty on success (batch decode only)
+    };
+
+    // Throws std::runtime_error when the message cannot be corrected.
+    // erase_pos: known-bad byte positions in the encoded message.
+    RSDecodeResult rs_decode(const std::vector<uint8_t>& data, int nsym, const std::vector<size_t>& erase_pos = {});
+
     // Parallel Batch APIs
     std::vector<std::string> hamming_encode_batch(const std::vector<std::vector<uint8_t>>& batch, int threads=0);
     std::vector<HammingDecodeResult> hamming_decode_batch(const std::vector<std::string>& batch, int threads=0);
+    std::vector<std::string> rotating_encode_batch(const std::vector<std::vector<uint8_t>>& batch, size_t bit_length, bool block, int threads=0);
+    std::vector<std::vector<uint8_t>> rotating_decode_batch(const std::vector<std::string>& batch, size_t bit_length, bool block, int threads=0);
+    std::vector<std::vector<uint8_t>> rs_encode_batch(const std::vector<std::vector<uint8_t>>& batch, int nsym, int threads=0);
+    // erase_pos is empty or holds one position list per packet
+    std::vector<RSDecodeResult> rs_decode_batch(const std::vector<std::vector<uint8_t>>& batch, int nsym,
+                                                const std::vector<std::vector<size_t>>& erase_pos = {}, int threads=0);
 
 }
\ No newline at end of file
@@ -4,6 +4,8 @@
 #include <future>
 #include <thread>
 #include <algorithm>
+#include <cmath>
+#include <mutex>
 
 namespace dna_core {
 
@@ -186,53 +188,534 @@ namespace dna_core {
         return dna;
     }
 
-    std::vector<std::string> hamming_encode_batch(const std::vector<std::vector<uint8_t>>& batch, int threads) {
+    // Rotating Internals
+    static const char ROT_BASES[] = {'A', 'C', 'G', 'T'};
+
+    static const std::array<int8_t, 256> create_rot_map() {
+        std::array<int8_t, 256> map;
+        map.fill(-1);
+        map['A'] = 0;
+        map['C'] = 1;
+        map['G'] = 2;
+        map['T'] = 3;
+        return map;
+    }
+    static const auto ROT_INDEX = create_rot_map();
+
+    static const int BLOCK_BITS = 11;
+    static const int BLOCK_TRITS = 7;
+    // Largest power of 3 whose digit sums (trits up to 3) still fit in 32 bits
+    static const int LIMB_TRITS = 19;
+    static const uint32_t POW3_LIMB = 1162261467u; // 3^19
+
+    static inline bool get_bit(const std::vector<uint8_t>& data, size_t pos) {
+        return (data[pos / 8] >> (7 - pos % 8)) & 1;
+    }
+
+    static uint32_t read_bits(const std::vector<uint8_t>& data, size_t pos, int count) {
+        uint32_t v = 0;
+        for (int i = 0; i < count; ++i) {
+            v = (v << 1) | get_bit(data, pos + i);
+        }
+        return v;
+    }
+
+    static void write_bits(std::vector<uint8_t>& out, size_t pos, uint32_t v, int count) {
+        for (int i = 0; i < count; ++i) {
+            if ((v >> (count - 1 - i)) & 1) {
+                out[(pos + i) / 8] |= (0x80 >> ((pos + i) % 8));
+            }
+        }
+    }
+
+    static size_t legacy_num_trits(size_t bit_length) {
+        // Mirrors RotatingStrategy: ceil((L + 1) * log(2) / log(3))
+        return static_cast<size_t>(std::ceil((bit_length + 1) * std::log(2.0) / std::log(3.0)));
+    }
+
+    static size_t block_num_trits(size_t bit_length) {
+        size_t tail = bit_length % BLOCK_BITS;
+        return (bit_length / BLOCK_BITS) * BLOCK_TRITS + (tail * BLOCK_TRITS + BLOCK_BITS - 1) / BLOCK_BITS;
+    }
+
+    static std::string rotating_encode_legacy(const std::vector<uint8_t>& data, size_t L) {
+        if (L == 0) return "";
+
+        // Value = '1' + bits, as little-endian 32-bit limbs
+        std::vector<uint32_t> limbs(L / 32 + 1, 0);
+        for (size_t i = 0; i < L; ++i) {
+            if (get_bit(data, i)) {
+                size_t bit = L - 1 - i;
+                limbs[bit / 32] |= (1u << (bit % 32));
+            }
+        }
+        limbs[L / 32] |= (1u << (L % 32));
+
+        // Repeated division by 3^19 yields 19 trits per pass (least significant first)
+        size_t num_trits = legacy_num_trits(L);
+        std::vector<uint8_t> trits;
+        trits.reserve(num_trits + LIMB_TRITS);
+        size_t top = limbs.size();
+        while (top > 0) {
+            uint64_t rem = 0;
+            for (size_t i = top; i-- > 0;) {
+                uint64_t cur = (rem << 32) | limbs[i];
+                limbs[i] = static_cast<uint32_t>(cur / POW3_LIMB);
+                rem = cur % POW3_LIMB;
+            }
+            while (top > 0 && limbs[top - 1] == 0) --top;
+            for (int k = 0; k < LIMB_TRITS; ++k) {
+                trits.push_back(rem % 3);
+                rem /= 3;
+            }
+        }
+        // Drop the zero-padding of the last pass, then pad to the fixed length
+        while (trits.size() > num_trits && trits.back() == 0) trits.pop_back();
+        trits.resize(num_trits, 0);
+
+        std::string dna;
+        dna.reserve(num_trits);
+        int prev = 0; // Implied previous base 'A'
+        for (size_t i = num_trits; i-- > 0;) {
+            prev = (prev + 1 + trits[i]) % 4;
+            dna.push_back(ROT_BASES[prev]);
+        }
+        return dna;
+    }
+
+    static std::vector<uint8_t> rotating_decode_legacy(const std::string& dna, size_t L) {
+        std::vector<uint8_t> out((L + 7) / 8, 0);
+        if (L == 0) return out;
+
+        std::vector<uint32_t> limbs(1, 0);
+        int prev = 0;
+        for (size_t pos = 0; pos < dna.size(); pos += LIMB_TRITS) {
+            size_t count = std::min<size_t>(LIMB_TRITS, dna.size() - pos);
+            uint64_t digits = 0;
+            uint64_t mult = 1;
+            for (size_t i = 0; i < count; ++i) {
+                int curr = ROT_INDEX[static_cast<uint8_t>(dna[pos + i])];
+                if (curr < 0) throw std::invalid_argument("Invalid DNA character");
+                digits = digits * 3 + ((curr - prev - 1 + 8) % 4);
+                mult *= 3;
+                prev = curr;
+            }
+            uint64_t carry = digits;
+            for (auto& limb : limbs) {
+                uint64_t cur = static_cast<uint64_t>(limb) * mult + carry;
+                limb = static_cast<uint32_t>(cur);
+                carry = cur >> 32;
+            }
+            while (carry) {
+                limbs.push_back(static_cast<uint32_t>(carry));
+                carry >>= 32;
+            }
+        }
+
+        // Keep the low L bits (drops the sentinel), MSB first
+        for (size_t i = 0; i < L; ++i) {
+            size_t bit = L - 1 - i;
+            if (bit / 32 < limbs.size() && ((limbs[bit / 32] >> (bit % 32)) & 1)) {
+                out[i / 8] |= (0x80 >> (i % 8));
+            }
+        }
+        return out;
+    }
+
+    static std::string rotating_encode_block(const std::vector<uint8_t>& data, size_t L) {
+        size_t full = L / BLOCK_BITS;
+        int tail = L % BLOCK_BITS;
+        std::string dna;
+        dna.reserve(block_num_trits(L));
+
+        int prev = 0; // Implied previous base 'A'
+        auto emit = [&](uint32_t value, int count) {
+            uint8_t trits[BLOCK_TRITS];
+            for (int i = count - 1; i >= 0; --i) {
+                trits[i] = value % 3;
+                value /= 3;
+            }
+            for (int i = 0; i < count; ++i) {
+                prev = (prev + 1 + trits[i]) % 4;
+                dna.push_back(ROT_BASES[prev]);
+            }
+        };
+
+        for (size_t b = 0; b < full; ++b) {
+            emit(read_bits(data, b * BLOCK_BITS, BLOCK_BITS), BLOCK_TRITS);
+        }
+        if (tail) {
+            emit(read_bits(data, full * BLOCK_BITS, tail), (tail * BLOCK_TRITS + BLOCK_BITS - 1) / BLOCK_BITS);
+        }
+        return dna;
+    }
+
+    static std::vector<uint8_t> rotating_decode_block(const std::string& dna, size_t L) {
+        if (dna.size() != block_num_trits(L)) {
+            throw std::invalid_argument("DNA length does not match bit length");
+        }
+        size_t full = L / BLOCK_BITS;
+        int tail = L % BLOCK_BITS;
+        std::vector<uint8_t> out((L + 7) / 8, 0);
+
+        int prev = 0;
+        size_t pos = 0;
+        auto take = [&](int count) {
+            uint32_t value = 0;
+            for (int i = 0; i < count; ++i) {
+                int curr = ROT_INDEX[static_cast<uint8_t>(dna[pos++])];
+                if (curr < 0) curr = prev;
+                // A repeated base (t == 3) can only come from corruption; clamp it.
+                int t = (curr - prev - 1 + 8) % 4;
+                value = value * 3 + std::min(t, 2);
+                prev = curr;
+            }
+            return value;
+        };
+
+        for (size_t b = 0; b < full; ++b) {
+            write_bits(out, b * BLOCK_BITS, take(BLOCK_TRITS) & ((1u << BLOCK_BITS) - 1), BLOCK_BITS);
+        }
+        if (tail) {
+            uint32_t value = take((tail * BLOCK_TRITS + BLOCK_BITS - 1) / BLOCK_BITS);
+            write_bits(out, full * BLOCK_BITS, value & ((1u << tail) - 1), tail);
+        }
+        return out;
+    }
+
+    std::string rotating_encode(const std::vector<uint8_t>& data, size_t bit_length, bool block) {
+        if (data.size() * 8 < bit_length) {
+            throw std::invalid_argument("Packed data shorter than bit_length");
+        }
+        return block ? rotating_encode_block(data, bit_length) : rotating_encode_legacy(data, bit_length);
+    }
+
+    std::vector<uint8_t> rotating_decode(const std::string& dna, size_t bit_length, bool block) {
+        return block ? rotating_decode_block(dna, bit_length) : rotating_decode_legacy(dna, bit_length);
+    }
+
+    // Reed-Solomon over GF(256), wire-compatible with reedsolo.RSCodec(nsym):
+    // prim 0x11d, generator 2, fcr 0, messages split into 255-byte blocks.
+    // Polynomials are stored highest degree first, like reedsolo.
+    static const size_t RS_BLOCK_SIZE = 255;
+
+    struct GaloisTables {
+        std::array<uint8_t, 512> exp;
+        std::array<int, 256> log;
+
+        GaloisTables() {
+            int x = 1;
+            log.fill(0);
+            for (int i = 0; i < 255; ++i) {
+                exp[i] = static_cast<uint8_t>(x);
+                log[x] = i;
+                x <<= 1;
+                if (x & 0x100) x ^= 0x11d;
+            }
+            for (int i = 255; i < 512; ++i) exp[i] = exp[i - 255];
+        }
+    };
+    static const GaloisTables GF;
+
+    static inline uint8_t gf_mul(uint8_t a, uint8_t b) {
+        if (a == 0 || b == 0) return 0;
+        return GF.exp[GF.log[a] + GF.log[b]];
+    }
+
+    static inline uint8_t gf_div(uint8_t a, uint8_t b) {
+        if (b == 0) throw std::domain_error("GF(256) division by zero");
+        if (a == 0) return 0;
+        return GF.exp[(GF.log[a] + 255 - GF.log[b]) % 255];
+    }
+
+    static inline uint8_t gf_pow2(long power) {
+        // 2^power, power may be negative
+        return GF.exp[((power % 255) + 255) % 255];
+    }
+
+    using Poly = std::vector<uint8_t>;
+
+    static Poly poly_scale(const Poly& p, uint8_t x) {
+        Poly r(p.size());
+        for (size_t i = 0; i < p.size(); ++i) r[i] = gf_mul(p[i], x);
+        return r;
+    }
+
+    static Poly poly_add(const Poly& p, const Poly& q) {
+        Poly r(std::max(p.size(), q.size()), 0);
+        for (size_t i = 0; i < p.size(); ++i) r[i + r.size() - p.size()] = p[i];
+        for (size_t i = 0; i < q.size(); ++i) r[i + r.size() - q.size()] ^= q[i];
+        return r;
+    }
+
+    static Poly poly_mul(const Poly& p, const Poly& q) {
+        Poly r(p.size() + q.size() - 1, 0);
+        for (size_t j = 0; j < q.size(); ++j) {
+            for (size_t i = 0; i < p.size(); ++i) r[i + j] ^= gf_mul(p[i], q[j]);
+        }
+        return r;
+    }
+
+    static uint8_t poly_eval(const Poly& p, uint8_t x) {
+        uint8_t y = p[0];
+        for (size_t i = 1; i < p.size(); ++i) y = gf_mul(y, x) ^ p[i];
+        return y;
+    }
+
+    static const Poly& rs_generator(int nsym) {
+        // One generator per nsym, built on first use
+        static std::array<Poly, RS_BLOCK_SIZE> cache;
+        static std::once_flag flags[RS_BLOCK_SIZE];
+        std::call_once(flags[nsym], [nsym]() {
+            Poly g = {1};
+            for (int i = 0; i < nsym; ++i) g = poly_mul(g, {1, gf_pow2(i)});
+            cache[nsym] = g;
+        });
+        return cache[nsym];
+    }
+
+    static void check_nsym(int nsym) {
+        if (nsym <= 0 || nsym >= static_cast<int>(RS_BLOCK_SIZE)) {
+            throw std::invalid_argument("nsym must be between 1 and 254");
+        }
+    }
+
+    std::vector<uint8_t> rs_encode(const std::vector<uint8_t>& data, int nsym) {
+        check_nsym(nsym);
+        const Poly& gen = rs_generator(nsym);
+        const size_t step = RS_BLOCK_SIZE - nsym;
+
+        std::vector<uint8_t> out;
+        out.reserve(data.size() + ((data.size() + step - 1) / step) * nsym);
+        std::vector<uint8_t> reg(nsym);
+        for (size_t start = 0; start < data.size(); start += step) {
+            size_t end = std::min(start + step, data.size());
+            std::fill(reg.begin(), reg.end(), 0);
+            for (size_t i = start; i < end; ++i) {
+                uint8_t feedback = data[i] ^ reg[0];
+                std::copy(reg.begin() + 1, reg.end(), reg.begin());
+                reg[nsym - 1] = 0;
+                if (feedback) {
+                    for (int j = 0; j < nsym; ++j) reg[j] ^= gf_mul(gen[j + 1], feedback);
+                }
+            }
+            out.insert(out.end(), data.begin() + start, data.begin() + end);
+            out.insert(out.end(), reg.begin(), reg.end());
+        }
+        return out;
+    }
+
+    static std::vector<uint8_t> rs_syndromes(const Poly& msg, int nsym) {
+        std::vector<uint8_t> synd(nsym);
+        for (int i = 0; i < nsym; ++i) synd[i] = poly_eval(msg, gf_pow2(i));
+        return synd;
+    }
+
+    static bool all_zero(const std::vector<uint8_t>& v) {
+        return std::all_of(v.begin(), v.end(), [](uint8_t x) { return x == 0; });
+    }
+
+    // Berlekamp-Massey on the Forney syndromes (erasures already removed)
+    static Poly rs_error_locator(const std::vector<uint8_t>& synd, int nsym, int erase_count) {
+        Poly err_loc = {1};
+        Poly old_loc = {1};
+        for (int i = 0; i < nsym - erase_count; ++i) {
+            uint8_t delta = synd[i];
+            for (size_t j = 1; j < err_loc.size(); ++j) {
+                delta ^= gf_mul(err_loc[err_loc.size() - 1 - j], synd[i - j]);
+            }
+            old_loc.push_back(0);
+            if (delta != 0) {
+                if (old_loc.size() > err_loc.size()) {
+                    Poly new_loc = poly_scale(old_loc, delta);
+                    old_loc = poly_scale(err_loc, gf_div(1, delta));
+                    err_loc = new_loc;
+                }
+                err_loc = poly_add(err_loc, poly_scale(old_loc, delta));
+            }
+        }
+        size_t lead = 0;
+        while (lead < err_loc.size() && err_loc[lead] == 0) ++lead;
+        err_loc.erase(err_loc.begin(), err_loc.begin() + lead);
+
+        int errs = static_cast<int>(err_loc.size()) - 1;
+        if ((errs - erase_count) * 2 + erase_count > nsym) {
+            throw std::runtime_error("Too many errors to correct");
+        }
+        return err_loc;
+    }
+
+    // Forney algorithm: error magnitudes at the given (message-index) positions
+    static void rs_correct_errata(Poly& msg, const std::vector<uint8_t>& synd, const std::vector<size_t>& pos) {
+        std::vector<size_t> coef_pos(pos.size());
+        for (size_t i = 0; i < pos.size(); ++i) coef_pos[i] = msg.size() - 1 - pos[i];
+
+        Poly err_loc = {1};
+        for (size_t c : coef_pos) err_loc = poly_mul(err_loc, {gf_pow2(c), 1});
+
+        // Error evaluator: (reversed syndromes * locator) mod x^len(err_loc)
+        Poly synd_rev(synd.rbegin(), synd.rend());
+        synd_rev.push_back(0); // reedsolo's leading zero syndrome, reversed
+        Poly product = poly_mul(synd_rev, err_loc);
+        Poly err_eval(product.end() - err_loc.size(), product.end());
+
+        std::vector<uint8_t> X(coef_pos.size());
+        for (size_t i = 0; i < coef_pos.size(); ++i) X[i] = gf_pow2(coef_pos[i]);
+
+        for (size_t i = 0; i < X.size(); ++i) {
+            uint8_t xi_inv = gf_div(1, X[i]);
+            uint8_t loc_prime = 1;
+            for (size_t j = 0; j < X.size(); ++j) {
+                if (j != i) loc_prime = gf_mul(loc_prime, 1 ^ gf_mul(xi_inv, X[j]));
+            }
+            if (loc_prime == 0) {
+                throw std::runtime_error("Decoding failed: errata locator prime is 0");
+            }
+            uint8_t y = gf_mul(X[i], poly_eval(err_eval, xi_inv));
+            msg[pos[i]] ^= gf_div(y, loc_prime);
+        }
+    }
+
+    // Corrects one block in place; returns the number of errata fixed
+    static size_t rs_correct_block(Poly& msg, int nsym, const std::vector<size_t>& erase_pos) {
+        if (msg.size() <= static_cast<size_t>(nsym)) {
+            throw std::invalid_argument("RS block shorter than its parity");
+        }
+        if (erase_pos.size() > static_cast<size_t>(nsym)) {
+            throw std::runtime_error("Too many erasures to correct");
+        }
+        for (size_t p : erase_pos) msg[p] = 0;
+
+        std::vector<uint8_t> synd = rs_syndromes(msg, nsym);
+        if (all_zero(synd)) return 0;
+
+        // Forney syndromes: strip the erasures out before Berlekamp-Massey
+        std::vector<uint8_t> fsynd = synd;
+        for (size_t p : erase_pos) {
+            uint8_t x = gf_pow2(msg.size() - 1 - p);
+            for (size_t j = 0; j + 1 < fsynd.size(); ++j) fsynd[j] = gf_mul(fsynd[j], x) ^ fsynd[j + 1];
+        }
+        Poly err_loc = rs_error_locator(fsynd, nsym, static_cast<int>(erase_pos.size()));
+
+        // Chien search
+        Poly err_loc_rev(err_loc.rbegin(), err_loc.rend());
+        std::vector<size_t> errata = erase_pos;
+        size_t found = 0;
+        for (size_t i = 0; i < msg.size(); ++i) {
+            if (poly_eval(err_loc_rev, gf_pow2(i)) == 0) {
+                errata.push_back(msg.size() - 1 - i);
+                ++found;
+            }
+        }
+        if (found != err_loc.size() - 1) {
+            throw std::runtime_error("Too many (or few) errors found by Chien Search");
+        }
+
+        rs_correct_errata(msg, synd, errata);
+        if (!all_zero(rs_syndromes(msg, nsym))) {
+            throw std::runtime_error("Could not correct message");
+        }
+        return errata.size();
+    }
+
+    RSDecodeResult rs_decode(const std::vector<uint8_t>& data, int nsym, const std::vector<size_t>& erase_pos) {
+        check_nsym(nsym);
+        RSDecodeResult result;
+        result.errata = 0;
+        result.data.reserve(data.size());
+
+        for (size_t start = 0; start < data.size(); start += RS_BLOCK_SIZE) {
+            size_t end = std::min(start + RS_BLOCK_SIZE, data.size());
+            Poly block(data.begin() + start, data.begin() + end);
+            std::vector<size_t> block_erasures;
+            for (size_t p : erase_pos) {
+                if (p >= start && p < end) block_erasures.push_back(p - start);
+            }
+            result.errata += rs_correct_block(block, nsym, block_erasures);
+            result.data.insert(result.data.end(), block.begin(), block.end() - nsym);
+        }
+        return result;
+    }
+
+    // Runs fn(i) for i in [0, count) split across threads. Worker exceptions are rethrown.
+    template <typename Fn>
+    static void parallel_for(size_t count, int threads, Fn fn) {
         if (threads <= 0) threads = std::thread::hardware_concurrency();
         if (threads == 0) threads = 1;
-        
-        std::vector<std::string> results(batch.size());
+
         std::vector<std::future<void>> futures;
-        
-        auto worker = [&](size_t start, size_t end) {
-            for (size_t i = start; i < end; ++i) {
-                results[i] = hamming_encode_dna(batch[i]);
-            }
-        };
-        
-        size_t chunk_size = (batch.size() + threads - 1) / threads;
+        size_t chunk_size = (count + threads - 1) / threads;
         for (int i = 0; i < threads; ++i) {
             size_t start = i * chunk_size;
-            size_t end = std::min(start + chunk_size, batch.size());
+            size_t end = std::min(start + chunk_size, count);
             if (start >= end) break;
-            futures.push_back(std::async(std::launch::async, worker, start, end));
+            futures.push_back(std::async(std::launch::async, [&fn, start, end]() {
+                for (size_t j = start; j < end; ++j) fn(j);
+            }));
         }
-        
+
         for (auto& f : futures) f.wait();
+        for (auto& f : futures) f.get();
+    }
+
+    std::vector<std::string> hamming_encode_batch(const std::vector<std::vector<uint8_t>>& batch, int threads) {
+        std::vector<std::string> results(batch.size());
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            results[i] = hamming_encode_dna(batch[i]);
+        });
         return results;
     }
 
     std::vector<HammingDecodeResult> hamming_decode_batch(const std::vector<std::string>& batch, int threads) {
-        if (threads <= 0) threads = std::thread::hardware_concurrency();
-        if (threads == 0) threads = 1;
-        
         std::vector<HammingDecodeResult> results(batch.size());
-        std::vector<std::future<void>> futures;
-        
-        auto worker = [&](size_t start, size_t end) {
-            for (size_t i = start; i < end; ++i) {
-                results[i] = hamming_decode_dna(batch[i]);
-            }
-        };
-        
-        size_t chunk_size = (batch.size() + threads - 1) / threads;
-        for (int i = 0; i < threads; ++i) {
-            size_t start = i * chunk_size;
-            size_t end = std::min(start + chunk_size, batch.size());
-            if (start >= end) break;
-            futures.push_back(std::async(std::launch::async, worker, start, end));
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            results[i] = hamming_decode_dna(batch[i]);
+        });
+        return results;
+    }
+
+    std::vector<std::string> rotating_encode_batch(const std::vector<std::vector<uint8_t>>& batch, size_t bit_length, bool block, int threads) {
+        std::vector<std::string> results(batch.size());
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            results[i] = rotating_encode(batch[i], bit_length, block);
+        });
+        return results;
+    }
+
+    std::vector<std::vector<uint8_t>> rotating_decode_batch(const std::vector<std::string>& batch, size_t bit_length, bool block, int threads) {
+        std::vector<std::vector<uint8_t>> results(batch.size());
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            results[i] = rotating_decode(batch[i], bit_length, block);
+        });
+        return results;
+    }
+
+    std::vector<std::vector<uint8_t>> rs_encode_batch(const std::vector<std::vector<uint8_t>>& batch, int nsym, int threads) {
+        check_nsym(nsym);
+        std::vector<std::vector<uint8_t>> results(batch.size());
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            results[i] = rs_encode(batch[i], nsym);
+        });
+        return results;
+    }
+
+    std::vector<RSDecodeResult> rs_decode_batch(const std::vector<std::vector<uint8_t>>& batch, int nsym,
+                                                const std::vector<std::vector<size_t>>& erase_pos, int threads) {
+        check_nsym(nsym);
+        if (!erase_pos.empty() && erase_pos.size() != batch.size()) {
+            throw std::invalid_argument("erase_pos must have one entry per packet");
         }
-        
-        for (auto& f : futures) f.wait();
+        std::vector<RSDecodeResult> results(batch.size());
+        parallel_for(batch.size(), threads, [&](size_t i) {
+            // A packet that cannot be corrected is reported, not thrown, so the
+            // rest of the batch still decodes.
+            try {
+                results[i] = rs_decode(batch[i], nsym, erase_pos.empty() ? std::vector<size_t>() : erase_pos[i]);
+            } catch (const std::exception& e) {
+                results[i].errata = 0;
+                results[i].error = e.what();
+            }
+        });
         return results;
     }
 
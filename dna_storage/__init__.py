@@ -3,10 +3,16 @@ from .binary_to_dna import (
     bytes_to_binary,
     binary_to_dna_sequence,
     dna_sequence_to_binary,
-    binary_to_bytes
+    binary_to_bytes,
+    bytes_to_dna,
+    dna_to_bytes,
+    bits_to_packed,
+    packed_to_bits
 )
+from .archive import DNAArchive
 from .ecc import ECC
 from .file_ops import DNAStorage
+from .packed_dna import PackedDNA
 from .visualization import visualize_mapping
 
 __all__ = [
@@ -14,7 +20,13 @@ __all__ = [
     'binary_to_dna_sequence',
     'dna_sequence_to_binary',
     'binary_to_bytes',
+    'bytes_to_dna',
+    'dna_to_bytes',
+    'bits_to_packed',
+    'packed_to_bits',
+    'DNAArchive',
     'ECC',
     'DNAStorage',
+    'PackedDNA',
     'visualize_mapping'
 ]
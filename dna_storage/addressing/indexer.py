@@ -1,28 +1,36 @@
 from ..chunking import ChunkManager
+from ..ecc import ECC
 import math
 
 class AddressIndexer:
-    def __init__(self, chunk_size, ecc_method, ecc_params, bits_per_base=2.0):
+    def __init__(self, chunk_size, ecc_method, ecc_params, bits_per_base=2.0, strategy=None):
         self.chunk_size = chunk_size
         self.ecc_method = ecc_method
         self.ecc_params = ecc_params
         self.bits_per_base = bits_per_base
-        
-    def calculate_chunk_dna_length(self):
+        # When given, the strategy's exact encoded_length() wins over bits_per_base
+        self.strategy = strategy
+
+    def calculate_chunk_bits(self):
+        """Number of bits in one ECC-encoded packet."""
         packet_size = ChunkManager.HEADER_SIZE + self.chunk_size
         
-        # Calculate BITS of encoded packet
         if self.ecc_method == 'rs':
-             nsym = self.ecc_params.get('nsym', 10)
-             bytes_len = packet_size + nsym
-             bits = bytes_len * 8
+             # reedsolo adds nsym parity bytes per 255-byte block
+             bytes_len = ECC.calculate_encoded_length(packet_size, 'rs', self.ecc_params)
+             return bytes_len * 8
         elif self.ecc_method == 'hamming':
              # 1 byte input -> 14 bits output
-             bits = packet_size * 14
+             return packet_size * 14
         else:
-             bits = packet_size * 8
+             return packet_size * 8
+        
+    def calculate_chunk_dna_length(self):
+        bits = self.calculate_chunk_bits()
              
         # Bits -> DNA bases
+        if self.strategy is not None:
+            return self.strategy.encoded_length(bits)
         return math.ceil(bits / self.bits_per_base)
 
     def get_chunk_range(self, chunk_index, header_offset):
@@ -33,4 +41,4 @@ class AddressIndexer:
         chunk_len = self.calculate_chunk_dna_length()
         start = header_offset + (chunk_index * chunk_len)
         end = start + chunk_len
-        return start, end
\ No newline at end of file
+        return start, end
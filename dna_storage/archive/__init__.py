@@ -0,0 +1,7 @@
+from .dna2 import Dna2File, Dna2Writer, is_dna2, write_dna2
+from .handle import DNAArchive
+from .reader import DNAReader
+from .container import DNAContainer, pack_container
+
+__all__ = ['DNAArchive', 'DNAContainer', 'DNAReader', 'Dna2File', 'Dna2Writer', 'is_dna2',
+           'pack_container', 'write_dna2']
@@ -0,0 +1,118 @@
+"""
+Multi-file container: many files in one encoded archive, with one header.
+
+The archive payload starts with a directory, followed by the files. Each
+file begins on a chunk boundary:
+
+    [magic 'DNAD'][directory length, 4 bytes][directory JSON] padding
+    [file 0] padding [file 1] padding ... [file N-1]
+
+The directory JSON maps name -> [first_chunk, length, crc32]. Extracting a
+file decodes the directory chunks and that file's chunks only.
+"""
+import json
+import struct
+import zlib
+from ..failures import DNAStorageError, FailureType
+from ..file_ops import DNAStorage
+from .handle import DNAArchive
+
+DIRECTORY_MAGIC = b'DNAD'
+DIRECTORY_PREFIX = struct.Struct('!4sI')
+
+def _chunks_for(length, chunk_size):
+    return -(-length // chunk_size)
+
+def _directory_bytes(entries):
+    body = json.dumps(entries, separators=(',', ':')).encode('utf-8')
+    return DIRECTORY_PREFIX.pack(DIRECTORY_MAGIC, len(body)) + body
+
+def pack_container(files, storage=None, packed=False):
+    """
+    Encodes several files into one archive.
+
+    files: mapping (or iterable of pairs) name -> bytes-like.
+    Returns the DNA as from storage.encode(), so it can be written as text
+    or .dna2.
+    """
+    storage = storage or DNAStorage()
+    files = list(files.items() if hasattr(files, 'items') else files)
+    chunk_size = storage.chunk_size
+
+    # Chunk numbers depend on the directory size and vice versa; the
+    # directory only grows, so a few passes settle the layout.
+    directory_chunks = 1
+    while True:
+        entries = {}
+        next_chunk = directory_chunks
+        for name, data in files:
+            if name in entries:
+                raise ValueError(f"Duplicate file name {name!r}")
+            entries[name] = [next_chunk, len(data), zlib.crc32(data)]
+            next_chunk += _chunks_for(len(data), chunk_size)
+        directory = _directory_bytes(entries)
+        needed = _chunks_for(len(directory), chunk_size)
+        if needed <= directory_chunks:
+            break
+        directory_chunks = needed
+
+    blob = bytearray(directory)
+    for name, data in files:
+        blob += bytes(entries[name][0] * chunk_size - len(blob))
+        blob += data
+    return storage.encode(blob, packed=packed)
+
+class DNAContainer:
+    """
+    Reads a multi-file archive written by pack_container().
+
+    Example:
+        with DNAContainer.open('backup.dna2') as container:
+            report = container.extract('report.pdf')
+    """
+    def __init__(self, archive):
+        self.archive = archive
+        prefix = archive.read_range(0, DIRECTORY_PREFIX.size)
+        if len(prefix) < DIRECTORY_PREFIX.size:
+            raise ValueError("Not a multi-file container")
+        magic, length = DIRECTORY_PREFIX.unpack(prefix)
+        if magic != DIRECTORY_MAGIC:
+            raise ValueError("Not a multi-file container")
+        body = archive.read_range(DIRECTORY_PREFIX.size, length)
+        self.directory = {name: tuple(entry) for name, entry in json.loads(body.decode('utf-8')).items()}
+
+    @classmethod
+    def open(cls, path, **kwargs):
+        """Opens a text or .dna2 container (kwargs as in DNAArchive.open)."""
+        archive = DNAArchive.open(path, **kwargs)
+        try:
+            return cls(archive)
+        except Exception:
+            archive.close()
+            raise
+
+    def names(self):
+        return list(self.directory)
+
+    def __contains__(self, name):
+        return name in self.directory
+
+    def __len__(self):
+        return len(self.directory)
+
+    def extract(self, name):
+        """Decodes one file, checking it against the directory's CRC."""
+        first_chunk, length, crc = self.directory[name]
+        data = self.archive.read_range(first_chunk * self.archive.chunk_size, length)
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise DNAStorageError(f"Checksum mismatch in {name!r}", FailureType.CORRUPTION_DETECTED)
+        return data
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
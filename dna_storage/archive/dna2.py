@@ -0,0 +1,169 @@
+"""
+.dna2 on-disk format: DNA at 2 bits per base instead of one ASCII byte.
+
+Layout (all integers big-endian):
+
+    offset 0   4s  magic b'DNA2'
+           4   H   format version (1)
+           6   H   flags (bit 0: chunk offset table present)
+           8   Q   base count
+          16   Q   byte offset of the chunk offset table (0 if absent)
+          24   Q   number of table entries
+          32       body: base count bases, packed as in PackedDNA
+                   (A=00, T=01, C=10, G=11, MSB first, tail bits zero)
+    table_offset   table entries x Q: start base of every chunk, then the
+                   end of the last one
+
+The table sits after the body so a stream can be written in one pass and
+the table appended when the writer is closed. Readers mmap the file, so
+slicing the sequence only touches the pages it covers.
+"""
+import mmap
+import struct
+from ..packed_dna import PackedDNA, pack
+
+MAGIC = b'DNA2'
+VERSION = 1
+FLAG_OFFSET_TABLE = 0x1
+HEADER_STRUCT = struct.Struct('!4sHHQQQ')
+HEADER_SIZE = HEADER_STRUCT.size
+
+def is_dna2(path):
+    """True if the file at path starts with the .dna2 magic."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def write_dna2(path, dna_sequence, chunk_offsets=None):
+    """Writes a str or PackedDNA as a .dna2 file, with an optional chunk offset table."""
+    with open(path, 'wb') as f:
+        writer = Dna2Writer(f)
+        writer.write(dna_sequence)
+        writer.close(chunk_offsets)
+
+class Dna2Writer:
+    """
+    Incremental .dna2 writer over a seekable binary file. write() takes str
+    or PackedDNA pieces of any length; close() flushes the last partial
+    byte, appends the offset table and fills in the header. The file object
+    itself is left open.
+    """
+    def __init__(self, f):
+        self.f = f
+        self.base_count = 0
+        self._pending = ''
+        self._start = f.tell()
+        f.write(bytes(HEADER_SIZE))
+
+    def write(self, dna_sequence):
+        if isinstance(dna_sequence, PackedDNA) and not self._pending:
+            # Byte aligned already: copy the packed bytes, keep a partial last byte pending
+            whole = len(dna_sequence) - len(dna_sequence) % 4
+            self.f.write(memoryview(dna_sequence.tobytes())[:whole // 4])
+            self._pending = str(dna_sequence[whole:])
+            self.base_count += whole
+            return len(dna_sequence)
+        pending = self._pending + str(dna_sequence)
+        whole = len(pending) - len(pending) % 4
+        if whole:
+            self.f.write(pack(pending[:whole]))
+        self._pending = pending[whole:]
+        self.base_count += whole
+        return len(dna_sequence)
+
+    def close(self, chunk_offsets=None):
+        if self._pending:
+            self.f.write(pack(self._pending))
+            self.base_count += len(self._pending)
+            self._pending = ''
+        flags = table_offset = table_count = 0
+        if chunk_offsets is not None:
+            chunk_offsets = list(chunk_offsets)
+            flags |= FLAG_OFFSET_TABLE
+            table_offset = self.f.tell() - self._start
+            table_count = len(chunk_offsets)
+            self.f.write(struct.pack(f'!{table_count}Q', *chunk_offsets))
+        end = self.f.tell()
+        self.f.seek(self._start)
+        self.f.write(HEADER_STRUCT.pack(MAGIC, VERSION, flags, self.base_count, table_offset, table_count))
+        self.f.seek(end)
+
+class Dna2File:
+    """
+    Read-only, memory-mapped .dna2 file.
+
+    sequence() is a zero-copy PackedDNA over the mapped body, so it can go
+    straight to DNAStorage.decode() / decode_chunk(). reader() gives a
+    stream for StreamPipeline.decode_stream().
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a .dna2 file")
+        if len(self._mmap) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{path} is not a .dna2 file")
+        magic, version, self.flags, self.base_count, self._table_offset, self._table_count = \
+            HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a .dna2 file")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported .dna2 version {version}")
+        if HEADER_SIZE + (self.base_count + 3) // 4 > len(self._mmap):
+            self.close()
+            raise ValueError(f"{path} is truncated")
+        self._chunk_offsets = None
+
+    @property
+    def chunk_offsets(self):
+        """Tuple of chunk start bases (plus the end), or None if the file has no table."""
+        if not self.flags & FLAG_OFFSET_TABLE:
+            return None
+        if self._chunk_offsets is None:
+            self._chunk_offsets = struct.unpack_from(f'!{self._table_count}Q', self._mmap,
+                                                     self._table_offset)
+        return self._chunk_offsets
+
+    def sequence(self):
+        """The whole body as a PackedDNA backed by the mapping."""
+        body = memoryview(self._mmap)[HEADER_SIZE:]
+        return PackedDNA.from_buffer(body, self.base_count)
+
+    def reader(self):
+        """File-like object whose read(n) returns the next n bases as PackedDNA."""
+        return _PackedReader(self.sequence())
+
+    def __len__(self):
+        return self.base_count
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Sequences handed out still reference the mapping; it is
+            # released when the last of them goes away.
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class _PackedReader:
+    def __init__(self, sequence):
+        self._sequence = sequence
+        self._pos = 0
+
+    def read(self, size=-1):
+        end = len(self._sequence) if size is None or size < 0 else min(self._pos + size, len(self._sequence))
+        data = self._sequence[self._pos:end]
+        self._pos = end
+        return data
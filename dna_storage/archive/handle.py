@@ -0,0 +1,136 @@
+import mmap
+import os
+from ..file_ops import DNAStorage
+from .dna2 import Dna2File, is_dna2
+
+_WHITESPACE = b' \t\r\n'
+
+class _TextView:
+    """ACGT text file seen through an mmap: slicing returns str, trailing whitespace is ignored."""
+    def __init__(self, mapped):
+        self._mmap = mapped
+        end = len(mapped)
+        while end and mapped[end - 1] in _WHITESPACE:
+            end -= 1
+        self._length = end
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        start, stop, step = key.indices(self._length)
+        # latin-1 never fails, so stray bytes become invalid bases for the erasure logic
+        return self._mmap[start:stop:step].decode('latin-1')
+
+class DNAArchive:
+    """
+    Random-access handle on an encoded archive.
+
+    The header is parsed once when the handle is created, and chunk
+    positions come from AddressIndexer arithmetic. Reads only slice the
+    chunks they need. Files are memory-mapped, so read_chunk() and
+    read_range() touch only the pages those chunks occupy.
+
+    Example:
+        with DNAArchive.open('photo.dna2') as archive:
+            thumbnail = archive.read_range(0, 4096)
+    """
+    def __init__(self, dna_sequence, storage=None, cache_key=None):
+        """
+        dna_sequence: str, PackedDNA, or any sequence slicing to either.
+        cache_key: identifies the archive in storage.chunk_cache; defaults to
+        the PackedDNA's cache token, or to this handle for other sequences.
+        The sequence must not change while the archive is open.
+        """
+        self.storage = storage or DNAStorage()
+        self._sequence = dna_sequence
+        self._closers = []
+        self.cache_key = self.storage._archive_key(dna_sequence, cache_key)
+        if self.cache_key is None and self.storage.chunk_cache is not None:
+            self.cache_key = object()
+        self.header_end, self.metadata = self.storage._parse_header_and_configure(dna_sequence)
+        self.total_chunks = self.metadata.get('total_chunks', 0)
+        self.chunk_size = self.storage.chunk_size
+        self.indexer = self.storage._indexer()
+
+    @classmethod
+    def open(cls, path, backend='python', threads=0, chunk_cache=None):
+        """
+        Opens a text or .dna2 file (detected from the magic bytes).
+        chunk_cache: optional ChunkCache, shareable between archives; entries
+        are keyed by path, size and modification time.
+        """
+        storage = DNAStorage(backend=backend, threads=threads, chunk_cache=chunk_cache)
+        stat = os.stat(path)
+        cache_key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+        if is_dna2(path):
+            dna2 = Dna2File(path)
+            try:
+                archive = cls(dna2.sequence(), storage, cache_key)
+            except Exception:
+                dna2.close()
+                raise
+            archive._closers.extend([dna2.close, storage.close])
+            return archive
+
+        f = open(path, 'rb')
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            f.close()
+            raise ValueError(f"{path} is empty")
+        try:
+            archive = cls(_TextView(mapped), storage, cache_key)
+        except Exception:
+            mapped.close()
+            f.close()
+            raise
+        archive._closers.extend([mapped.close, f.close, storage.close])
+        return archive
+
+    def __len__(self):
+        return self.total_chunks
+
+    def read_chunk(self, chunk_index):
+        """Payload of one chunk."""
+        if chunk_index < 0 or chunk_index >= self.total_chunks:
+            raise IndexError("Chunk index out of bounds")
+        window = range(chunk_index, chunk_index + 1)
+        return self.storage._decode_chunks(self._sequence, self.indexer, self.header_end, window,
+                                           cache_key=self.cache_key)[0]
+
+    def read_range(self, byte_offset, length):
+        """
+        Bytes [byte_offset, byte_offset + length) of the original file,
+        shorter if the range runs past the end. Only the overlapping chunks
+        are decoded, several windows in parallel for long ranges.
+        """
+        return self.storage._decode_range(self._sequence, self.indexer, self.header_end, self.total_chunks,
+                                          byte_offset, length, cache_key=self.cache_key)
+
+    def _iter_chunks(self, chunk_indices):
+        batch_size = self.storage.batch_size
+        for first in range(chunk_indices.start, chunk_indices.stop, batch_size):
+            window = range(first, min(first + batch_size, chunk_indices.stop))
+            yield from self.storage._decode_chunks(self._sequence, self.indexer, self.header_end, window,
+                                                   cache_key=self.cache_key)
+
+    def __iter__(self):
+        """Yields chunk payloads in order, decoding batch_size chunks at a time."""
+        return self._iter_chunks(range(self.total_chunks))
+
+    def read(self):
+        """The whole original file."""
+        return b''.join(self)
+
+    def close(self):
+        self._sequence = None
+        for close in self._closers:
+            close()
+        self._closers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,104 @@
+import io
+from .handle import DNAArchive
+
+class DNAReader(io.RawIOBase):
+    """
+    Seekable binary file over an encoded archive, for consumers such as
+    tarfile or zipfile that want a file object rather than bytes.
+
+    Chunks are decoded lazily through the archive. Reads always fill the
+    buffer unless they hit EOF. Consecutive reads double the decoded window,
+    up to `readahead` chunks, so sequential scans are batched while random
+    reads decode only what they touch.
+    """
+    def __init__(self, archive, readahead=None):
+        super().__init__()
+        self.archive = archive
+        self.readahead = readahead or archive.storage.batch_size
+        self._pos = 0
+        self._size = None
+        self._owns_archive = False
+        # Decoded window: payload bytes starting at original offset _buf_start
+        self._buf_start = 0
+        self._buf = b''
+        self._window = 1
+
+    @classmethod
+    def open(cls, path, readahead=None, **kwargs):
+        """Opens path as a DNAArchive (kwargs as in DNAArchive.open) owned by the reader."""
+        reader = cls(DNAArchive.open(path, **kwargs), readahead)
+        reader._owns_archive = True
+        return reader
+
+    @property
+    def size(self):
+        """Length of the original file; only the last chunk is decoded to find it."""
+        if self._size is None:
+            last = self.archive.total_chunks - 1
+            self._size = 0 if last < 0 else last * self.archive.chunk_size + len(self.archive.read_chunk(last))
+        return self._size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._checkClosed()
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b):
+        self._checkClosed()
+        view = memoryview(b).cast('B')
+        filled = 0
+        while filled < len(view):
+            offset = self._pos - self._buf_start
+            if not 0 <= offset < len(self._buf):
+                if not self._fill(len(view) - filled):
+                    break
+                offset = self._pos - self._buf_start
+            n = min(len(view) - filled, len(self._buf) - offset)
+            view[filled:filled + n] = self._buf[offset:offset + n]
+            filled += n
+            self._pos += n
+        return filled
+
+    def _fill(self, wanted):
+        """Decodes the window of chunks starting at the current position; False at EOF."""
+        chunk_size = self.archive.chunk_size
+        first = self._pos // chunk_size
+        if first >= self.archive.total_chunks or (self._size is not None and self._pos >= self._size):
+            return False
+        # Picking up where the last window ended means a sequential scan: read further ahead
+        sequential = self._buf and self._buf_start + len(self._buf) == first * chunk_size
+        self._window = min(self._window * 2, self.readahead) if sequential else 1
+        count = max(self._window, -(-(self._pos % chunk_size + wanted) // chunk_size))
+        last = min(first + count, self.archive.total_chunks)
+        self._buf = b''.join(self.archive._iter_chunks(range(first, last)))
+        self._buf_start = first * chunk_size
+        if last == self.archive.total_chunks:
+            self._size = self._buf_start + len(self._buf)
+        return self._pos < self._buf_start + len(self._buf)
+
+    def close(self):
+        if not self.closed:
+            self._buf = b''
+            if self._owns_archive:
+                self.archive.close()
+        super().close()
@@ -0,0 +1,178 @@
+"""
+asyncio front end to StreamPipeline, for services that encode and decode
+on an event loop.
+
+Inputs are asyncio StreamReaders (or anything with an async read(n)) or
+async iterators of blocks. Outputs are StreamWriters (write() and drain())
+or anything with a write() that may return an awaitable. encode_iter and
+decode_iter yield the output blocks instead, for use as async iterators.
+
+Windows are encoded and decoded on an executor, so the event loop only
+moves data. The default is the loop's thread pool; the C++ batches release
+the GIL there. Pass a ProcessPoolExecutor for the Python backend. One
+executor can be shared by any number of concurrent pipelines. Cancelling
+the task cancels the windows it has queued.
+"""
+import asyncio
+import inspect
+from collections import Counter, deque
+from .file_ops import DNAStorage
+from .pipeline import (DEFAULT_MAX_SHIFT, _as_text, _configure_from_header, _decode_steps, _encode_window, _header_dna,
+                       _header_steps, _raise_if_lost, _run_in_worker)
+
+class _AsyncSource:
+    """read(size) over an async reader or an async iterator of blocks; short only at EOF."""
+    def __init__(self, source):
+        self._read = getattr(source, 'read', None)
+        self._blocks = None if self._read else source.__aiter__()
+        self._rest = None
+
+    async def _next_block(self, size):
+        if self._rest:
+            block, self._rest = self._rest, None
+            return block
+        if self._read:
+            return await self._read(size)
+        try:
+            return await self._blocks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def read(self, size):
+        pieces = []
+        while size > 0:
+            block = await self._next_block(size)
+            if not block:
+                break
+            if len(block) > size:
+                block, self._rest = block[:size], block[size:]
+            pieces.append(block)
+            size -= len(block)
+        if not pieces:
+            return b''
+        return pieces[0][:0].join(pieces)
+
+    async def read_text(self, size):
+        data = await self.read(size)
+        return _as_text(data)
+
+async def _write(writer, data):
+    result = writer.write(data)
+    if inspect.isawaitable(result):
+        await result
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+
+class AsyncStreamPipeline:
+    """
+    Streams files to and from DNA without blocking the event loop.
+
+    Example:
+        pipeline = AsyncStreamPipeline(DNAStorage(backend='cpp'), executor=shared_pool)
+        await pipeline.encode_stream(reader, writer, file_size)
+
+    window: chunks per executor job. At most max_in_flight jobs per
+    pipeline are queued at once. max_shift is as in StreamPipeline.
+    """
+    def __init__(self, storage, window=None, executor=None, max_in_flight=2, max_shift=DEFAULT_MAX_SHIFT):
+        self.storage = storage
+        self.window = window or storage.batch_size
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self.max_shift = max_shift
+        # resynced, repaired, lost (chunks) in the last decode
+        self.stats = Counter()
+
+    def _submit(self, config, func, *args):
+        # config has threads=1: windows already run in parallel on the executor
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, _run_in_worker, config, func, *args)
+
+    async def encode_iter(self, reader, file_size):
+        """Yields the archive as DNA text blocks; file_size is needed up front for the header."""
+        source = _AsyncSource(reader)
+        chunk_size = self.storage.chunk_size
+        yield _header_dna(self.storage, -(-file_size // chunk_size))
+        config = dict(self.storage._config(), threads=1)
+        in_flight = deque()
+        idx = 0
+        try:
+            while True:
+                data = await source.read(chunk_size * self.window)
+                if data:
+                    in_flight.append(self._submit(config, _encode_window, bytes(data), idx))
+                    idx += -(-len(data) // chunk_size)
+                if in_flight and (len(in_flight) >= self.max_in_flight or not data):
+                    dna, retries = await in_flight.popleft()
+                    self.storage.retry_histogram.update(retries)
+                    yield dna
+                if not data and not in_flight:
+                    break
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    async def encode_stream(self, reader, writer, file_size):
+        """Encodes reader into writer as ASCII DNA bytes."""
+        blocks = self.encode_iter(reader, file_size)
+        try:
+            async for dna in blocks:
+                await _write(writer, dna.encode('ascii'))
+        finally:
+            await blocks.aclose()
+
+    async def decode_iter(self, reader):
+        """
+        Yields the decoded bytes of a DNA text stream (bytes or str blocks),
+        one window at a time. Indels are resynchronized as in StreamPipeline.
+        Lost chunks are yielded as zeros, then DNAStorageError (MISSING_DATA)
+        is raised. The archive's coding setup goes to a storage of its own, so
+        self.storage can be shared by concurrent jobs.
+        """
+        source = _AsyncSource(reader)
+        header = _header_steps()
+        try:
+            request = header.send(None)
+            while True:
+                request = header.send(await source.read_text(request[1]))
+        except StopIteration as stop:
+            header_dna = stop.value
+        storage = DNAStorage(**self.storage._config())
+        total_chunks, chunk_len = _configure_from_header(storage, header_dna)
+
+        self.stats = Counter()
+        config = dict(storage._config(), threads=1)
+        steps = _decode_steps(total_chunks, chunk_len, storage.chunk_size, self.window,
+                              self.max_in_flight, self.max_shift, self.stats)
+        result = None
+        try:
+            while True:
+                try:
+                    request = steps.send(result)
+                except StopIteration as stop:
+                    lost = stop.value
+                    break
+                kind = request[0]
+                result = None
+                if kind == 'read':
+                    result = await source.read_text(request[1])
+                elif kind == 'submit':
+                    result = self._submit(config, *request[1:])
+                elif kind == 'result':
+                    result = await request[1]
+                else:
+                    yield request[1]
+        finally:
+            # Cancels whatever the decoder still has in flight
+            steps.close()
+        _raise_if_lost(lost)
+
+    async def decode_stream(self, reader, writer):
+        """Decodes a DNA stream from reader into writer."""
+        blocks = self.decode_iter(reader)
+        try:
+            async for data in blocks:
+                await _write(writer, data)
+        finally:
+            await blocks.aclose()
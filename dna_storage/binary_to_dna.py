@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 binary_to_dna = {
     '00': 'A',
     '01': 'T',
@@ -7,6 +13,100 @@ binary_to_dna = {
 
 dna_to_binary = {v: k for k, v in binary_to_dna.items()}
 
+# Bases ordered by their 2-bit value (A=00, T=01, C=10, G=11)
+BASES = 'ATCG'
+
+# Byte -> 4 bases, most significant bit pair first
+BYTE_TO_DNA = [
+    BASES[(b >> 6) & 3] + BASES[(b >> 4) & 3] + BASES[(b >> 2) & 3] + BASES[b & 3]
+    for b in range(256)
+]
+
+# Base -> base-4 digit. Anything else maps to 'x', which int(..., 4) rejects.
+_DNA_TO_DIGIT = bytes.maketrans(b'ATCG' + bytes(c for c in range(256) if c not in b'ATCG'),
+                                b'0123' + b'x' * 252)
+# Base -> 2-bit value. Anything else maps to 0xFF.
+_DNA_TO_CODE = bytes.maketrans(b'ATCG' + bytes(c for c in range(256) if c not in b'ATCG'),
+                               b'\x00\x01\x02\x03' + b'\xff' * 252)
+
+# Inputs at least this large go through NumPy when it is available
+NUMPY_MIN_SIZE = 1 << 16
+
+if NUMPY_AVAILABLE:
+    _BYTE_TO_DNA_ARRAY = np.frombuffer(''.join(BYTE_TO_DNA).encode('ascii'), dtype=np.uint8).reshape(256, 4)
+
+def _invalid_base_error(dna_sequence):
+    for base in dna_sequence:
+        if isinstance(base, int):
+            base = chr(base)
+        if base not in dna_to_binary:
+            return ValueError(f"Invalid DNA base '{base}' detected")
+    return ValueError("Invalid DNA sequence")
+
+def _as_ascii(dna_sequence):
+    if isinstance(dna_sequence, str):
+        try:
+            return dna_sequence.encode('ascii')
+        except UnicodeEncodeError:
+            raise _invalid_base_error(dna_sequence) from None
+    return bytes(dna_sequence)
+
+def bytes_to_dna(data):
+    """
+    Maps bytes directly to DNA (4 bases per byte) via a 256-entry table.
+    Equivalent to binary_to_dna_sequence(bytes_to_binary(data)).
+    """
+    if NUMPY_AVAILABLE and len(data) >= NUMPY_MIN_SIZE:
+        codes = np.frombuffer(data, dtype=np.uint8)
+        return _BYTE_TO_DNA_ARRAY[codes].tobytes().decode('ascii')
+    return ''.join([BYTE_TO_DNA[b] for b in data])
+
+def dna_to_bytes(dna_sequence):
+    """
+    Maps DNA (str or ASCII bytes) back to bytes, 4 bases per byte.
+    Equivalent to binary_to_bytes(dna_sequence_to_binary(dna_sequence)).
+    """
+    if len(dna_sequence) % 4 != 0:
+        raise ValueError("DNA length must be multiple of 4")
+    if not dna_sequence:
+        return b''
+
+    raw = _as_ascii(dna_sequence)
+    if NUMPY_AVAILABLE and len(raw) >= NUMPY_MIN_SIZE:
+        codes = np.frombuffer(raw.translate(_DNA_TO_CODE), dtype=np.uint8)
+        if (codes == 0xFF).any():
+            raise _invalid_base_error(dna_sequence)
+        codes = codes.reshape(-1, 4)
+        packed = (codes[:, 0] << 6) | (codes[:, 1] << 4) | (codes[:, 2] << 2) | codes[:, 3]
+        return packed.tobytes()
+
+    # Base 4 is a power of two, so int() parses it in linear time.
+    try:
+        value = int(raw.translate(_DNA_TO_DIGIT), 4)
+    except ValueError:
+        raise _invalid_base_error(dna_sequence) from None
+    return value.to_bytes(len(raw) // 4, byteorder='big')
+
+def bits_to_packed(binary_data):
+    """
+    Packs a '0101...' string into bytes (MSB first, zero padded).
+    Returns (packed_bytes, bit_length).
+    """
+    bit_length = len(binary_data)
+    if bit_length == 0:
+        return b'', 0
+    padding = -bit_length % 8
+    value = int(binary_data + '0' * padding, 2)
+    return value.to_bytes((bit_length + padding) // 8, byteorder='big'), bit_length
+
+def packed_to_bits(data, bit_length):
+    """Inverse of bits_to_packed: the first bit_length bits of data as a '0101...' string."""
+    if bit_length == 0:
+        return ''
+    num_bytes = (bit_length + 7) // 8
+    value = int.from_bytes(data[:num_bytes], byteorder='big')
+    return format(value, f'0{num_bytes * 8}b')[:bit_length]
+
 def bytes_to_binary(data):
     return ''.join(format(byte, '08b') for byte in data)
 
@@ -26,4 +126,4 @@ def dna_sequence_to_binary(dna_sequence):
 def binary_to_bytes(binary_data):
     if len(binary_data) % 8 != 0:
         raise ValueError("Binary data length must be multiple of 8")
-    return bytes(int(binary_data[i:i+8], 2) for i in range(0, len(binary_data), 8))
\ No newline at end of file
+    return bytes(int(binary_data[i:i+8], 2) for i in range(0, len(binary_data), 8))
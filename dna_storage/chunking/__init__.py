@@ -1,3 +1,4 @@
 from .chunker import ChunkManager
+from .cache import ChunkCache
 
-__all__ = ['ChunkManager']
+__all__ = ['ChunkManager', 'ChunkCache']
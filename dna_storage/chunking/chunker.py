@@ -1,26 +1,44 @@
 import struct
 import zlib
 import random
+from functools import lru_cache
 from ..failures import DNAStorageError, FailureType
 
+# Scramble masks are a pure function of (nonce, length); a packet's mask is
+# needed on pack, on every parse and once per retry of the nonce search.
+MASK_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def _scramble_mask(nonce, length):
+    """random.Random(nonce).randbytes(length) as a big-endian integer."""
+    return int.from_bytes(random.Random(nonce).randbytes(length), byteorder='big')
+
+def _xor(data, mask):
+    """XORs data with an integer mask of the same byte length in one operation."""
+    return (int.from_bytes(data, byteorder='big') ^ mask).to_bytes(len(data), byteorder='big')
+
 class ChunkManager:
     HEADER_FORMAT = "!IIII" # Index (4), Length (4), Checksum (4), Nonce (4)
     HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+    HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
     
     # Fixed mask to whiten header (break homopolymers in Index/Length)
     HEADER_MASK = b'd\x1d\x8c\xd9\x8f\x00\xb2\x04\xe9\x80\t\x98\xec\xf8B~'
+    _HEADER_MASK_INT = int.from_bytes(HEADER_MASK, byteorder='big')
+    # The mask split per header field, so fields are whitened as they are packed
+    _HEADER_MASK_WORDS = HEADER_STRUCT.unpack(HEADER_MASK)
 
     @staticmethod
     def _apply_scramble(data, nonce):
         if nonce == 0:
             return data
-        rng = random.Random(nonce)
-        mask = rng.randbytes(len(data))
-        return bytes(a ^ b for a, b in zip(data, mask))
+        return _xor(data, _scramble_mask(nonce, len(data)))
 
     @staticmethod
     def _apply_header_mask(header):
-        return bytes(a ^ b for a, b in zip(header, ChunkManager.HEADER_MASK))
+        if len(header) != ChunkManager.HEADER_SIZE:
+            return bytes(a ^ b for a, b in zip(header, ChunkManager.HEADER_MASK))
+        return _xor(header, ChunkManager._HEADER_MASK_INT)
 
     @staticmethod
     def pack_chunk(index, payload, actual_len, nonce=0):
@@ -31,12 +49,20 @@ class ChunkManager:
         """
         scrambled_payload = ChunkManager._apply_scramble(payload, nonce)
         checksum = zlib.crc32(scrambled_payload)
-        header = struct.pack(ChunkManager.HEADER_FORMAT, index, actual_len, checksum, nonce)
-        
-        # Whiten header
-        masked_header = ChunkManager._apply_header_mask(header)
-        
-        return masked_header + scrambled_payload
+        return ChunkManager._pack_header(index, actual_len, checksum, nonce) + scrambled_payload
+
+    @staticmethod
+    def _pack_header(index, actual_len, checksum, nonce):
+        """Packs and whitens a header in one step."""
+        m0, m1, m2, m3 = ChunkManager._HEADER_MASK_WORDS
+        return ChunkManager.HEADER_STRUCT.pack(index ^ m0, actual_len ^ m1, checksum ^ m2, nonce ^ m3)
+
+    @staticmethod
+    def _unpack_header(packet_bytes):
+        """Reads and un-whitens the header at the start of a packet."""
+        m0, m1, m2, m3 = ChunkManager._HEADER_MASK_WORDS
+        index, length, checksum, nonce = ChunkManager.HEADER_STRUCT.unpack_from(packet_bytes)
+        return index ^ m0, length ^ m1, checksum ^ m2, nonce ^ m3
 
     @staticmethod
     def unpack_chunk_components(packet_bytes):
@@ -47,39 +73,53 @@ class ChunkManager:
         if len(packet_bytes) < ChunkManager.HEADER_SIZE:
              raise ValueError("Packet too small")
              
-        masked_header = packet_bytes[:ChunkManager.HEADER_SIZE]
-        header_bytes = ChunkManager._apply_header_mask(masked_header)
-        
-        index, length, checksum, nonce = struct.unpack(ChunkManager.HEADER_FORMAT, header_bytes)
+        index, length, checksum, nonce = ChunkManager._unpack_header(packet_bytes)
         payload = packet_bytes[ChunkManager.HEADER_SIZE:]
         
         unscrambled = ChunkManager._apply_scramble(payload, nonce)
         return index, unscrambled, length, nonce
 
     @staticmethod
-    def chunk_data(data, chunk_size=128):
+    def iter_payloads(data, chunk_size=128):
+        """
+        Yields memoryviews of chunk_size bytes into data (any bytes-like
+        object) without copying; the last one may be shorter.
+        """
+        view = memoryview(data).cast('B')
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+
+    @staticmethod
+    def iter_chunks(data, chunk_size=128, start_index=0):
+        """
+        Yields the same packets as chunk_data, one at a time.
+        Each packet is assembled in a single reused buffer: the payload is
+        copied from a memoryview of data, the tail padded in place and the
+        header written with HEADER_STRUCT.pack_into, so the only allocation
+        per packet is the returned bytes.
+        """
+        header_size = ChunkManager.HEADER_SIZE
+        buffer = bytearray(header_size + chunk_size)
+        payload_view = memoryview(buffer)[header_size:]
+        m0, m1, m2, m3 = ChunkManager._HEADER_MASK_WORDS
+
+        for i, payload in enumerate(ChunkManager.iter_payloads(data, chunk_size), start_index):
+            actual_len = len(payload)
+            payload_view[:actual_len] = payload
+            if actual_len < chunk_size:
+                payload_view[actual_len:] = bytes(chunk_size - actual_len)
+            checksum = zlib.crc32(payload_view)
+            ChunkManager.HEADER_STRUCT.pack_into(buffer, 0, i ^ m0, actual_len ^ m1, checksum ^ m2, m3)
+            yield bytes(buffer)
+
+    @staticmethod
+    def chunk_data(data, chunk_size=128, start_index=0):
         """
         Splits data into packets.
         Each packet is: [Index][Length][Checksum][Nonce][Data + Padding]
+        start_index: Index of the first packet (for windows of a larger stream).
         """
-        chunks = []
-        total_len = len(data)
-        
-        for i, offset in enumerate(range(0, total_len, chunk_size)):
-            chunk_data = data[offset:offset + chunk_size]
-            actual_len = len(chunk_data)
-            
-            # Pad if necessary
-            if actual_len < chunk_size:
-                padding = b'\x00' * (chunk_size - actual_len)
-                payload = chunk_data + padding
-            else:
-                payload = chunk_data
-                
-            packet = ChunkManager.pack_chunk(i, payload, actual_len, nonce=0)
-            chunks.append(packet)
-            
-        return chunks
+        return list(ChunkManager.iter_chunks(data, chunk_size, start_index))
 
     @staticmethod
     def parse_chunk(packet_bytes):
@@ -90,10 +130,7 @@ class ChunkManager:
         if len(packet_bytes) < ChunkManager.HEADER_SIZE:
              raise ValueError("Packet too small")
              
-        masked_header = packet_bytes[:ChunkManager.HEADER_SIZE]
-        header_bytes = ChunkManager._apply_header_mask(masked_header)
-        
-        index, length, checksum, nonce = struct.unpack(ChunkManager.HEADER_FORMAT, header_bytes)
+        index, length, checksum, nonce = ChunkManager._unpack_header(packet_bytes)
         
         payload = packet_bytes[ChunkManager.HEADER_SIZE:]
         
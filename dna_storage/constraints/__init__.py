@@ -1,3 +1,3 @@
-from .validator import ConstraintValidator
+from .validator import ConstraintValidator, ConstraintChecker
 
-__all__ = ['ConstraintValidator']
+__all__ = ['ConstraintValidator', 'ConstraintChecker']
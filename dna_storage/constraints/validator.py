@@ -1,3 +1,5 @@
+import re
+
 class ConstraintValidator:
     @staticmethod
     def validate_gc_content(dna_sequence, min_gc=0.4, max_gc=0.6):
@@ -26,3 +28,37 @@ class ConstraintValidator:
             else:
                 current_run = 1
         return True
+
+
+class ConstraintChecker:
+    """
+    Constraint check compiled once from a DNAStorage constraints dict.
+
+    Same rules as DNAStorage: GC content is checked when 'min_gc' is given
+    (max_gc defaults to 0.6), homopolymers when 'max_homopolymer' is given
+    (default 3). Checks stop at the first violation: the homopolymer scan
+    is one regex search, so it ends at the first over-long run.
+    """
+    def __init__(self, constraints=None):
+        constraints = constraints or {}
+        self.check_gc = 'min_gc' in constraints
+        self.min_gc = constraints.get('min_gc')
+        self.max_gc = constraints.get('max_gc', 0.6)
+
+        self.homopolymer = None
+        if 'max_homopolymer' in constraints:
+            run = constraints.get('max_homopolymer', 3) + 1
+            self.homopolymer = re.compile('|'.join(base * run for base in 'ACGT'))
+
+    def first_violation(self, dna_sequence):
+        """Returns 'homopolymer', 'gc' or None."""
+        if not dna_sequence:
+            return None
+        if self.homopolymer is not None and self.homopolymer.search(dna_sequence):
+            return 'homopolymer'
+        if self.check_gc and not ConstraintValidator.validate_gc_content(dna_sequence, self.min_gc, self.max_gc):
+            return 'gc'
+        return None
+
+    def __call__(self, dna_sequence):
+        return self.first_violation(dna_sequence) is None
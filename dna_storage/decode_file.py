@@ -2,22 +2,32 @@ import argparse
 import sys
 from dna_storage.file_ops import DNAStorage
 from dna_storage.pipeline import StreamPipeline
+from dna_storage.archive import Dna2File, is_dna2
 
 def main():
     parser = argparse.ArgumentParser(description='Decode DNA sequence to file')
-    parser.add_argument('dna_file', help='File containing DNA sequence')
+    parser.add_argument('dna_file', help='File containing DNA sequence (text or .dna2, detected automatically)')
     parser.add_argument('output', help='Output file path')
     parser.add_argument('-e', '--ecc', choices=['rs', 'hamming'], default='rs', help='Error correction method (overridden by header)')
     parser.add_argument('--backend', choices=['python', 'cpp'], default='python', help='Processing backend')
     parser.add_argument('--stream', action='store_true', help='Use streaming mode')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for streaming mode')
     
     args = parser.parse_args()
 
     storage = DNAStorage(ecc_method=args.ecc, backend=args.backend)
 
-    if args.stream:
+    if is_dna2(args.dna_file):
+        # Chunks are sliced from the mapped 2-bit body; the file is never expanded to text
+        with Dna2File(args.dna_file) as archive, open(args.output, 'wb') as f_out:
+            if args.stream:
+                StreamPipeline(storage, workers=args.workers).decode_stream(archive.reader(), f_out)
+            else:
+                f_out.write(storage.decode(archive.sequence()))
+        print(f"Decoded to {args.output}")
+    elif args.stream:
         with open(args.dna_file, 'r') as f_in, open(args.output, 'wb') as f_out:
-            pipeline = StreamPipeline(storage)
+            pipeline = StreamPipeline(storage, workers=args.workers)
             pipeline.decode_stream(f_in, f_out)
             print(f"Decoded stream to {args.output}")
     else:
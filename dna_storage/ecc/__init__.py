@@ -1,6 +1,23 @@
-import reedsolo
 import math
 from .hamming import hamming_encode as h_encode, hamming_decode as h_decode
+from .hamming import hamming_encode_bytes as h_encode_bytes, hamming_decode_bytes as h_decode_bytes
+from .hamming import vectorized as h_vec
+from .reed_solomon import RS_BLOCK_SIZE, ReedSolomonError, get_codec
+from .reed_solomon import vectorized as rs_vec
+
+if h_vec.NUMPY_AVAILABLE or rs_vec.NUMPY_AVAILABLE:
+    import numpy as np
+
+def _bits(bits_str):
+    """'0101...' -> bit values (NumPy array when available); ValueError on other characters."""
+    if h_vec.NUMPY_AVAILABLE:
+        bits = np.frombuffer(bits_str.encode('ascii'), dtype=np.uint8) - ord('0')
+        if (bits > 1).any():
+            raise ValueError("Bit string may only contain '0' and '1'")
+        return bits
+    if bits_str.strip('01'):
+        raise ValueError("Bit string may only contain '0' and '1'")
+    return [int(c) for c in bits_str]
 
 class ECC:
     @staticmethod
@@ -10,8 +27,10 @@ class ECC:
         Input: Binary string '0101...'
         Output: Encoded binary string '0101...'
         """
-        # Convert string '01' to list [0, 1]
-        bits = [int(c) for c in data_bits_str]
+        bits = _bits(data_bits_str)
+        if h_vec.NUMPY_AVAILABLE:
+            return (h_vec.encode_bits(bits) + ord('0')).tobytes().decode('ascii')
+
         encoded_bits = h_encode(bits)
         # Convert list [0, 1] back to string '01'
         return ''.join(str(b) for b in encoded_bits)
@@ -23,25 +42,142 @@ class ECC:
         Input: Binary string '0101...'
         Output: Decoded binary string '0101...'
         """
-        bits = [int(c) for c in encoded_bits_str]
+        bits = _bits(encoded_bits_str)
+        if h_vec.NUMPY_AVAILABLE:
+            decoded_bits, corrected = h_vec.decode_bits(bits)
+            return (decoded_bits + ord('0')).tobytes().decode('ascii')
+
         decoded_bits, corrected = h_decode(bits)
         return ''.join(str(b) for b in decoded_bits)
 
+    @staticmethod
+    def hamming_encode_packed(data_bytes):
+        """
+        Hamming(7,4) on bytes, without the bit-string round trip.
+        Input: bytes
+        Output: (packed codeword bytes, bit_length)
+        """
+        if h_vec.NUMPY_AVAILABLE:
+            packets = np.frombuffer(data_bytes, dtype=np.uint8)[np.newaxis, :]
+            packed, bit_length = h_vec.encode_packets(packets)
+            return packed[0].tobytes(), bit_length
+        return h_encode_bytes(data_bytes)
+
+    @staticmethod
+    def hamming_decode_packed(packed_bytes, bit_length):
+        """
+        Inverse of hamming_encode_packed.
+        Input: packed codeword bytes and their bit length
+        Output: decoded bytes
+        """
+        if h_vec.NUMPY_AVAILABLE:
+            packed = np.frombuffer(packed_bytes, dtype=np.uint8)[np.newaxis, :]
+            decoded, corrected = h_vec.decode_packets(packed, bit_length)
+            return decoded[0].tobytes()
+        decoded, corrected = h_decode_bytes(packed_bytes, bit_length)
+        return decoded
+
+    @staticmethod
+    def hamming_encode_batch(packets):
+        """
+        Encodes many equal-length packets at once.
+        Input: list of bytes
+        Output: (list of packed codeword bytes, bit_length per packet)
+        """
+        if not packets:
+            return [], 0
+        if h_vec.NUMPY_AVAILABLE:
+            matrix = np.frombuffer(b''.join(packets), dtype=np.uint8).reshape(len(packets), -1)
+            packed, bit_length = h_vec.encode_packets(matrix)
+            return [row.tobytes() for row in packed], bit_length
+        encoded = [h_encode_bytes(p) for p in packets]
+        return [e for e, _ in encoded], encoded[0][1]
+
+    @staticmethod
+    def hamming_decode_batch(packed_list, bit_length):
+        """
+        Decodes many packets of the same bit length.
+        Output: (list of decoded bytes, list of corrected-block counts per packet)
+        """
+        if not packed_list:
+            return [], []
+        if h_vec.NUMPY_AVAILABLE:
+            matrix = np.frombuffer(b''.join(packed_list), dtype=np.uint8).reshape(len(packed_list), -1)
+            decoded, corrected = h_vec.decode_packets(matrix, bit_length)
+            return [row.tobytes() for row in decoded], corrected.sum(axis=-1).tolist()
+        results = [h_decode_bytes(p, bit_length) for p in packed_list]
+        return [d for d, _ in results], [c for _, c in results]
+
     @staticmethod
     def rs_encode(data_bytes, nsym=10):
-        rs = reedsolo.RSCodec(nsym)
-        return rs.encode(data_bytes)
+        return get_codec(nsym).encode(data_bytes)
+
+    @staticmethod
+    def rs_decode(encoded_bytes, nsym=10, erase_pos=None):
+        """
+        erase_pos: known-bad byte positions in encoded_bytes. Each erasure
+        costs one parity symbol instead of the two an unknown error needs.
+        """
+        return get_codec(nsym).decode(encoded_bytes, erase_pos=erase_pos or None)[0]
+
+    @staticmethod
+    def rs_encode_batch(packets, nsym=10):
+        """
+        RS-encodes many equal-length packets at once.
+        Input: list of bytes
+        Output: list of encoded bytes, identical to rs_encode per packet
+        """
+        if not packets:
+            return []
+        if rs_vec.NUMPY_AVAILABLE:
+            matrix = np.frombuffer(b''.join(packets), dtype=np.uint8).reshape(len(packets), -1)
+            return [row.tobytes() for row in rs_vec.encode_packets(matrix, nsym)]
+        codec = get_codec(nsym)
+        return [bytes(codec.encode(p)) for p in packets]
 
     @staticmethod
-    def rs_decode(encoded_bytes, nsym=10):
-        rs = reedsolo.RSCodec(nsym)
-        return rs.decode(encoded_bytes)[0]
+    def rs_decode_batch(encoded_list, nsym=10, erase_pos=None, skip_errors=False):
+        """
+        Decodes many equal-length RS packets.
+        Packets whose parity already checks out are sliced directly; only
+        the rest go through the reedsolo decoder.
+        erase_pos: optional list with the erased byte positions of each packet
+        skip_errors: return None for uncorrectable packets instead of raising
+        Output: list of decoded bytes
+        """
+        if not encoded_list:
+            return []
+        codec = get_codec(nsym)
+        erase_pos = erase_pos or [None] * len(encoded_list)
+
+        def decode_one(encoded, ep):
+            try:
+                return bytes(codec.decode(encoded, erase_pos=ep or None)[0])
+            except ReedSolomonError:
+                if skip_errors:
+                    return None
+                raise
+
+        if not rs_vec.NUMPY_AVAILABLE or len({len(e) for e in encoded_list}) != 1:
+            return [decode_one(e, ep) for e, ep in zip(encoded_list, erase_pos)]
+
+        matrix = np.frombuffer(b''.join(encoded_list), dtype=np.uint8).reshape(len(encoded_list), -1)
+        clean = rs_vec.check_packets(matrix, nsym)
+        # Data columns of every block, in order
+        keep = np.ones(matrix.shape[1], dtype=bool)
+        for start in range(0, matrix.shape[1], RS_BLOCK_SIZE):
+            keep[min(start + RS_BLOCK_SIZE, matrix.shape[1]) - nsym:start + RS_BLOCK_SIZE] = False
+        return [
+            matrix[i, keep].tobytes() if ok else decode_one(encoded_list[i], erase_pos[i])
+            for i, ok in enumerate(clean.tolist())
+        ]
 
     @staticmethod
     def calculate_encoded_length(data_bytes_len, method, params):
         if method == 'rs':
             nsym = params.get('nsym', 10)
-            return data_bytes_len + nsym
+            blocks = math.ceil(data_bytes_len / (RS_BLOCK_SIZE - nsym))
+            return data_bytes_len + blocks * nsym
         elif method == 'hamming':
             # Input bits
             bits = data_bytes_len * 8
@@ -1,3 +1,3 @@
-from .hamming import hamming_encode, hamming_decode
+from .hamming import hamming_encode, hamming_decode, hamming_encode_bytes, hamming_decode_bytes
 
-__all__ = ['hamming_encode', 'hamming_decode']
+__all__ = ['hamming_encode', 'hamming_decode', 'hamming_encode_bytes', 'hamming_decode_bytes']
@@ -114,3 +114,80 @@ def hamming_decode(bits: List[int]) -> Tuple[List[int], bool]:
             any_corrected = True
             
     return decoded, any_corrected
+
+def _codeword_to_int(bits: List[int]) -> int:
+    value = 0
+    for b in bits:
+        value = (value << 1) | b
+    return value
+
+def _build_byte_tables() -> Tuple[List[int], List[int]]:
+    """
+    Byte-level tables built from the block functions above.
+    ENCODE: byte -> 14-bit value (high nibble codeword, then low nibble codeword).
+    DECODE: 14-bit value -> decoded byte | (corrected blocks << 8).
+    """
+    nibble_codes = [_codeword_to_int(hamming_encode_block([(n >> 3) & 1, (n >> 2) & 1, (n >> 1) & 1, n & 1]))
+                    for n in range(16)]
+    encode = [(nibble_codes[b >> 4] << 7) | nibble_codes[b & 0xF] for b in range(256)]
+
+    # 128-entry syndrome table: 7-bit codeword -> nibble | (corrected << 4)
+    block = []
+    for v in range(128):
+        data, corrected = hamming_decode_block([(v >> (6 - i)) & 1 for i in range(7)])
+        block.append(_codeword_to_int(data) | (int(corrected) << 4))
+
+    decode = []
+    for v in range(1 << 14):
+        hi, lo = block[v >> 7], block[v & 0x7F]
+        decode.append((((hi & 0xF) << 4) | (lo & 0xF)) | (((hi >> 4) + (lo >> 4)) << 8))
+    return encode, decode
+
+_BYTE_ENCODE_TABLE, _BYTE_DECODE_TABLE = _build_byte_tables()
+
+def hamming_encode_bytes(data: bytes) -> Tuple[bytes, int]:
+    """
+    Encodes bytes with Hamming(7,4), packing the codewords MSB first.
+    Same bit layout as hamming_encode on the byte's bits (14 bits per byte).
+
+    Returns:
+        (packed_codewords, bit_length)
+    """
+    table = _BYTE_ENCODE_TABLE
+    # 4 bytes -> 56 bits -> exactly 7 output bytes
+    padded = bytes(data) + b'\x00' * (-len(data) % 4)
+    out = []
+    for i in range(0, len(padded), 4):
+        value = (table[padded[i]] << 42) | (table[padded[i + 1]] << 28) | \
+                (table[padded[i + 2]] << 14) | table[padded[i + 3]]
+        out.append(value.to_bytes(7, byteorder='big'))
+
+    bit_length = len(data) * 14
+    return b''.join(out)[:(bit_length + 7) // 8], bit_length
+
+def hamming_decode_bytes(packed: bytes, bit_length: int) -> Tuple[bytes, int]:
+    """
+    Decodes packed Hamming(7,4) codewords back to bytes.
+
+    Returns:
+        (decoded_bytes, corrected_blocks)
+    """
+    if bit_length % 14 != 0:
+        raise ValueError("Input length must be a multiple of 14 bits (one byte per two blocks)")
+
+    num_bytes = bit_length // 14
+    table = _BYTE_DECODE_TABLE
+    padded = bytes(packed[:(bit_length + 7) // 8])
+    padded += b'\x00' * (-len(padded) % 7)
+
+    out = bytearray()
+    corrected = 0
+    for i in range(0, len(padded), 7):
+        value = int.from_bytes(padded[i:i + 7], byteorder='big')
+        for shift in (42, 28, 14, 0):
+            entry = table[(value >> shift) & 0x3FFF]
+            out.append(entry & 0xFF)
+            corrected += entry >> 8
+
+    # Padding codewords are all-zero and never count as corrected
+    return bytes(out[:num_bytes]), corrected
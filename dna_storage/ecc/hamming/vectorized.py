@@ -0,0 +1,85 @@
+"""
+NumPy Hamming(7,4) codec working on whole packets (or batches of packets).
+
+Same codeword layout as hamming.py (p1 p2 d1 p3 d2 d3 d4). Encoding is a
+16-entry codeword gather per nibble, decoding a 128-entry syndrome table
+lookup per 7-bit block.
+"""
+from .hamming import hamming_encode_block, hamming_decode_block
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if NUMPY_AVAILABLE:
+    # nibble -> 7 codeword bits
+    CODEWORDS = np.array(
+        [hamming_encode_block([(n >> 3) & 1, (n >> 2) & 1, (n >> 1) & 1, n & 1]) for n in range(16)],
+        dtype=np.uint8
+    )
+
+    # 7-bit received word -> 4 corrected data bits, and whether a bit was flipped
+    _decoded = [hamming_decode_block([(v >> (6 - i)) & 1 for i in range(7)]) for v in range(128)]
+    SYNDROME_DATA = np.array([d for d, _ in _decoded], dtype=np.uint8)
+    SYNDROME_CORRECTED = np.array([c for _, c in _decoded], dtype=bool)
+    del _decoded
+
+    _NIBBLE_WEIGHTS = np.array([8, 4, 2, 1], dtype=np.uint8)
+    _BLOCK_WEIGHTS = np.array([64, 32, 16, 8, 4, 2, 1], dtype=np.uint8)
+
+def encode_bits(bits):
+    """
+    Encodes a 0/1 uint8 array (last axis = bit stream), padding to a multiple of 4.
+    Returns the codeword bits with the same leading shape.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    padding = -bits.shape[-1] % 4
+    if padding:
+        pad_width = [(0, 0)] * (bits.ndim - 1) + [(0, padding)]
+        bits = np.pad(bits, pad_width)
+    nibbles = bits.reshape(bits.shape[:-1] + (-1, 4)) @ _NIBBLE_WEIGHTS
+    return CODEWORDS[nibbles].reshape(bits.shape[:-1] + (-1,))
+
+def decode_bits(bits):
+    """
+    Decodes codeword bits (last axis a multiple of 7).
+
+    Returns:
+        (data_bits, corrected) where corrected flags each 7-bit block that
+        had a bit flipped.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    if bits.shape[-1] % 7 != 0:
+        raise ValueError("Input length must be multiple of 7 for Hamming(7,4)")
+    words = bits.reshape(bits.shape[:-1] + (-1, 7)) @ _BLOCK_WEIGHTS
+    data = SYNDROME_DATA[words].reshape(bits.shape[:-1] + (-1,))
+    return data, SYNDROME_CORRECTED[words]
+
+def encode_packets(packets):
+    """
+    Encodes a (num_packets, packet_len) uint8 array of bytes.
+
+    Returns:
+        (packed codewords, shape (num_packets, ceil(14 * packet_len / 8)), bit_length)
+    """
+    packets = np.asarray(packets, dtype=np.uint8)
+    bits = np.unpackbits(packets, axis=-1)
+    encoded = encode_bits(bits)
+    return np.packbits(encoded, axis=-1), encoded.shape[-1]
+
+def decode_packets(packed, bit_length):
+    """
+    Decodes a (num_packets, num_bytes) array of packed codewords.
+
+    Returns:
+        (decoded bytes, shape (num_packets, bit_length // 14),
+         corrected, shape (num_packets, bit_length // 7))
+    """
+    if bit_length % 14 != 0:
+        raise ValueError("Input length must be a multiple of 14 bits (one byte per two blocks)")
+    packed = np.asarray(packed, dtype=np.uint8)
+    bits = np.unpackbits(packed, axis=-1)[..., :bit_length]
+    data_bits, corrected = decode_bits(bits)
+    return np.packbits(data_bits, axis=-1), corrected
@@ -0,0 +1,3 @@
+from .codec import RS_BLOCK_SIZE, ReedSolomonError, get_codec, block_layout
+
+__all__ = ['RS_BLOCK_SIZE', 'ReedSolomonError', 'get_codec', 'block_layout']
@@ -0,0 +1,32 @@
+import threading
+import reedsolo
+from reedsolo import ReedSolomonError
+
+# reedsolo splits messages into blocks of RS_BLOCK_SIZE bytes (data + parity)
+RS_BLOCK_SIZE = 255
+
+_codecs = {}
+_codecs_lock = threading.Lock()
+
+def get_codec(nsym):
+    """
+    Returns the shared reedsolo.RSCodec for nsym, building it on first use.
+    Building a codec recomputes the GF tables and generator polynomial, so
+    per-chunk callers should always go through here.
+    """
+    codec = _codecs.get(nsym)
+    if codec is None:
+        with _codecs_lock:
+            codec = _codecs.get(nsym)
+            if codec is None:
+                codec = reedsolo.RSCodec(nsym)
+                _codecs[nsym] = codec
+    return codec
+
+def block_layout(data_len, nsym):
+    """
+    Splits a message length the way reedsolo does.
+    Returns a list of (data_offset, data_len) per RS block.
+    """
+    step = RS_BLOCK_SIZE - nsym
+    return [(start, min(step, data_len - start)) for start in range(0, data_len, step)]
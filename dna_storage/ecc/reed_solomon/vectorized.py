@@ -0,0 +1,78 @@
+"""
+NumPy Reed-Solomon parity for many equal-length packets at once.
+
+Uses the same field, generator polynomial and 255-byte block split as the
+shared reedsolo codec, so the output is byte-identical to RSCodec.encode.
+Parity is computed with an LFSR over all packets in parallel: one step per
+data byte, each step a row gather from a (256, nsym) product table.
+"""
+from .codec import RS_BLOCK_SIZE, get_codec, block_layout
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_product_tables = {}
+
+def _product_table(nsym):
+    """feedback byte -> feedback * generator coefficients (without the leading 1)."""
+    table = _product_tables.get(nsym)
+    if table is None:
+        codec = get_codec(nsym)
+        gf_exp = np.array(codec.gf_exp, dtype=np.int32)
+        gf_log = np.array(codec.gf_log, dtype=np.int32)
+        gen = np.array(codec.gen[nsym][1:], dtype=np.int32)
+
+        table = np.zeros((256, nsym), dtype=np.uint8)
+        for j, g in enumerate(gen):
+            if g:
+                table[1:, j] = gf_exp[gf_log[1:256] + gf_log[g]]
+        _product_tables[nsym] = table
+    return table
+
+def parity(data, nsym):
+    """
+    Parity bytes of one RS block for each row of a (num_packets, k) uint8
+    array, k <= 255 - nsym. Returns a (num_packets, nsym) array.
+    """
+    table = _product_table(nsym)
+    data = np.asarray(data, dtype=np.uint8)
+    reg = np.zeros((data.shape[0], nsym), dtype=np.uint8)
+    for i in range(data.shape[1]):
+        feedback = data[:, i] ^ reg[:, 0]
+        reg[:, :-1] = reg[:, 1:]
+        reg[:, -1] = 0
+        reg ^= table[feedback]
+    return reg
+
+def encode_packets(packets, nsym):
+    """
+    RS-encodes a (num_packets, packet_len) uint8 array.
+    Returns a (num_packets, encoded_len) array matching RSCodec(nsym).encode per row.
+    """
+    packets = np.asarray(packets, dtype=np.uint8)
+    out = []
+    for start, length in block_layout(packets.shape[1], nsym):
+        block = packets[:, start:start + length]
+        out.append(block)
+        out.append(parity(block, nsym))
+    if not out:
+        return np.zeros((packets.shape[0], 0), dtype=np.uint8)
+    return np.concatenate(out, axis=1)
+
+def check_packets(encoded, nsym):
+    """
+    Flags rows of a (num_packets, encoded_len) array whose every block is a
+    valid codeword, i.e. rows that decode without any correction.
+    """
+    encoded = np.asarray(encoded, dtype=np.uint8)
+    clean = np.ones(encoded.shape[0], dtype=bool)
+    for start in range(0, encoded.shape[1], RS_BLOCK_SIZE):
+        block = encoded[:, start:start + RS_BLOCK_SIZE]
+        if block.shape[1] <= nsym:
+            clean[:] = False
+            break
+        clean &= (parity(block[:, :-nsym], nsym) == block[:, -nsym:]).all(axis=1)
+    return clean
@@ -2,6 +2,7 @@ import argparse
 import sys
 from dna_storage.file_ops import DNAStorage
 from dna_storage.pipeline import StreamPipeline
+from dna_storage.archive import Dna2Writer, write_dna2
 
 def main():
     parser = argparse.ArgumentParser(description='Encode file to DNA sequence')
@@ -11,9 +12,16 @@ def main():
     parser.add_argument('--backend', choices=['python', 'cpp'], default='python', help='Processing backend')
     parser.add_argument('--chunk-size', type=int, default=128, help='Chunk size in bytes')
     parser.add_argument('--stream', action='store_true', help='Use streaming mode')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for streaming mode')
+    parser.add_argument('--format', choices=['text', 'dna2'], default='text',
+                        help='Output format: ACGT text or packed .dna2 (2 bits per base)')
     
     args = parser.parse_args()
 
+    if args.format == 'dna2' and not args.output:
+        print("Error: dna2 format requires an output file.")
+        sys.exit(1)
+
     storage = DNAStorage(ecc_method=args.ecc, chunk_size=args.chunk_size, backend=args.backend)
 
     if args.stream:
@@ -21,16 +29,29 @@ def main():
             print("Error: Streaming mode requires an output file.")
             sys.exit(1)
             
-        with open(args.input, 'rb') as f_in, open(args.output, 'w') as f_out:
-            pipeline = StreamPipeline(storage)
+        mode = 'wb' if args.format == 'dna2' else 'w'
+        with open(args.input, 'rb') as f_in, open(args.output, mode) as f_out:
+            pipeline = StreamPipeline(storage, workers=args.workers)
             # File size needed for streaming header?
             # Pipeline can deduce from seek/tell if file-like.
-            pipeline.encode_stream(f_in, f_out)
+            if args.format == 'dna2':
+                # Streamed .dna2 files carry no offset table; readers use the header instead
+                writer = Dna2Writer(f_out)
+                pipeline.encode_stream(f_in, writer)
+                writer.close()
+            else:
+                pipeline.encode_stream(f_in, f_out)
             print(f"Encoded stream to {args.output}")
     else:
         with open(args.input, 'rb') as f:
             data = f.read()
         
+        if args.format == 'dna2':
+            dna = storage.encode(data, packed=True)
+            write_dna2(args.output, dna, storage.chunk_offsets(dna))
+            print(f"Encoded to {args.output}")
+            return
+
         dna = storage.encode(data)
         
         if args.output:
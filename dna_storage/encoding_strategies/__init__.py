@@ -1,9 +1,12 @@
+from .base import EncodingStrategy, PackedEncodingStrategy
 from .baseline import BaselineStrategy
 from .rotating import RotatingStrategy
+from .block_rotating import BlockRotatingStrategy
 
 STRATEGIES = {
     'baseline': BaselineStrategy,
-    'rotating': RotatingStrategy
+    'rotating': RotatingStrategy,
+    'rotating_block': BlockRotatingStrategy
 }
 
 def get_strategy(name):
@@ -1,3 +1,5 @@
+import math
+
 class EncodingStrategy:
     def encode(self, binary_data: str) -> str:
         raise NotImplementedError
@@ -5,3 +7,26 @@ class EncodingStrategy:
         raise NotImplementedError
     def bits_per_base(self) -> float:
         raise NotImplementedError
+    def encoded_length(self, bit_length: int) -> int:
+        """Number of bases produced for bit_length bits."""
+        return math.ceil(bit_length / self.bits_per_base())
+    def bit_span(self, base_index: int, bit_length: int):
+        """
+        (first_bit, end_bit) of the decoded bits that a wrong base at
+        base_index can change, or None when an error can spread over the
+        whole packet. Used to turn known-bad bases into RS erasures.
+        """
+        return None
+
+class PackedEncodingStrategy(EncodingStrategy):
+    """
+    Strategy that also works on packed bits instead of '0101...' strings.
+
+    Bits are stored MSB first in `data`; `bit_length` gives how many of them
+    are used (unused bits in the last byte are zero). DNAStorage prefers this
+    interface when a strategy implements it.
+    """
+    def encode_packed(self, data: bytes, bit_length: int) -> str:
+        raise NotImplementedError
+    def decode_packed(self, dna_sequence: str, bit_length: int) -> bytes:
+        raise NotImplementedError
@@ -1,12 +1,34 @@
-from .base import EncodingStrategy
-from ..binary_to_dna import binary_to_dna_sequence, dna_sequence_to_binary
+from .base import PackedEncodingStrategy
+from ..binary_to_dna import binary_to_dna_sequence, dna_sequence_to_binary, bytes_to_dna, dna_to_bytes
 
-class BaselineStrategy(EncodingStrategy):
+class BaselineStrategy(PackedEncodingStrategy):
     def encode(self, binary_data):
         return binary_to_dna_sequence(binary_data)
     
     def decode(self, dna_sequence):
         return dna_sequence_to_binary(dna_sequence)
+
+    def encode_packed(self, data, bit_length):
+        if bit_length % 2 != 0:
+            raise ValueError("Binary data length must be even")
+        num_bytes = (bit_length + 7) // 8
+        if len(data) != num_bytes:
+            data = data[:num_bytes]
+        dna = bytes_to_dna(data)
+        # Drop the bases that only carry padding bits
+        return dna if bit_length == num_bytes * 8 else dna[:bit_length // 2]
+
+    def decode_packed(self, dna_sequence, bit_length):
+        if len(dna_sequence) * 2 != bit_length:
+            raise ValueError(f"Expected {bit_length // 2} bases, got {len(dna_sequence)}")
+        padding = -len(dna_sequence) % 4
+        if padding:
+            fill = 'A' * padding if isinstance(dna_sequence, str) else b'A' * padding
+            dna_sequence = dna_sequence + fill
+        return dna_to_bytes(dna_sequence)
         
+    def bit_span(self, base_index, bit_length):
+        return 2 * base_index, 2 * base_index + 2
+
     def bits_per_base(self):
         return 2.0
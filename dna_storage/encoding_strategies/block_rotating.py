@@ -0,0 +1,184 @@
+from fractions import Fraction
+from .base import PackedEncodingStrategy
+from ..binary_to_dna import bits_to_packed, packed_to_bits
+
+class BlockRotatingStrategy(PackedEncodingStrategy):
+    """
+    Homopolymer-free rotating code with fixed-size blocks.
+
+    Every 11 bits become 7 trits (2^11 = 2048 <= 3^7 = 2187), each trit
+    picks one of the three bases that differ from the previous base. A
+    trailing block of r < 11 bits uses ceil(7r / 11) trits, so a packet of
+    L bits is exactly ceil(7L / 11) bases and cost is linear in L.
+    """
+    BASES = ['A', 'C', 'G', 'T']
+    BLOCK_BITS = 11
+    BLOCK_TRITS = 7
+
+    # 8 blocks of 11 bits line up with 11 whole bytes
+    GROUP_BLOCKS = 8
+    GROUP_BYTES = 11
+
+    _encode_table = None
+    _decode_table = None
+
+    @classmethod
+    def _tables(cls):
+        """Builds (once) prev_base x value -> bases and prev_base + bases -> value."""
+        if cls._encode_table is None:
+            encode_table = []
+            decode_table = {}
+            for prev in range(4):
+                row = []
+                for value in range(1 << cls.BLOCK_BITS):
+                    dna, last = cls._rotate(cls._to_trits(value, cls.BLOCK_TRITS), prev)
+                    row.append((dna, last))
+                    decode_table[cls.BASES[prev] + dna] = value
+                encode_table.append(row)
+            cls._decode_table = decode_table
+            cls._encode_table = encode_table
+        return cls._encode_table, cls._decode_table
+
+    @staticmethod
+    def _to_trits(value, num_trits):
+        trits = [0] * num_trits
+        for i in range(num_trits - 1, -1, -1):
+            value, trits[i] = divmod(value, 3)
+        return trits
+
+    @classmethod
+    def _rotate(cls, trits, prev_idx):
+        dna = []
+        for t in trits:
+            prev_idx = (prev_idx + 1 + t) % 4
+            dna.append(cls.BASES[prev_idx])
+        return ''.join(dna), prev_idx
+
+    @classmethod
+    def _unrotate(cls, dna_sequence, prev_idx):
+        """Bases -> (integer value, index of the last base), most significant trit first."""
+        value = 0
+        for base in dna_sequence:
+            curr_idx = cls.BASES.index(base) if base in cls.BASES else prev_idx
+            # A repeated base (t == 3) can only come from corruption; clamp it.
+            value = value * 3 + min((curr_idx - prev_idx - 1) % 4, 2)
+            prev_idx = curr_idx
+        return value, prev_idx
+
+    @classmethod
+    def tail_trits(cls, tail_bits):
+        return (tail_bits * cls.BLOCK_TRITS + cls.BLOCK_BITS - 1) // cls.BLOCK_BITS
+
+    def encode(self, binary_data):
+        return self.encode_packed(*bits_to_packed(binary_data))
+
+    def decode(self, dna_sequence):
+        # Without a bit length, assume the longest packet that fits.
+        full, tail = divmod(len(dna_sequence), self.BLOCK_TRITS)
+        bit_length = full * self.BLOCK_BITS + (tail * self.BLOCK_BITS) // self.BLOCK_TRITS
+        return packed_to_bits(self.decode_packed(dna_sequence, bit_length), bit_length)
+
+    def encode_packed(self, data, bit_length):
+        encode_table, _ = self._tables()
+        values = self._split_values(data, bit_length)
+        full_blocks, tail_bits = divmod(bit_length, self.BLOCK_BITS)
+
+        dna = []
+        prev = 0 # Assume previous was A (index 0) implied
+        for value in values[:full_blocks]:
+            bases, prev = encode_table[prev][value]
+            dna.append(bases)
+        if tail_bits:
+            bases, prev = self._rotate(self._to_trits(values[-1], self.tail_trits(tail_bits)), prev)
+            dna.append(bases)
+        return ''.join(dna)
+
+    def decode_packed(self, dna_sequence, bit_length):
+        _, decode_table = self._tables()
+        full_blocks, tail_bits = divmod(bit_length, self.BLOCK_BITS)
+        expected = self.encoded_length(bit_length)
+        if len(dna_sequence) != expected:
+            raise ValueError(f"Expected {expected} bases, got {len(dna_sequence)}")
+
+        mask = (1 << self.BLOCK_BITS) - 1
+        values = []
+        prev = 0
+        for i in range(0, full_blocks * self.BLOCK_TRITS, self.BLOCK_TRITS):
+            block = dna_sequence[i:i + self.BLOCK_TRITS]
+            value = decode_table.get(self.BASES[prev] + block)
+            if value is None:
+                # Corrupted block: keep going with a value of the right width, ECC sorts it out.
+                value, prev = self._unrotate(block, prev)
+                value &= mask
+            else:
+                prev = self.BASES.index(block[-1])
+            values.append(value)
+        if tail_bits:
+            value, prev = self._unrotate(dna_sequence[full_blocks * self.BLOCK_TRITS:], prev)
+            values.append(value & ((1 << tail_bits) - 1))
+        return self._join_values(values, bit_length)
+
+    def _split_values(self, data, bit_length):
+        """Packed bits -> list of 11-bit values (the last one may be shorter)."""
+        values = []
+        num_groups = bit_length // (self.GROUP_BLOCKS * self.BLOCK_BITS)
+        group_bits = self.GROUP_BLOCKS * self.BLOCK_BITS
+        shifts = range((self.GROUP_BLOCKS - 1) * self.BLOCK_BITS, -1, -self.BLOCK_BITS)
+        mask = (1 << self.BLOCK_BITS) - 1
+
+        for g in range(num_groups):
+            start = g * self.GROUP_BYTES
+            group = int.from_bytes(data[start:start + self.GROUP_BYTES], byteorder='big')
+            values.extend((group >> s) & mask for s in shifts)
+
+        rest_bits = bit_length - num_groups * group_bits
+        if rest_bits:
+            start = num_groups * self.GROUP_BYTES
+            rest_bytes = (rest_bits + 7) // 8
+            rest = int.from_bytes(data[start:start + rest_bytes], byteorder='big') >> (rest_bytes * 8 - rest_bits)
+            full, tail = divmod(rest_bits, self.BLOCK_BITS)
+            for i in range(full):
+                values.append((rest >> (rest_bits - (i + 1) * self.BLOCK_BITS)) & mask)
+            if tail:
+                values.append(rest & ((1 << tail) - 1))
+        return values
+
+    def _join_values(self, values, bit_length):
+        """Inverse of _split_values."""
+        out = []
+        group_bits = self.GROUP_BLOCKS * self.BLOCK_BITS
+        num_groups = bit_length // group_bits
+
+        for g in range(num_groups):
+            group = 0
+            for value in values[g * self.GROUP_BLOCKS:(g + 1) * self.GROUP_BLOCKS]:
+                group = (group << self.BLOCK_BITS) | value
+            out.append(group.to_bytes(self.GROUP_BYTES, byteorder='big'))
+
+        rest_bits = bit_length - num_groups * group_bits
+        if rest_bits:
+            full, tail = divmod(rest_bits, self.BLOCK_BITS)
+            rest = 0
+            for value in values[num_groups * self.GROUP_BLOCKS:num_groups * self.GROUP_BLOCKS + full]:
+                rest = (rest << self.BLOCK_BITS) | value
+            if tail:
+                rest = (rest << tail) | values[-1]
+            rest_bytes = (rest_bits + 7) // 8
+            out.append((rest << (rest_bytes * 8 - rest_bits)).to_bytes(rest_bytes, byteorder='big'))
+        return b''.join(out)
+
+    def bit_span(self, base_index, bit_length):
+        # Each trit is read relative to the previous base, so a bad base also
+        # spoils the next trit, which may sit in the following block.
+        last_base = min(base_index + 1, self.encoded_length(bit_length) - 1)
+        first_block = base_index // self.BLOCK_TRITS
+        last_block = last_base // self.BLOCK_TRITS
+        return first_block * self.BLOCK_BITS, min((last_block + 1) * self.BLOCK_BITS, bit_length)
+
+    def encoded_length(self, bit_length):
+        full_blocks, tail_bits = divmod(bit_length, self.BLOCK_BITS)
+        return full_blocks * self.BLOCK_TRITS + self.tail_trits(tail_bits)
+
+    def bits_per_base(self):
+        # Exact ratio so AddressIndexer's ceil(bits / bits_per_base) matches the encoded length
+        return Fraction(self.BLOCK_BITS, self.BLOCK_TRITS)
@@ -1,21 +1,25 @@
 import math
-from .base import EncodingStrategy
+from .base import PackedEncodingStrategy
 
-class RotatingStrategy(EncodingStrategy):
+class RotatingStrategy(PackedEncodingStrategy):
     BASES = ['A', 'C', 'G', 'T']
     
     def encode(self, binary_data):
         if not binary_data:
             return ""
-        
+        # We encode '1' + binary so leading zeros survive the conversion.
+        return self._encode_value(int('1' + binary_data, 2), len(binary_data))
+
+    def encode_packed(self, data, bit_length):
+        if bit_length == 0:
+            return ""
+        num_bytes = (bit_length + 7) // 8
+        val = int.from_bytes(data[:num_bytes], byteorder='big') >> (num_bytes * 8 - bit_length)
+        return self._encode_value(val | (1 << bit_length), bit_length)
+
+    def _encode_value(self, val, L):
         # Calculate fixed length to ensure random access works
-        L = len(binary_data)
-        # We encode '1' + binary. Total bits = L + 1.
-        # Max value < 2^(L+1).
-        # Trits needed = ceil((L + 1) * log(2) / log(3))
-        num_trits = math.ceil((L + 1) * math.log(2) / math.log(3))
-        
-        val = int('1' + binary_data, 2)
+        num_trits = self.encoded_length(L)
         
         trits = []
         while val > 0:
@@ -41,13 +45,26 @@ class RotatingStrategy(EncodingStrategy):
     def decode(self, dna_sequence):
         if not dna_sequence:
             return ""
-            
+        bin_str = bin(self._decode_value(dna_sequence))[2:]
+        return bin_str[1:] # Remove leading '1'
+
+    def decode_packed(self, dna_sequence, bit_length):
+        if bit_length == 0:
+            return b''
+        # Masking drops the sentinel and keeps corrupted input at a fixed size
+        val = self._decode_value(dna_sequence) & ((1 << bit_length) - 1)
+        num_bytes = (bit_length + 7) // 8
+        return (val << (num_bytes * 8 - bit_length)).to_bytes(num_bytes, byteorder='big')
+
+    def _decode_value(self, dna_sequence):
         trits = []
         prev_idx = 0
         base_map = {b: i for i, b in enumerate(self.BASES)}
         
         for base in dna_sequence:
-            curr_idx = base_map[base]
+            curr_idx = base_map.get(base)
+            if curr_idx is None:
+                raise ValueError(f"Invalid base {base!r}")
             # Reverse: t = (curr - prev - 1) % 4
             t = (curr_idx - prev_idx - 1) % 4
             trits.append(t)
@@ -56,9 +73,14 @@ class RotatingStrategy(EncodingStrategy):
         val = 0
         for t in trits:
             val = val * 3 + t
-            
-        bin_str = bin(val)[2:]
-        return bin_str[1:] # Remove leading '1'
+        return val
+
+    def encoded_length(self, bit_length):
+        if bit_length == 0:
+            return 0
+        # Total bits = L + 1 (sentinel). Max value < 2^(L+1).
+        # Trits needed = ceil((L + 1) * log(2) / log(3))
+        return math.ceil((bit_length + 1) * math.log(2) / math.log(3))
 
     def bits_per_base(self):
-        return 1.58496
\ No newline at end of file
+        return 1.58496
@@ -1,10 +1,19 @@
-from .binary_to_dna import bytes_to_binary, binary_to_dna_sequence, dna_sequence_to_binary, binary_to_bytes
+import itertools
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from .binary_to_dna import bytes_to_binary, binary_to_bytes, bytes_to_dna, dna_to_bytes
 from .ecc import ECC
+from .ecc.reed_solomon import ReedSolomonError
+from .failures import DNAStorageError
 from .metadata import MetadataManager
 from .chunking import ChunkManager
-from .constraints import ConstraintValidator
+from .constraints import ConstraintChecker
 from .addressing import AddressIndexer
-from .encoding_strategies import get_strategy
+from .encoding_strategies import get_strategy, PackedEncodingStrategy, BaselineStrategy
+from .packed_dna import PackedDNA
 
 try:
     from .native import dna_native
@@ -12,8 +21,23 @@ try:
 except ImportError:
     CPP_AVAILABLE = False
 
+# Encodings with a native rotating kernel -> its `block` flag
+NATIVE_ROTATING = {'rotating': False, 'rotating_block': True}
+
+_INVALID_BASE = re.compile('[^ACGT]')
+
+# Highest nonce tried before giving up on a constrained packet
+MAX_NONCE = 1000
+
+# Marks the threads of a storage's range pool; native batches there run single-threaded
+_pool_thread = threading.local()
+
+def _mark_pool_thread():
+    _pool_thread.active = True
+
 class DNAStorage:
-    def __init__(self, ecc_method='rs', nsym=10, chunk_size=128, constraints=None, encoding='baseline', backend='python'):
+    def __init__(self, ecc_method='rs', nsym=10, chunk_size=128, constraints=None, encoding='baseline', backend='python',
+                 threads=0, batch_size=256, nonce_batch=64, chunk_cache=None):
         self.ecc_method = ecc_method
         self.nsym = nsym
         self.chunk_size = chunk_size
@@ -21,24 +45,69 @@ class DNAStorage:
         self.encoding_name = encoding
         self.strategy = get_strategy(encoding)
         self.backend = backend
+        # Native batch calls and decode_range windows fan out over `threads` (0 = all cores),
+        # `batch_size` chunks at a time
+        self.threads = threads
+        self.batch_size = batch_size
+        # Most constrained packets pass within a few nonces, so the nonce search
+        # tries 1, 2, 4, ... candidates per packet and round, up to nonce_batch
+        self.nonce_batch = nonce_batch
+        # retries (final nonce) -> number of packets, accumulated over encodes
+        self.retry_histogram = Counter()
+        # Optional ChunkCache of decoded payloads for decode_chunk / decode_range
+        self.chunk_cache = chunk_cache
+        self._checker = None
+        self._checker_constraints = None
+        # Thread pool for decode_range windows, started on first use
+        self._range_pool = None
+        self._range_pool_lock = threading.Lock()
         
         if backend == 'cpp' and not CPP_AVAILABLE:
             print("Warning: C++ backend requested but not available. Falling back to Python.")
             self.backend = 'python'
         
+    def _config(self):
+        """Constructor arguments that rebuild this storage's coding setup, e.g. in a worker process."""
+        return {'ecc_method': self.ecc_method, 'nsym': self.nsym, 'chunk_size': self.chunk_size,
+                'constraints': self.constraints, 'encoding': self.encoding_name, 'backend': self.backend,
+                'threads': self.threads, 'batch_size': self.batch_size, 'nonce_batch': self.nonce_batch}
+
+    def _native_threads(self):
+        """Threads for a native batch call; one inside the range pool, which already spans the cores."""
+        return 1 if getattr(_pool_thread, 'active', False) else self.threads
+
+    def _pool(self):
+        with self._range_pool_lock:
+            if self._range_pool is None:
+                self._range_pool = ThreadPoolExecutor(max_workers=self.threads or os.cpu_count() or 1,
+                                                      thread_name_prefix='dna-range', initializer=_mark_pool_thread)
+            return self._range_pool
+
+    def close(self):
+        """Shuts down the range pool, if one was started; the storage stays usable."""
+        with self._range_pool_lock:
+            pool, self._range_pool = self._range_pool, None
+        if pool is not None:
+            pool.shutdown()
+
     def _encode_body(self, data_bytes):
         """Internal method to encode a single data packet."""
         if self.backend == 'cpp' and self.encoding_name == 'baseline':
             if self.ecc_method == 'hamming':
                 return dna_native.hamming_encode_dna(data_bytes)
             elif self.ecc_method == 'rs':
-                encoded_bytes = ECC.rs_encode(data_bytes, self.nsym)
-                if isinstance(encoded_bytes, bytearray):
-                    encoded_bytes = bytes(encoded_bytes)
-                return dna_native.binary_to_dna(encoded_bytes)
+                return dna_native.binary_to_dna(dna_native.rs_encode(data_bytes, self.nsym))
             else:
                 return dna_native.binary_to_dna(data_bytes)
+
+        if self.backend == 'cpp' and self.encoding_name in NATIVE_ROTATING:
+            packed, bit_length = self._ecc_encode_packed(data_bytes)
+            return dna_native.rotating_encode(bytes(packed), bit_length, NATIVE_ROTATING[self.encoding_name])
         
+        if isinstance(self.strategy, PackedEncodingStrategy):
+            packed, bit_length = self._ecc_encode_packed(data_bytes)
+            return self.strategy.encode_packed(packed, bit_length)
+
         if self.ecc_method == 'rs':
             encoded_bytes = ECC.rs_encode(data_bytes, self.nsym)
             binary = bytes_to_binary(encoded_bytes)
@@ -59,10 +128,20 @@ class DNAStorage:
                 return res.data
             elif self.ecc_method == 'rs':
                 data_bytes = dna_native.dna_to_binary(dna_sequence)
-                return ECC.rs_decode(data_bytes, self.nsym)
+                return self._rs_decode_native([data_bytes])[0]
             else:
                 return dna_native.dna_to_binary(dna_sequence)
 
+        if self.backend == 'cpp' and self.encoding_name in NATIVE_ROTATING:
+            bit_length = self._indexer().calculate_chunk_bits()
+            packed = dna_native.rotating_decode(dna_sequence, bit_length, NATIVE_ROTATING[self.encoding_name])
+            return self._ecc_decode_packed(packed, bit_length)
+
+        if isinstance(self.strategy, PackedEncodingStrategy):
+            bit_length = self._indexer().calculate_chunk_bits()
+            packed = self.strategy.decode_packed(dna_sequence, bit_length)
+            return self._ecc_decode_packed(packed, bit_length)
+
         binary = self.strategy.decode(dna_sequence)
         
         if self.ecc_method == 'rs':
@@ -74,20 +153,206 @@ class DNAStorage:
         else:
             return binary_to_bytes(binary)
 
-    def _parse_header_and_configure(self, dna_sequence):
+    def _ecc_encode_packed(self, data_bytes):
+        """ECC-encodes a packet. Returns (packed_bytes, bit_length)."""
+        if self.ecc_method == 'rs':
+            if self.backend == 'cpp':
+                encoded_bytes = dna_native.rs_encode(data_bytes, self.nsym)
+            else:
+                encoded_bytes = ECC.rs_encode(data_bytes, self.nsym)
+            return encoded_bytes, len(encoded_bytes) * 8
+        elif self.ecc_method == 'hamming':
+            return ECC.hamming_encode_packed(data_bytes)
+        return data_bytes, len(data_bytes) * 8
+
+    def _ecc_decode_packed(self, packed, bit_length):
+        if self.ecc_method == 'rs':
+            if self.backend == 'cpp':
+                return self._rs_decode_native([packed])[0]
+            return ECC.rs_decode(packed, self.nsym)
+        elif self.ecc_method == 'hamming':
+            return ECC.hamming_decode_packed(packed, bit_length)
+        return packed
+
+    def _rs_decode_native(self, packed_list, erase_pos=None, skip_errors=False):
+        """Native RS decode of a batch; raises ReedSolomonError like the reedsolo path."""
+        results = dna_native.rs_decode_batch([bytes(p) for p in packed_list], self.nsym,
+                                             erase_pos or [], self._native_threads())
+        if not skip_errors:
+            for r in results:
+                if not r.ok:
+                    raise ReedSolomonError(r.error)
+        return [r.data if r.ok else None for r in results]
+
+    def _indexer(self):
+        return AddressIndexer(self.chunk_size, self.ecc_method, {"nsym": self.nsym},
+                              self.strategy.bits_per_base(), strategy=self.strategy)
+
+    def _encode_batch(self, packets):
+        """Encodes a window of equal-length packets through the batch/native paths."""
+        if not packets:
+            return []
+        if self.backend == 'cpp' and self.encoding_name == 'baseline' and self.ecc_method == 'hamming':
+            return dna_native.hamming_encode_batch(packets, self._native_threads())
+        if self.backend != 'cpp' and not isinstance(self.strategy, PackedEncodingStrategy):
+            return [self._encode_body(p) for p in packets]
+
+        if self.ecc_method == 'rs' and self.backend == 'cpp':
+            encoded = dna_native.rs_encode_batch(packets, self.nsym, self._native_threads())
+            bit_length = len(encoded[0]) * 8
+        elif self.ecc_method == 'rs':
+            encoded = ECC.rs_encode_batch(packets, self.nsym)
+            bit_length = len(encoded[0]) * 8
+        elif self.ecc_method == 'hamming':
+            encoded, bit_length = ECC.hamming_encode_batch(packets)
+        else:
+            encoded, bit_length = packets, len(packets[0]) * 8
+
+        if isinstance(self.strategy, BaselineStrategy) and bit_length % 8 == 0:
+            # One mapping call for the whole window, then split per packet
+            joined = b''.join(encoded)
+            dna = dna_native.binary_to_dna(joined) if self.backend == 'cpp' else bytes_to_dna(joined)
+            step = bit_length // 2
+            return [dna[i:i + step] for i in range(0, len(dna), step)]
+        if self.backend == 'cpp' and self.encoding_name in NATIVE_ROTATING:
+            return dna_native.rotating_encode_batch(encoded, bit_length, NATIVE_ROTATING[self.encoding_name], self._native_threads())
+        return [self.strategy.encode_packed(e, bit_length) for e in encoded]
+
+    def _decode_batch(self, segments, erasures=None, skip_errors=False):
+        """
+        Decodes a window of equal-length chunk segments back to packet bytes.
+        erasures: optional list with the known-bad base offsets of each segment
+        (only used with RS, see _supports_erasures).
+        skip_errors: uncorrectable RS packets come back as None instead of raising.
+        """
+        if not segments:
+            return []
+        if isinstance(segments[0], PackedDNA):
+            if isinstance(self.strategy, BaselineStrategy):
+                # A packed baseline segment already is the ECC-encoded packet
+                bit_length = self._indexer().calculate_chunk_bits()
+                return self._ecc_decode_batch([seg.tobytes() for seg in segments], bit_length, erasures, skip_errors)
+            segments = [str(seg) for seg in segments]
+        if self.backend == 'cpp' and self.encoding_name == 'baseline' and self.ecc_method == 'hamming':
+            return [r.data for r in dna_native.hamming_decode_batch(segments, self._native_threads())]
+        if self.backend != 'cpp' and not isinstance(self.strategy, PackedEncodingStrategy):
+            return [self._decode_body(seg) for seg in segments]
+
+        bit_length = self._indexer().calculate_chunk_bits()
+        if isinstance(self.strategy, BaselineStrategy) and bit_length % 8 == 0:
+            joined = ''.join(segments)
+            data = dna_native.dna_to_binary(joined) if self.backend == 'cpp' else dna_to_bytes(joined)
+            step = bit_length // 8
+            packed = [data[i:i + step] for i in range(0, len(data), step)]
+        elif self.backend == 'cpp' and self.encoding_name in NATIVE_ROTATING:
+            packed = dna_native.rotating_decode_batch(segments, bit_length, NATIVE_ROTATING[self.encoding_name], self._native_threads())
+        else:
+            packed = [self.strategy.decode_packed(seg, bit_length) for seg in segments]
+        return self._ecc_decode_batch(packed, bit_length, erasures, skip_errors)
+
+    def _try_decode_batch(self, segments, erasures=None):
+        """
+        As _decode_batch, but None for each segment that fails to decode.
+        Only decode failures are absorbed; other errors propagate.
+        """
+        if erasures is None:
+            erasures = [()] * len(segments)
+        try:
+            return self._decode_batch(segments, erasures, skip_errors=True)
+        except (ReedSolomonError, ValueError, DNAStorageError):
+            if len(segments) == 1:
+                return [None]
+        # Decoders without per-packet error reporting fail the whole batch; retry one by one
+        return [self._try_decode_batch([s], [e])[0] for s, e in zip(segments, erasures)]
+
+    def _ecc_decode_batch(self, packed, bit_length, erasures=None, skip_errors=False):
+        erase_pos = None
+        if erasures and any(erasures):
+            erase_pos = [self._erased_bytes(offsets, bit_length) for offsets in erasures]
+        if self.ecc_method == 'rs' and self.backend == 'cpp':
+            return self._rs_decode_native(packed, erase_pos, skip_errors)
+        elif self.ecc_method == 'rs':
+            return ECC.rs_decode_batch(packed, self.nsym, erase_pos, skip_errors)
+        elif self.ecc_method == 'hamming':
+            decoded, corrected = ECC.hamming_decode_batch(packed, bit_length)
+            return decoded
+        return packed
+
+    def _supports_erasures(self):
+        """Erasures need RS and a strategy that keeps base errors local."""
+        return self.ecc_method == 'rs' and self.strategy.bit_span(0, 8) is not None
+
+    def _erased_bytes(self, base_offsets, bit_length):
+        """Base offsets within a segment -> sorted RS byte positions they can corrupt."""
+        erased = set()
+        for offset in base_offsets:
+            first_bit, end_bit = self.strategy.bit_span(offset, bit_length)
+            erased.update(range(first_bit // 8, (end_bit - 1) // 8 + 1))
+        return sorted(erased)
+
+    def _erasure_map(self, erasures, indexer, header_end):
+        """Absolute base positions -> {chunk index: [offsets within the chunk]}."""
+        chunk_len = indexer.calculate_chunk_dna_length()
+        erasure_map = {}
+        for pos in erasures or ():
+            if pos >= header_end:
+                chunk_index, offset = divmod(pos - header_end, chunk_len)
+                erasure_map.setdefault(chunk_index, []).append(offset)
+        return erasure_map
+
+    def _chunk_segment(self, dna_sequence, indexer, chunk_index, header_end, offsets):
+        """
+        Cuts one chunk out of the stream and marks what is known to be bad:
+        invalid bases are replaced with 'A' and a truncated tail is padded,
+        both recorded as erased offsets. Returns (segment, offsets), or
+        (None, offsets) when the chunk is missing beyond repair.
+        """
+        start, end = indexer.get_chunk_range(chunk_index, header_end)
+        segment = dna_sequence[start:end]
+        if not self._supports_erasures():
+            return (segment if end <= len(dna_sequence) else None), offsets
+
+        offsets = list(offsets)
+        missing = end - start - len(segment)
+        if missing:
+            tail = range(len(segment), end - start)
+            bit_length = indexer.calculate_chunk_bits()
+            if not segment or len(self._erased_bytes(tail, bit_length)) > self.nsym:
+                return None, offsets
+            offsets.extend(tail)
+            segment += 'A' * missing
+        if isinstance(segment, str) and _INVALID_BASE.search(segment):
+            offsets.extend(m.start() for m in _INVALID_BASE.finditer(segment))
+            segment = _INVALID_BASE.sub('A', segment)
+        return segment, offsets
+
+    def _satisfies_constraints(self, dna):
+        if not self.constraints:
+            return True
+        if self._checker is None or self._checker_constraints != self.constraints:
+            self._checker = ConstraintChecker(self.constraints)
+            self._checker_constraints = dict(self.constraints)
+        return self._checker(dna)
+
+    @staticmethod
+    def _parse_header(dna_sequence):
+        """Reads the length prefix and header without configuring anything; returns (header_end, metadata)."""
         prefix_len = 16 
         if len(dna_sequence) < prefix_len:
             raise ValueError("Data too short to contain header prefix")
-        prefix_dna = dna_sequence[:prefix_len]
+        # str() is a no-op for str input and unpacks PackedDNA slices
+        prefix_dna = str(dna_sequence[:prefix_len])
         header_len = MetadataManager.decode_length_prefix(prefix_dna)
         
         total_header_end = prefix_len + header_len
         if len(dna_sequence) < total_header_end:
              raise ValueError("Data too short to contain header")
              
-        header_dna = dna_sequence[prefix_len:total_header_end]
-        metadata = MetadataManager.parse_header_dna(header_dna)
-        
+        header_dna = str(dna_sequence[prefix_len:total_header_end])
+        return total_header_end, MetadataManager.parse_header_dna(header_dna)
+
+    def _configure(self, metadata):
+        """Adopts the coding parameters of a parsed header."""
         self.ecc_method = metadata.get('ecc', 'rs')
         params = metadata.get('ecc_params', {})
         if self.ecc_method == 'rs':
@@ -96,99 +361,271 @@ class DNAStorage:
         self.constraints = metadata.get('constraints', {})
         self.encoding_name = metadata.get('encoding', 'baseline')
         self.strategy = get_strategy(self.encoding_name)
-        
+
+    def _parse_header_and_configure(self, dna_sequence):
+        total_header_end, metadata = self._parse_header(dna_sequence)
+        self._configure(metadata)
         return total_header_end, metadata
 
-    def encode_packet_with_constraints(self, chunk):
+    def encode_packet_with_constraints(self, chunk, start_nonce=0):
         """Encodes a single chunk/packet, handling constraints via nonce remapping."""
-        nonce = 0
-        while True:
-            if nonce > 0:
-                idx, payload, length, _ = ChunkManager.unpack_chunk_components(chunk)
-                chunk = ChunkManager.pack_chunk(idx, payload, length, nonce)
-            
-            dna = self._encode_body(chunk)
-            
-            valid = True
-            if self.constraints:
-                if 'min_gc' in self.constraints:
-                    min_gc = self.constraints.get('min_gc')
-                    max_gc = self.constraints.get('max_gc', 0.6)
-                    if not ConstraintValidator.validate_gc_content(dna, min_gc, max_gc):
-                        valid = False
-                if valid and 'max_homopolymer' in self.constraints:
-                    max_hp = self.constraints.get('max_homopolymer', 3)
-                    if not ConstraintValidator.validate_homopolymers(dna, max_hp):
-                        valid = False
-            
-            if valid:
-                return dna
-            
-            nonce += 1
-            if nonce > 1000:
-                raise RuntimeError("Failed to satisfy constraints after 1000 attempts")
+        dna, nonce = self._search_nonces([chunk], start_nonce)[0]
+        return dna
+
+    def _search_nonces(self, packets, start_nonce=1):
+        """
+        Finds, for each packet, the lowest nonce >= start_nonce whose encoding
+        satisfies the constraints. Each round scrambles candidates from the
+        original payload for all pending packets and encodes them in one batch
+        call; the first passing nonce wins, so results match a serial search.
+        Returns a list of (dna, nonce).
+        """
+        components = []
+        for packet in packets:
+            idx, payload, length, _ = ChunkManager.unpack_chunk_components(packet)
+            components.append((idx, payload, length))
+
+        results = [None] * len(packets)
+        pending = list(range(len(packets)))
+        nonce = start_nonce
+        round_size = 1
+        while pending:
+            if nonce > MAX_NONCE:
+                raise RuntimeError(f"Failed to satisfy constraints after {MAX_NONCE} attempts")
+            nonces = range(nonce, min(nonce + round_size, MAX_NONCE + 1))
+            round_size = min(round_size * 2, self.nonce_batch)
+            candidates = [ChunkManager.pack_chunk(*components[k], n) for k in pending for n in nonces]
+            encoded = self._encode_batch(candidates)
+
+            still_pending = []
+            for j, k in enumerate(pending):
+                row = encoded[j * len(nonces):(j + 1) * len(nonces)]
+                for n, dna in zip(nonces, row):
+                    if self._satisfies_constraints(dna):
+                        results[k] = (dna, n)
+                        break
+                else:
+                    still_pending.append(k)
+            pending = still_pending
+            nonce += len(nonces)
+        return results
+
+    def encode_packets(self, packets):
+        """
+        Encodes a window of packets with the batch path.
+        Packets that violate constraints go through a batched nonce search.
+        """
+        encoded = self._encode_batch(packets)
+        failing = [i for i, dna in enumerate(encoded) if not self._satisfies_constraints(dna)]
+        self.retry_histogram[0] += len(packets) - len(failing)
+        if failing:
+            found = self._search_nonces([packets[i] for i in failing], start_nonce=1)
+            for i, (dna, nonce) in zip(failing, found):
+                encoded[i] = dna
+                self.retry_histogram[nonce] += 1
+        return encoded
+
+    def decode_packets(self, segments):
+        return self._decode_batch(segments)
 
     def decode_packet(self, dna_segment):
         return self._decode_body(dna_segment)
 
-    def encode(self, data_bytes):
-        chunks = ChunkManager.chunk_data(data_bytes, self.chunk_size)
-        
-        encoded_chunks_dna = [self.encode_packet_with_constraints(chunk) for chunk in chunks]
-        body_dna = "".join(encoded_chunks_dna)
+    def encode(self, data_bytes, packed=False):
+        """
+        Returns the DNA as a str, or as a PackedDNA (2 bits per base) when
+        packed=True; windows are packed as they are encoded, so the full
+        text is never held in memory.
+        """
+        # Packets are produced lazily, batch_size at a time, so only one
+        # window of packets is alive next to the input and the output DNA.
+        total_chunks = -(-len(data_bytes) // self.chunk_size)
         
         ecc_params = {"nsym": self.nsym} if self.ecc_method == 'rs' else {}
         header_dna = MetadataManager.create_header_dna(
-            self.ecc_method, ecc_params, self.chunk_size, len(chunks), 
+            self.ecc_method, ecc_params, self.chunk_size, total_chunks, 
             self.constraints, self.encoding_name
         )
         
         prefix_dna = MetadataManager.encode_length_prefix(len(header_dna))
         
-        return prefix_dna + header_dna + body_dna
-
-    def decode(self, dna_sequence):
-        total_header_end, metadata = self._parse_header_and_configure(dna_sequence)
-        total_chunks = metadata.get('total_chunks', 0)
+        parts = [prefix_dna, header_dna]
+        result = PackedDNA() if packed else None
+        chunks = ChunkManager.iter_chunks(data_bytes, self.chunk_size)
+        while True:
+            window = list(itertools.islice(chunks, self.batch_size))
+            if not window:
+                break
+            parts.extend(self.encode_packets(window))
+            if packed:
+                result.extend("".join(parts))
+                parts = []
         
-        indexer = AddressIndexer(self.chunk_size, self.ecc_method, {"nsym": self.nsym}, self.strategy.bits_per_base())
+        if packed:
+            result.extend("".join(parts))
+            return result
+        return "".join(parts)
+
+    def _archive_key(self, dna_sequence, archive_key=None):
+        """
+        Key of an archive in the chunk cache: archive_key if given, else a
+        token stored on a PackedDNA, which extend() replaces. Content is never
+        hashed. None (no caching) without a chunk_cache, or for other
+        sequences, which may change without notice.
+        """
+        if self.chunk_cache is None:
+            return None
+        if archive_key is not None:
+            return archive_key
+        if not isinstance(dna_sequence, PackedDNA):
+            return None
+        if dna_sequence._cache_token is None:
+            dna_sequence._cache_token = object()
+        return dna_sequence._cache_token
+
+    def _decode_chunks(self, dna_sequence, indexer, header_end, window, erasure_map=None, cache_key=None):
+        """
+        Decodes a range of consecutive chunks in one batch and returns their
+        payloads. The header must already be parsed (header_end, indexer).
+        With cache_key set and a chunk_cache, only cache misses are decoded.
+        """
+        if cache_key is not None and self.chunk_cache is not None:
+            cache = self.chunk_cache
+            payloads = {i: cache.get((cache_key, i)) for i in window}
+            missing = [i for i in window if payloads[i] is None]
+            if missing:
+                for i, data in zip(missing, self._decode_chunks(dna_sequence, indexer, header_end, missing, erasure_map)):
+                    cache.put((cache_key, i), data)
+                    payloads[i] = data
+            return [payloads[i] for i in window]
+
+        segments = []
+        segment_erasures = []
+        truncated = False
+        for i in window:
+            segment, offsets = self._chunk_segment(dna_sequence, indexer, i, header_end,
+                                                   (erasure_map or {}).get(i, ()))
+            if segment is None:
+                truncated = True
+                break
+            segments.append(segment)
+            segment_erasures.append(offsets)
         
-        chunks_data = []
-        for i in range(total_chunks):
-            start, end = indexer.get_chunk_range(i, total_header_end)
-            if end > len(dna_sequence):
-                raise ValueError("Unexpected end of stream (missing chunks)")
-            
-            chunk_segment = dna_sequence[start:end]
-            packet_bytes = self._decode_body(chunk_segment)
-            
+        # Chunks before a truncation are still checked first, so a dropped
+        # chunk reports as an index mismatch rather than a short stream.
+        payloads = []
+        for i, packet_bytes in zip(window, self._decode_batch(segments, segment_erasures)):
             idx, data, nonce = ChunkManager.parse_chunk(packet_bytes)
             
             if idx != i:
                 raise ValueError(f"Chunk index mismatch. Expected {i}, got {idx}")
                 
-            chunks_data.append(data)
+            payloads.append(data)
+
+        if truncated:
+            raise ValueError("Unexpected end of stream (missing chunks)")
+        return payloads
+
+    def decode(self, dna_sequence, erasures=None):
+        """
+        dna_sequence: str or PackedDNA.
+        erasures: optional positions (indices into dna_sequence) of bases known
+        to be bad, e.g. low-quality calls. With RS they are decoded as
+        erasures, which cost one parity symbol each instead of two. Invalid
+        characters and a truncated last chunk are marked automatically.
+        """
+        total_header_end, metadata = self._parse_header_and_configure(dna_sequence)
+        total_chunks = metadata.get('total_chunks', 0)
+        
+        indexer = self._indexer()
+        erasure_map = self._erasure_map(erasures, indexer, total_header_end)
+        
+        chunks_data = []
+        for first in range(0, total_chunks, self.batch_size):
+            window = range(first, min(first + self.batch_size, total_chunks))
+            chunks_data.extend(self._decode_chunks(dna_sequence, indexer, total_header_end, window, erasure_map))
             
         return b"".join(chunks_data)
 
-    def decode_chunk(self, dna_sequence, chunk_index):
+    def decode_range(self, dna_sequence, offset, length, erasures=None, archive_key=None):
+        """
+        Bytes [offset, offset + length) of the original data (shorter if the
+        range runs past the end). Only the chunks overlapping the range are
+        decoded. erasures: as in decode(). archive_key: names the archive in
+        chunk_cache (see decode_chunk).
+        """
+        total_header_end, metadata = self._parse_header_and_configure(dna_sequence)
+        indexer = self._indexer()
+        erasure_map = self._erasure_map(erasures, indexer, total_header_end)
+        cache_key = self._archive_key(dna_sequence, archive_key)
+        return self._decode_range(dna_sequence, indexer, total_header_end, metadata.get('total_chunks', 0),
+                                  offset, length, erasure_map, cache_key)
+
+    def _decode_range(self, dna_sequence, indexer, header_end, total_chunks, offset, length, erasure_map=None,
+                      cache_key=None):
+        if offset < 0 or length < 0:
+            raise ValueError("Offset and length must be non-negative")
+        first = offset // self.chunk_size
+        last = min(-(-(offset + length) // self.chunk_size), total_chunks)
+        if length == 0 or first >= last:
+            return b""
+
+        windows = [range(start, min(start + self.batch_size, last))
+                   for start in range(first, last, self.batch_size)]
+        def decode_window(window):
+            return self._decode_chunks(dna_sequence, indexer, header_end, window, erasure_map, cache_key)
+        workers = min(len(windows), self.threads or os.cpu_count() or 1)
+        # A range read from inside the pool runs inline rather than wait on its own workers
+        if workers > 1 and not getattr(_pool_thread, 'active', False):
+            # Windows are independent; native and NumPy decoders release the GIL
+            payloads = [data for window in self._pool().map(decode_window, windows) for data in window]
+        else:
+            payloads = [data for window in windows for data in decode_window(window)]
+
+        start = offset - first * self.chunk_size
+        return b"".join(payloads)[start:start + length]
+
+    def chunk_offsets(self, dna_sequence):
+        """Start position of every chunk in dna_sequence, followed by the end of the last one."""
+        total_header_end, metadata = self._parse_header_and_configure(dna_sequence)
+        chunk_len = self._indexer().calculate_chunk_dna_length()
+        return [total_header_end + i * chunk_len for i in range(metadata.get('total_chunks', 0) + 1)]
+
+    def decode_chunk(self, dna_sequence, chunk_index, erasures=None, archive_key=None):
+        """
+        Random access to one chunk. erasures: as in decode(). With a
+        chunk_cache, a cached payload is returned without parsing the header.
+        Cache entries of a PackedDNA belong to the object and its current
+        contents; pass archive_key, e.g. a path, to cache other sequences or
+        to share entries between objects. The sequence must not change under
+        a given archive_key.
+        """
+        cache_key = self._archive_key(dna_sequence, archive_key)
+        if cache_key is not None:
+            cache_key = (cache_key, chunk_index)
+            data = self.chunk_cache.get(cache_key)
+            if data is not None:
+                return data
+
         total_header_end, metadata = self._parse_header_and_configure(dna_sequence)
         total_chunks = metadata.get('total_chunks', 0)
         
         if chunk_index < 0 or chunk_index >= total_chunks:
             raise IndexError("Chunk index out of bounds")
             
-        indexer = AddressIndexer(self.chunk_size, self.ecc_method, {"nsym": self.nsym}, self.strategy.bits_per_base())
-        start, end = indexer.get_chunk_range(chunk_index, total_header_end)
+        indexer = self._indexer()
+        offsets = self._erasure_map(erasures, indexer, total_header_end).get(chunk_index, ())
+        chunk_segment, offsets = self._chunk_segment(dna_sequence, indexer, chunk_index, total_header_end, offsets)
         
-        if end > len(dna_sequence):
+        if chunk_segment is None:
             raise ValueError("Chunk data incomplete or missing")
             
-        chunk_segment = dna_sequence[start:end]
-        packet_bytes = self._decode_body(chunk_segment)
+        packet_bytes = self._decode_batch([chunk_segment], [offsets])[0]
         idx, data, nonce = ChunkManager.parse_chunk(packet_bytes)
         
         if idx != chunk_index:
              raise ValueError("Index mismatch in random access")
-             
+
+        if cache_key is not None:
+            self.chunk_cache.put(cache_key, data)
         return data
@@ -0,0 +1,196 @@
+"""
+Background I/O stages for StreamPipeline.
+
+ReadAhead and WriteBehind wrap a stream and move its I/O onto a thread,
+linked to the caller by a bounded queue. Reads are then issued in large
+blocks while the caller computes, and small writes are coalesced into
+large ones. Both keep the wrapped stream's read()/readinto()/write()
+interface, so pipeline code is the same with or without them.
+"""
+import queue
+import threading
+from .packed_dna import PackedDNA
+
+# Default block size for background reads and coalesced writes
+BLOCK_SIZE = 1 << 20
+# Default number of blocks queued between a stage and its caller
+QUEUE_DEPTH = 4
+
+_EOF = object()
+
+class _Stage:
+    """A daemon thread feeding or draining a bounded queue; errors are re-raised in the caller."""
+    def __init__(self, depth, name):
+        self._queue = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._guarded, name=name, daemon=True)
+
+    def _guarded(self):
+        try:
+            self._run()
+        except BaseException as e:
+            self._error = e
+            # Unblocks a caller waiting to queue more work
+            self._stop.set()
+
+    def _put(self, item):
+        """Queues item unless the stage is being stopped; False once stopped."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self):
+        """Next queued item; _EOF once the thread has stopped and the queue is drained."""
+        while True:
+            try:
+                return self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if not self._thread.is_alive() and self._queue.empty():
+                    return _EOF
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+class ReadAhead(_Stage):
+    """
+    Reads `stream` in block_size pieces on a background thread, up to depth
+    blocks ahead of the caller.
+
+    Text streams yield str, binary streams bytes. bytearray and memoryview
+    blocks are copied to bytes, and PackedDNA blocks (from
+    Dna2File.reader()) are unpacked to str.
+    """
+    def __init__(self, stream, block_size=BLOCK_SIZE, depth=QUEUE_DEPTH):
+        super().__init__(depth, 'dna-read-ahead')
+        self.stream = stream
+        self.block_size = block_size
+        self._block = None
+        self._offset = 0
+        self._done = False
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            block = self.stream.read(self.block_size)
+            if isinstance(block, (bytearray, memoryview)):
+                block = bytes(block)
+            elif isinstance(block, PackedDNA):
+                block = str(block)
+            elif not isinstance(block, (str, bytes)):
+                raise TypeError(f"read() returned {type(block).__name__}, expected str or bytes-like")
+            if not block:
+                break
+            if not self._put(block):
+                return
+        self._put(_EOF)
+
+    def _next_block(self):
+        """Makes the next block current; False at EOF."""
+        if self._done:
+            return False
+        block = self._get()
+        if block is _EOF:
+            self._done = True
+            self._raise_error()
+            return False
+        self._block, self._offset = block, 0
+        return True
+
+    def read(self, size=-1):
+        pieces = []
+        while size < 0 or size > 0:
+            if self._block is None or self._offset >= len(self._block):
+                if not self._next_block():
+                    break
+            end = len(self._block) if size < 0 else min(len(self._block), self._offset + size)
+            pieces.append(self._block[self._offset:end])
+            if size > 0:
+                size -= end - self._offset
+            self._offset = end
+        if not pieces:
+            return '' if isinstance(self._block, str) else b''
+        return pieces[0] if len(pieces) == 1 else pieces[0][:0].join(pieces)
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(view):
+            if self._block is None or self._offset >= len(self._block):
+                if not self._next_block():
+                    break
+            n = min(len(view) - filled, len(self._block) - self._offset)
+            view[filled:filled + n] = self._block[self._offset:self._offset + n]
+            filled += n
+            self._offset += n
+        return filled
+
+    def close(self):
+        """Stops the reader thread; the wrapped stream is left open."""
+        self._stop.set()
+        self._thread.join()
+
+class WriteBehind(_Stage):
+    """
+    Collects writes until block_size items are pending and hands them to a
+    background thread as one write to `stream`. close() flushes and waits
+    for the thread, and re-raises any write error.
+    """
+    def __init__(self, stream, block_size=BLOCK_SIZE, depth=QUEUE_DEPTH):
+        super().__init__(depth, 'dna-write-behind')
+        self.stream = stream
+        self.block_size = block_size
+        self._pending = []
+        self._pending_size = 0
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _EOF:
+                return
+            if callable(item):
+                item()
+            else:
+                self.stream.write(item)
+
+    def write(self, data):
+        self._raise_error()
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.block_size:
+            self._flush_pending()
+        return len(data)
+
+    def _flush_pending(self):
+        if self._pending:
+            self._put(('' if isinstance(self._pending[0], str) else b'').join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def then(self, callback):
+        """Runs callback on the writer thread once everything written so far has reached the stream."""
+        self._flush_pending()
+        self._put(callback)
+
+    def close(self):
+        """Flushes, waits for the writer thread and re-raises its error; the wrapped stream is left open."""
+        if self._thread.is_alive():
+            self._flush_pending()
+            self._put(_EOF)
+            self._thread.join()
+        self._raise_error()
+
+    def abort(self):
+        """Stops the writer thread without flushing pending writes."""
+        self._stop.set()
+        self._thread.join()
@@ -1,6 +1,6 @@
 import json
 import struct
-from ..binary_to_dna import bytes_to_binary, binary_to_dna_sequence, dna_sequence_to_binary, binary_to_bytes
+from ..binary_to_dna import bytes_to_dna, dna_to_bytes
 from ..ecc import ECC
 
 # Fixed constants for Header encoding (Self-describing format requires a bootstrap)
@@ -31,9 +31,7 @@ class MetadataManager:
         except Exception as e:
             raise RuntimeError(f"Failed to encode header: {e}")
 
-        binary = bytes_to_binary(encoded_bytes)
-        dna = binary_to_dna_sequence(binary)
-        return dna
+        return bytes_to_dna(encoded_bytes)
 
     @staticmethod
     def parse_header_dna(dna_segment):
@@ -41,8 +39,7 @@ class MetadataManager:
         Decodes the header DNA segment into a dictionary.
         """
         try:
-            binary = dna_sequence_to_binary(dna_segment)
-            data_bytes = binary_to_bytes(binary)
+            data_bytes = dna_to_bytes(dna_segment)
             decoded_bytes = ECC.rs_decode(data_bytes, HEADER_ECC_NSYM)
             return json.loads(decoded_bytes.decode('utf-8'))
         except Exception as e:
@@ -51,14 +48,12 @@ class MetadataManager:
     @staticmethod
     def encode_length_prefix(length):
         length_bytes = length.to_bytes(HEADER_LENGTH_BYTES, byteorder='big')
-        binary = bytes_to_binary(length_bytes)
-        return binary_to_dna_sequence(binary)
+        return bytes_to_dna(length_bytes)
 
     @staticmethod
     def decode_length_prefix(dna_prefix):
         if len(dna_prefix) != HEADER_LENGTH_BYTES * 4:
             raise ValueError("Invalid length prefix size")
             
-        binary = dna_sequence_to_binary(dna_prefix)
-        length_bytes = binary_to_bytes(binary)
+        length_bytes = dna_to_bytes(dna_prefix)
         return int.from_bytes(length_bytes, byteorder='big')
\ No newline at end of file
@@ -45,6 +45,16 @@ PYBIND11_MODULE(dna_native, m) {
         return dna_core::unpack_dna(bytes_to_vector(packed), length);
     }, "Unpack 2-bit bytes to DNA string");
 
+    m.def("rotating_encode", [](py::bytes input, size_t bit_length, bool block) {
+        return dna_core::rotating_encode(bytes_to_vector(input), bit_length, block);
+    }, "Rotating (homopolymer-free) encode of packed bits to DNA",
+       py::arg("data"), py::arg("bit_length"), py::arg("block")=false);
+
+    m.def("rotating_decode", [](std::string dna, size_t bit_length, bool block) {
+        return vector_to_bytes(dna_core::rotating_decode(dna, bit_length, block));
+    }, "Rotating decode of DNA to packed bits",
+       py::arg("dna"), py::arg("bit_length"), py::arg("block")=false);
+
     // Batch APIs with GIL release
     m.def("hamming_encode_batch", [](const std::vector<py::bytes>& batch, int threads) {
         std::vector<std::vector<uint8_t>> cpp_batch;
@@ -67,4 +77,88 @@ PYBIND11_MODULE(dna_native, m) {
         }
         return results;
     }, "Parallel Hamming Decode", py::arg("batch"), py::arg("threads")=0);
+
+    m.def("rotating_encode_batch", [](const std::vector<py::bytes>& batch, size_t bit_length, bool block, int threads) {
+        std::vector<std::vector<uint8_t>> cpp_batch;
+        cpp_batch.reserve(batch.size());
+        for (const auto& b : batch) cpp_batch.push_back(bytes_to_vector(b));
+
+        std::vector<std::string> results;
+        {
+            py::gil_scoped_release release;
+            results = dna_core::rotating_encode_batch(cpp_batch, bit_length, block, threads);
+        }
+        return results;
+    }, "Parallel Rotating Encode",
+       py::arg("batch"), py::arg("bit_length"), py::arg("block")=false, py::arg("threads")=0);
+
+    m.def("rotating_decode_batch", [](const std::vector<std::string>& batch, size_t bit_length, bool block, int threads) {
+        std::vector<std::vector<uint8_t>> results;
+        {
+            py::gil_scoped_release release;
+            results = dna_core::rotating_decode_batch(batch, bit_length, block, threads);
+        }
+        py::list out;
+        for (const auto& r : results) out.append(vector_to_bytes(r));
+        return out;
+    }, "Parallel Rotating Decode",
+       py::arg("batch"), py::arg("bit_length"), py::arg("block")=false, py::arg("threads")=0);
+
+    m.def("rs_encode", [](py::bytes input, int nsym) {
+        auto data = bytes_to_vector(input);
+        std::vector<uint8_t> result;
+        {
+            py::gil_scoped_release release;
+            result = dna_core::rs_encode(data, nsym);
+        }
+        return vector_to_bytes(result);
+    }, "Reed-Solomon encode (reedsolo-compatible)", py::arg("data"), py::arg("nsym")=10);
+
+    py::class_<dna_core::RSDecodeResult>(m, "RSDecodeResult")
+        .def_readonly("errata", &dna_core::RSDecodeResult::errata)
+        .def_readonly("error", &dna_core::RSDecodeResult::error)
+        .def_property_readonly("ok", [](const dna_core::RSDecodeResult& r) {
+            return r.error.empty();
+        })
+        .def_property_readonly("data", [](const dna_core::RSDecodeResult& r) {
+            return vector_to_bytes(r.data);
+        });
+
+    m.def("rs_decode", [](py::bytes input, int nsym, const std::vector<size_t>& erase_pos) {
+        auto data = bytes_to_vector(input);
+        py::gil_scoped_release release;
+        return dna_core::rs_decode(data, nsym, erase_pos);
+    }, "Reed-Solomon decode; raises RuntimeError if uncorrectable",
+       py::arg("data"), py::arg("nsym")=10, py::arg("erase_pos")=std::vector<size_t>());
+
+    m.def("rs_encode_batch", [](const std::vector<py::bytes>& batch, int nsym, int threads) {
+        std::vector<std::vector<uint8_t>> cpp_batch;
+        cpp_batch.reserve(batch.size());
+        for (const auto& b : batch) cpp_batch.push_back(bytes_to_vector(b));
+
+        std::vector<std::vector<uint8_t>> results;
+        {
+            py::gil_scoped_release release;
+            results = dna_core::rs_encode_batch(cpp_batch, nsym, threads);
+        }
+        py::list out;
+        for (const auto& r : results) out.append(vector_to_bytes(r));
+        return out;
+    }, "Parallel Reed-Solomon Encode", py::arg("batch"), py::arg("nsym")=10, py::arg("threads")=0);
+
+    m.def("rs_decode_batch", [](const std::vector<py::bytes>& batch, int nsym,
+                                const std::vector<std::vector<size_t>>& erase_pos, int threads) {
+        std::vector<std::vector<uint8_t>> cpp_batch;
+        cpp_batch.reserve(batch.size());
+        for (const auto& b : batch) cpp_batch.push_back(bytes_to_vector(b));
+
+        std::vector<dna_core::RSDecodeResult> results;
+        {
+            py::gil_scoped_release release;
+            results = dna_core::rs_decode_batch(cpp_batch, nsym, erase_pos, threads);
+        }
+        return results;
+    }, "Parallel Reed-Solomon Decode; check .ok per packet",
+       py::arg("batch"), py::arg("nsym")=10, py::arg("erase_pos")=std::vector<std::vector<size_t>>(),
+       py::arg("threads")=0);
 }
\ No newline at end of file
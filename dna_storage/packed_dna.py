@@ -0,0 +1,143 @@
+from .binary_to_dna import BASES, bytes_to_dna, dna_to_bytes
+
+try:
+    from .native import dna_native
+    CPP_AVAILABLE = True
+except ImportError:
+    CPP_AVAILABLE = False
+
+def pack(dna_sequence):
+    """ACGT str -> 2-bit packed bytes (A=00, T=01, C=10, G=11, MSB first, tail zero padded)."""
+    if CPP_AVAILABLE:
+        return dna_native.pack_dna(dna_sequence)
+    padding = -len(dna_sequence) % 4
+    return dna_to_bytes(dna_sequence + 'A' * padding)
+
+def unpack(data, length):
+    """Inverse of pack: the first `length` bases of packed data."""
+    if CPP_AVAILABLE:
+        return dna_native.unpack_dna(bytes(data[:(length + 3) // 4]), length)
+    return bytes_to_dna(data[:(length + 3) // 4])[:length]
+
+class PackedDNA:
+    """
+    DNA sequence stored at 2 bits per base in a bytearray, a quarter of the
+    memory of the equivalent str. Supports len(), indexing, slicing (which
+    returns PackedDNA) and str() export. Bits past the last base are always
+    zero, so two sequences are equal exactly when their bytes are.
+
+    Uses the same bit mapping as the baseline encoding, so the packed form of
+    a baseline-encoded chunk is the ECC-encoded packet itself.
+    """
+    # _cache_token keys this sequence in chunk caches; extend() drops it
+    __slots__ = ('_data', '_length', '_cache_token')
+
+    def __init__(self, data=b'', length=None):
+        self._data = bytearray(data)
+        self._length = len(self._data) * 4 if length is None else length
+        self._cache_token = None
+        if self._length > len(self._data) * 4:
+            raise ValueError("Length exceeds packed data")
+        del self._data[(self._length + 3) // 4:]
+        self._clear_tail()
+
+    @classmethod
+    def from_buffer(cls, buffer, length):
+        """
+        Wraps packed bytes (e.g. an mmap) without copying. Slices copy only
+        the bytes they cover; extend() copies the buffer first. Bits past
+        `length` must already be zero.
+        """
+        sequence = cls.__new__(cls)
+        sequence._data = memoryview(buffer)[:(length + 3) // 4]
+        sequence._length = length
+        sequence._cache_token = None
+        if length > len(sequence._data) * 4:
+            raise ValueError("Length exceeds packed data")
+        return sequence
+
+    @classmethod
+    def from_str(cls, dna_sequence):
+        if isinstance(dna_sequence, PackedDNA):
+            return dna_sequence
+        return cls(pack(dna_sequence), len(dna_sequence))
+
+    def _clear_tail(self):
+        used = self._length % 4
+        if used:
+            self._data[-1] &= (0xFF << (8 - 2 * used)) & 0xFF
+
+    def tobytes(self):
+        """Packed bytes, (len + 3) // 4 of them."""
+        return bytes(self._data)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return unpack(self._data, self._length)
+
+    def __repr__(self):
+        preview = unpack(self._data, min(self._length, 32))
+        return f"PackedDNA({preview!r}{'...' if self._length > 32 else ''}, length={self._length})"
+
+    def __eq__(self, other):
+        if isinstance(other, PackedDNA):
+            return self._length == other._length and self._data == other._data
+        if isinstance(other, str):
+            return self._length == len(other) and str(self) == other
+        return NotImplemented
+
+    # Mutable (extend), so not hashable
+    __hash__ = None
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return PackedDNA.from_str(str(self)[key])
+            return self._slice(start, max(start, stop))
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("PackedDNA index out of range")
+        return BASES[(self._data[key // 4] >> (6 - 2 * (key % 4))) & 3]
+
+    def _slice(self, start, stop):
+        length = stop - start
+        first, end = start // 4, (stop + 3) // 4
+        shift = 2 * (start % 4)
+        if shift == 0:
+            return PackedDNA(self._data[first:end], length)
+        # Unaligned start: shift the covering bytes left as one integer
+        window = self._data[first:end]
+        value = (int.from_bytes(window, byteorder='big') << shift) & ((1 << (8 * len(window))) - 1)
+        out_bytes = (length + 3) // 4
+        value >>= 8 * (len(window) - out_bytes)
+        return PackedDNA(value.to_bytes(out_bytes, byteorder='big'), length)
+
+    def __add__(self, other):
+        result = PackedDNA(self._data, self._length)
+        result.extend(other)
+        return result
+
+    def extend(self, other):
+        """Appends a PackedDNA or ACGT str in place."""
+        other = PackedDNA.from_str(other)
+        if not isinstance(self._data, bytearray):
+            self._data = bytearray(self._data)
+        used = self._length % 4
+        if used == 0:
+            self._data += other._data
+        elif other._length:
+            # Shift the appended bits right so they continue the partial last byte
+            shift = 2 * used
+            value = int.from_bytes(other._data, byteorder='big')
+            nbytes = len(other._data) + 1
+            value = (value << (8 - shift)) | (self._data[-1] << (8 * (nbytes - 1)))
+            merged = value.to_bytes(nbytes, byteorder='big')
+            self._data[-1:] = merged
+        self._length += other._length
+        del self._data[(self._length + 3) // 4:]
+        self._clear_tail()
+        self._cache_token = None
@@ -1,19 +1,368 @@
 from .file_ops import DNAStorage
 from .chunking import ChunkManager
 from .metadata import MetadataManager
-from .addressing import AddressIndexer
-from .encoding_strategies import get_strategy
 from .checkpoint import CheckpointManager
+from .failures import DNAStorageError, FailureType
+from .io_stages import BLOCK_SIZE, QUEUE_DEPTH, ReadAhead, WriteBehind
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import contextlib
+import json
 import math
+import threading
+
+# Largest net insertion/deletion shift, in bases, a resync searches for
+DEFAULT_MAX_SHIFT = 16
+
+def _read_exact(stream, size):
+    """Reads `size` items, looping over short reads; returns less only at EOF."""
+    data = stream.read(size)
+    while data and len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+def _as_text(data):
+    """DNA text from a block read off a text or binary stream (str, PackedDNA or bytes-like)."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data).decode('ascii')
+    return str(data)
+
+def _readinto_exact(stream, buffer):
+    """
+    Fills a writable memoryview from a binary stream, looping over short
+    reads; returns the number of bytes read (less than len(buffer) only at EOF).
+    """
+    readinto = getattr(stream, 'readinto', None)
+    if readinto is None:
+        data = _read_exact(stream, len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    total = 0
+    while total < len(buffer):
+        count = readinto(buffer[total:])
+        if not count:
+            break
+        total += count
+    return total
+
+def _header_dna(storage, total_chunks):
+    """Length prefix and header for an archive of total_chunks chunks coded as in storage."""
+    ecc_params = {"nsym": storage.nsym} if storage.ecc_method == 'rs' else {}
+    header_dna = MetadataManager.create_header_dna(
+        storage.ecc_method, ecc_params, storage.chunk_size, total_chunks,
+        storage.constraints, storage.encoding_name
+    )
+    return MetadataManager.encode_length_prefix(len(header_dna)) + header_dna
+
+def _configure_from_header(storage, header_dna):
+    """Configures storage from an archive header; returns (total_chunks, chunk DNA length)."""
+    metadata = MetadataManager.parse_header_dna(header_dna)
+    storage._configure(metadata)
+    return metadata.get('total_chunks', 0), storage._indexer().calculate_chunk_dna_length()
+
+def _payload(packet_bytes, index):
+    """The payload of a decoded packet if it is chunk `index` with a valid CRC, else None."""
+    if packet_bytes is None:
+        return None
+    try:
+        idx, data, nonce = ChunkManager.parse_chunk(packet_bytes)
+    except (ValueError, DNAStorageError):
+        return None
+    return data if idx == index else None
+
+def _encode_window(storage, data, first):
+    """DNA text of one window of input bytes, and the nonce retry counts it took."""
+    storage.retry_histogram = Counter()
+    packets = list(ChunkManager.iter_chunks(data, storage.chunk_size, start_index=first))
+    return "".join(storage.encode_packets(packets)), storage.retry_histogram
+
+def _decode_window(storage, dna, first, chunk_len):
+    """
+    Payloads of the whole chunks in one window of DNA text, assumed to start
+    at chunk `first`; None from the first chunk that fails on.
+    """
+    segments = [dna[j:j + chunk_len] for j in range(0, len(dna) - chunk_len + 1, chunk_len)]
+    payloads = [_payload(packet, i) for i, packet in enumerate(storage._try_decode_batch(segments), first)]
+    if None in payloads:
+        payloads = payloads[:payloads.index(None)] + [None]
+    return payloads
+
+def _first_valid(storage, index, candidates):
+    """
+    Decodes candidate (segment, tag) pairs as one batch; returns
+    (payload, tag) of the first that is chunk `index`, or (None, None).
+    """
+    packets = storage._try_decode_batch([segment for segment, tag in candidates])
+    for (segment, tag), packet in zip(candidates, packets):
+        data = _payload(packet, index)
+        if data is not None:
+            return data, tag
+    return None, None
+
+def _resync(storage, dna, pos, index, total_chunks, chunk_len, max_shift):
+    """
+    Recovers chunk `index`, which failed to decode at dna[pos:]. Returns
+    (payload or None, start of the next chunk, 'resynced'/'repaired'/None).
+    """
+    shifts = sorted((d for d in range(-max_shift, max_shift + 1) if d), key=abs)
+
+    def segments(start, deltas):
+        return [(dna[start + d:start + d + chunk_len], d) for d in deltas
+                if start + d >= 0 and start + d + chunk_len <= len(dna)]
+
+    # An indel in an earlier chunk that still decoded shifted this whole chunk
+    data, shift = _first_valid(storage, index, segments(pos, shifts))
+    if data is not None:
+        return data, pos + shift + chunk_len, 'resynced'
+
+    # Otherwise the indel is inside this chunk: the next chunk shows by how much
+    if index + 1 < total_chunks:
+        found, shift = _first_valid(storage, index + 1, segments(pos + chunk_len, [0] + shifts))
+        if found is None or shift == 0:
+            return None, pos + chunk_len, None
+        candidate_shifts = [shift]
+        next_start = pos + chunk_len + shift
+    else:
+        candidate_shifts = [d for d in shifts if pos + chunk_len + d <= len(dna)]
+        next_start = pos + chunk_len
+
+    # Undo the indel with one edit
+    if storage._supports_erasures():
+        # Editing every `step` bases leaves the bases between the edit and the
+        # real indel misaligned, at most two bytes, which RS corrects.
+        step = max(1, math.ceil(8 / storage.strategy.bits_per_base()))
+        fills = 'A'
+    else:
+        # Weaker codes, or strategies where a misaligned base affects the
+        # whole packet, need the exact edit: every position and base
+        step = 1
+        fills = 'ACGT'
+    candidates = []
+    for shift in candidate_shifts:
+        segment = dna[pos:pos + chunk_len + shift]
+        for q in range(0, len(segment) + 1, step):
+            if shift > 0:
+                candidates.append((segment[:q] + segment[q + shift:], shift))
+            else:
+                candidates.extend((segment[:q] + base * -shift + segment[q:], shift) for base in fills)
+    data, shift = _first_valid(storage, index, [(c, d) for c, d in candidates if len(c) == chunk_len])
+    return data, next_start, 'repaired' if data is not None else None
+
+# The stream decoders below are generators, so StreamPipeline and
+# AsyncStreamPipeline share them and differ only in how they serve these
+# requests:
+#     ('read', size)          -> str, shorter only at EOF
+#     ('submit', func, *args) -> a future of func(storage, *args)
+#     ('result', future)      -> its result
+#     ('write', data)         -> None
+
+def _header_steps():
+    """Reads the length prefix and header; returns the header DNA."""
+    prefix_len = 16
+    prefix_dna = yield ('read', prefix_len)
+    if len(prefix_dna) < prefix_len:
+        raise ValueError("Stream too short for prefix")
+    header_len = MetadataManager.decode_length_prefix(prefix_dna)
+    header_dna = yield ('read', header_len)
+    if len(header_dna) < header_len:
+        raise ValueError("Stream too short for header")
+    return header_dna
+
+def _decode_steps(total_chunks, chunk_len, chunk_size, window, max_in_flight, max_shift, stats):
+    """
+    Decodes the chunks after the header, window chunks per job with at most
+    max_in_flight jobs in flight, and writes them in order. Counts resynced,
+    repaired and lost chunks in stats; returns the indices of the lost ones.
+    """
+    lost = []
+    buffer = ''         # DNA text from stream position `base` on
+    base = 0
+    at_eof = False
+    pos = 0             # stream position of the next window to dispatch
+    next_chunk = 0      # its first chunk
+    written = 0         # next chunk to write
+    in_flight = deque() # (first chunk, position, future), in stream order
+
+    def fill(end):
+        nonlocal buffer, at_eof
+        wanted = end - base - len(buffer)
+        if wanted > 0 and not at_eof:
+            more = yield ('read', wanted)
+            at_eof = len(more) < wanted
+            buffer += more
+
+    try:
+        while written < total_chunks:
+            while next_chunk < total_chunks and len(in_flight) < max_in_flight:
+                count = min(window, total_chunks - next_chunk)
+                yield from fill(pos + chunk_len * count)
+                text = buffer[pos - base:pos - base + chunk_len * count]
+                future = yield ('submit', _decode_window, text, next_chunk, chunk_len)
+                in_flight.append((next_chunk, pos, future))
+                next_chunk += count
+                pos += chunk_len * count
+
+            first, start, future = in_flight.popleft()
+            payloads = yield ('result', future)
+            if None in payloads:
+                payloads = payloads[:payloads.index(None)]
+            if payloads:
+                yield ('write', b''.join(payloads))
+                written += len(payloads)
+            window_end = in_flight[0][0] if in_flight else next_chunk
+            if written == window_end:
+                # Only text from the oldest window still in flight on is needed
+                keep = in_flight[0][1] if in_flight else pos
+                buffer = buffer[keep - base:]
+                base = keep
+                continue
+
+            # Chunk `written` failed, or the stream ends inside it. Windows
+            # after it were cut at stale positions, so they are dropped.
+            for _, _, later in in_flight:
+                later.cancel()
+            in_flight.clear()
+            failed_at = start + (written - first) * chunk_len
+            end = failed_at + 2 * chunk_len + max_shift
+            yield from fill(end)
+            if base + len(buffer) - failed_at < chunk_len - max_shift:
+                raise ValueError(f"Stream truncated at chunk {written}")
+            # The search only looks max_shift bases behind and two chunks ahead
+            lo = max(base, failed_at - max_shift)
+            future = yield ('submit', _resync, buffer[lo - base:end - base], failed_at - lo, written,
+                            total_chunks, chunk_len, max_shift)
+            data, resume, outcome = yield ('result', future)
+            if outcome:
+                stats[outcome] += 1
+            if data is None:
+                lost.append(written)
+                stats['lost'] += 1
+                # Keep later chunks at their offsets; only the last chunk can be short
+                data = bytes(chunk_size if written < total_chunks - 1 else 0)
+            yield ('write', data)
+            written += 1
+            next_chunk = written
+            pos = lo + resume
+    finally:
+        for _, _, future in in_flight:
+            future.cancel()
+    return lost
+
+def _raise_if_lost(lost):
+    if lost:
+        preview = ', '.join(map(str, lost[:10])) + (', ...' if len(lost) > 10 else '')
+        raise DNAStorageError(f"{len(lost)} chunks could not be recovered (written as zeros): {preview}",
+                              FailureType.MISSING_DATA)
+
+# Storages rebuilt in a worker, by configuration. Per thread, so thread
+# pool workers never share one (encode_packets updates its retry_histogram).
+_worker_storages = threading.local()
+
+def _run_in_worker(config, func, *args):
+    key = json.dumps(config, sort_keys=True)
+    storages = _worker_storages.__dict__
+    storage = storages.get(key)
+    if storage is None:
+        storage = storages[key] = DNAStorage(**config)
+    return func(storage, *args)
 
 class StreamPipeline:
-    def __init__(self, storage):
+    """
+    Streams files to and from DNA one window of chunks at a time.
+
+    decode_stream recovers from insertions and deletions: a chunk that fails
+    at its expected position is searched for up to max_shift bases either
+    side. If it was damaged by the indel itself, it is repaired by a single
+    edit once the next chunk shows the shift. Chunks that cannot be recovered
+    are written as zeros and reported when the stream ends. Chunks that
+    decode in place cost nothing extra.
+
+    workers > 1 encodes and decodes windows in a process pool of that size.
+    To share a pool between pipelines, pass it as `executor`, with workers
+    set to its size. At most max_in_flight windows (default 2 per worker)
+    are read ahead of the writer, and results are written in input order.
+    Each worker runs native batches single-threaded, since the pool already
+    uses the cores.
+
+    staged=True moves stream I/O onto a reader and a writer thread (see
+    io_stages). They read and write io_block_size at a time, with at most
+    queue_depth blocks queued each way. Reads and writes then overlap the
+    encoding, which runs with the GIL released on the C++ backend.
+    """
+    def __init__(self, storage, window=None, max_shift=DEFAULT_MAX_SHIFT, workers=1, max_in_flight=None,
+                 executor=None, staged=False, io_block_size=BLOCK_SIZE, queue_depth=QUEUE_DEPTH):
         self.storage = storage
+        # Chunks read, encoded (as one batch) and written per step
+        self.window = window or storage.batch_size
+        self.max_shift = max_shift
+        self.workers = workers
+        self.executor = executor
+        self.max_in_flight = max_in_flight or (2 * workers if self._parallel() else 1)
+        self.staged = staged
+        self.io_block_size = io_block_size
+        self.queue_depth = queue_depth
+        # resynced, repaired, lost (chunks) in the last decode_stream
+        self.stats = Counter()
+
+    def _parallel(self):
+        return self.executor is not None or self.workers > 1
+
+    def _submitter(self):
+        """
+        (submit, shutdown): submit(func, *args) runs func(storage, *args) and
+        returns a Future, in the pool when running in parallel.
+        """
+        if not self._parallel():
+            def submit(func, *args):
+                future = Future()
+                future.set_result(func(self.storage, *args))
+                return future
+            return submit, lambda: None
+        config = dict(self.storage._config(), threads=1)
+        executor = self.executor or ProcessPoolExecutor(self.workers)
+
+        def submit(func, *args):
+            return executor.submit(_run_in_worker, config, func, *args)
+
+        def shutdown():
+            if executor is not self.executor:
+                executor.shutdown(cancel_futures=True)
+        return submit, shutdown
+
+    @contextlib.contextmanager
+    def _staged_io(self, in_stream, out_stream):
+        """The streams to use: the given ones, or reader/writer stages around them when staged."""
+        if not self.staged:
+            yield in_stream, out_stream
+            return
+        reader = ReadAhead(in_stream, self.io_block_size, self.queue_depth)
+        writer = WriteBehind(out_stream, self.io_block_size, self.queue_depth)
+        try:
+            yield reader, writer
+        except BaseException:
+            writer.abort()
+            raise
+        else:
+            writer.close()
+        finally:
+            reader.close()
+
+    @staticmethod
+    def _save_checkpoint(out_stream, cp, state):
+        """Saves state once everything written so far is out (on the writer thread when staged)."""
+        if isinstance(out_stream, WriteBehind):
+            out_stream.then(lambda: cp.save(state))
+        else:
+            cp.save(state)
 
     def encode_stream(self, in_stream, out_stream, file_size=None, checkpoint_path=None):
         chunk_size = self.storage.chunk_size
         
         start_chunk = 0
+        cp = None
         if checkpoint_path:
             cp = CheckpointManager(checkpoint_path)
             state = cp.load()
@@ -35,80 +384,93 @@ class StreamPipeline:
                     raise ValueError("file_size must be provided for non-seekable streams")
 
             total_chunks = math.ceil(file_size / chunk_size) if file_size > 0 else 0
-            
-            ecc_params = {"nsym": self.storage.nsym} if self.storage.ecc_method == 'rs' else {}
-            header_dna = MetadataManager.create_header_dna(
-                self.storage.ecc_method, ecc_params, chunk_size, total_chunks,
-                self.storage.constraints, self.storage.encoding_name
-            )
-            prefix_dna = MetadataManager.encode_length_prefix(len(header_dna))
-            
-            out_stream.write(prefix_dna)
-            out_stream.write(header_dna)
+            out_stream.write(_header_dna(self.storage, total_chunks))
         
-        idx = start_chunk
+        with self._staged_io(in_stream, out_stream) as (in_stream, out_stream):
+            if self._parallel():
+                self._encode_parallel(in_stream, out_stream, start_chunk, cp)
+            else:
+                self._encode_serial(in_stream, out_stream, start_chunk, cp)
+
+    def _encode_serial(self, in_stream, out_stream, idx, cp):
+        chunk_size = self.storage.chunk_size
+        # One input buffer reused for every window; chunks are views into it
+        buffer = memoryview(bytearray(chunk_size * self.window))
         while True:
-            data = in_stream.read(chunk_size)
-            if not data:
+            size = _readinto_exact(in_stream, buffer)
+            if not size:
                 break
             
-            actual_len = len(data)
-            if actual_len < chunk_size:
-                padding = b'\x00' * (chunk_size - actual_len)
-                payload = data + padding
-            else:
-                payload = data
-            
-            chunk = ChunkManager.pack_chunk(idx, payload, actual_len, nonce=0)
+            packets = list(ChunkManager.iter_chunks(buffer[:size], chunk_size, start_index=idx))
             
-            dna = self.storage.encode_packet_with_constraints(chunk)
+            dna = self.storage.encode_packets(packets)
             
-            out_stream.write(dna)
-            idx += 1
+            out_stream.write("".join(dna))
+            idx += len(packets)
             
-            if checkpoint_path and idx % 100 == 0:
-                cp.save({"processed_chunks": idx})
+            if cp:
+                self._save_checkpoint(out_stream, cp, {"processed_chunks": idx})
+
+    def _encode_parallel(self, in_stream, out_stream, idx, cp):
+        """Encodes windows in the pool; the oldest in-flight window is always written next."""
+        submit, shutdown = self._submitter()
+        in_flight = deque()
+        size = self.storage.chunk_size * self.window
+        try:
+            while True:
+                data = _read_exact(in_stream, size)
+                if data:
+                    future = submit(_encode_window, data, idx)
+                    idx += -(-len(data) // self.storage.chunk_size)
+                    in_flight.append((future, idx))
+                if in_flight and (len(in_flight) >= self.max_in_flight or not data):
+                    future, end = in_flight.popleft()
+                    dna, retries = future.result()
+                    out_stream.write(dna)
+                    self.storage.retry_histogram.update(retries)
+                    if cp:
+                        self._save_checkpoint(out_stream, cp, {"processed_chunks": end})
+                if not data and not in_flight:
+                    break
+        finally:
+            shutdown()
 
     def decode_stream(self, in_stream, out_stream):
-        prefix_len = 16
-        prefix_dna = in_stream.read(prefix_len)
-        if len(prefix_dna) < prefix_len:
-            raise ValueError("Stream too short for prefix")
-            
-        header_len = MetadataManager.decode_length_prefix(prefix_dna)
-        
-        header_dna = in_stream.read(header_len)
-        if len(header_dna) < header_len:
-            raise ValueError("Stream too short for header")
-            
-        metadata = MetadataManager.parse_header_dna(header_dna)
-        
-        self.storage.ecc_method = metadata.get('ecc', 'rs')
-        params = metadata.get('ecc_params', {})
-        if self.storage.ecc_method == 'rs':
-            self.storage.nsym = params.get('nsym', 10)
-        self.storage.chunk_size = metadata.get('chunk_size', 128)
-        self.storage.constraints = metadata.get('constraints', {})
-        self.storage.encoding_name = metadata.get('encoding', 'baseline')
-        self.storage.strategy = get_strategy(self.storage.encoding_name)
+        # in_stream.read() may return str, PackedDNA (e.g. Dna2File.reader()) or ASCII bytes
+        header_dna = self._serve(_header_steps(), in_stream, out_stream)
+        total_chunks, chunk_len = _configure_from_header(self.storage, header_dna)
         
-        total_chunks = metadata.get('total_chunks', 0)
-        
-        indexer = AddressIndexer(
-            self.storage.chunk_size, self.storage.ecc_method, 
-            {"nsym": self.storage.nsym}, self.storage.strategy.bits_per_base()
-        )
-        chunk_len = indexer.calculate_chunk_dna_length()
-        
-        for i in range(total_chunks):
-            chunk_dna = in_stream.read(chunk_len)
-            if len(chunk_dna) < chunk_len:
-                raise ValueError(f"Stream truncated at chunk {i}")
-            
-            packet_bytes = self.storage.decode_packet(chunk_dna)
-            idx, data, nonce = ChunkManager.parse_chunk(packet_bytes)
-            
-            if idx != i:
-                raise ValueError(f"Index mismatch: {idx} != {i}")
-                
-            out_stream.write(data)
\ No newline at end of file
+        self.stats = Counter()
+        with self._staged_io(in_stream, out_stream) as (in_stream, out_stream):
+            submit, shutdown = self._submitter()
+            try:
+                lost = self._serve(_decode_steps(total_chunks, chunk_len, self.storage.chunk_size, self.window,
+                                                 self.max_in_flight, self.max_shift, self.stats),
+                                   in_stream, out_stream, submit)
+            finally:
+                shutdown()
+        _raise_if_lost(lost)
+
+    @staticmethod
+    def _serve(steps, in_stream, out_stream, submit=None):
+        """Runs a decode generator (see _decode_steps) against blocking streams; returns its result."""
+        result = None
+        try:
+            while True:
+                try:
+                    request = steps.send(result)
+                except StopIteration as stop:
+                    return stop.value
+                kind = request[0]
+                result = None
+                if kind == 'read':
+                    result = _as_text(_read_exact(in_stream, request[1]))
+                elif kind == 'submit':
+                    result = submit(*request[1:])
+                elif kind == 'result':
+                    result = request[1].result()
+                else:
+                    out_stream.write(request[1])
+        finally:
+            # Cancels whatever the generator still has in flight
+            steps.close()
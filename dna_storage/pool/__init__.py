@@ -0,0 +1,6 @@
+from .reads import iter_reads, reverse_complement, write_fasta
+from .decoder import PoolDecoder, decode_pool, to_oligos
+from .cluster import ReadClusterer, consensus, decode_clustered
+
+__all__ = ['PoolDecoder', 'ReadClusterer', 'consensus', 'decode_clustered', 'decode_pool', 'iter_reads',
+           'reverse_complement', 'to_oligos', 'write_fasta']
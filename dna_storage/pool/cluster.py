@@ -0,0 +1,511 @@
+"""
+Read clustering and consensus for high-coverage pools.
+
+Reads are streamed to spill files on disk, partitioned by an
+orientation-independent key made from their two ends. A forward read and
+a reverse-complemented copy of the same oligo get the same key, and every
+read is stored in the orientation that produced it. Each partition is
+then bucketed by key in a worker process, which leaves the parent one
+representative per bucket instead of every read.
+
+Buckets are matched in candidate groups: buckets sharing an end, then
+clusters sharing a MinHash band over canonical k-mers. Each group is
+checked in a worker, and a candidate is joined only if its Hamming
+distance to a group leader is small in one orientation. Each cluster then
+collapses to one per-position (optionally quality-weighted) majority
+sequence, so ECC decoding runs once per chunk instead of once per read.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import zlib
+from array import array
+from operator import ne
+from .decoder import PoolDecoder
+from .reads import iter_reads, reverse_complement
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_CODE = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+_MASK64 = (1 << 64) - 1
+if NUMPY_AVAILABLE:
+    _BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+    # ASCII -> 2-bit code, 4 for anything but ACGT
+    _CODE_TABLE = np.full(256, 4, dtype=np.uint8)
+    _CODE_TABLE[_BASES] = np.arange(4, dtype=np.uint8)
+# Smallest bucket whose consensus can outweigh one stray read
+_MIN_LEADER = 3
+# Bands shared by more clusters than this come from k-mers common to many
+# oligos (e.g. the high bytes of the chunk index) and are not candidates
+_MAX_BAND_GROUP = 64
+
+def _hash_params(num_hashes):
+    """Deterministic (a, b) pairs for multiply-shift hashing, identical in every process."""
+    params = []
+    for i in range(num_hashes):
+        a = zlib.crc32(b'a%d' % i) << 32 | zlib.crc32(b'A%d' % i) | 1
+        b = zlib.crc32(b'b%d' % i) << 32 | zlib.crc32(b'B%d' % i)
+        params.append((a, b))
+    return params
+
+def canonical_kmers(sequence, k):
+    """Set of k-mers as 2k-bit integers, each the smaller of itself and its reverse complement."""
+    mask = (1 << (2 * k)) - 1
+    shift = 2 * (k - 1)
+    forward = reverse = 0
+    valid = 0
+    kmers = set()
+    for base in sequence:
+        code = _CODE.get(base)
+        if code is None:
+            valid = 0
+            continue
+        forward = ((forward << 2) | code) & mask
+        reverse = (reverse >> 2) | ((3 - code) << shift)
+        valid += 1
+        if valid >= k:
+            kmers.add(min(forward, reverse))
+    return kmers
+
+def _canonical_kmer_array(sequence, k):
+    """canonical_kmers as a NumPy array, from sliding windows instead of a Python loop (k <= 32)."""
+    codes = _CODE_TABLE[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+    if len(codes) < k:
+        return np.zeros(0, dtype=np.uint64)
+    windows = np.lib.stride_tricks.sliding_window_view(codes, k)
+    windows = windows[(windows < 4).all(axis=1)].astype(np.uint64)
+    weights = np.uint64(4) ** np.arange(k - 1, -1, -1, dtype=np.uint64)
+    forward = windows @ weights
+    reverse = (np.uint64(3) - windows) @ weights[::-1]
+    return np.unique(np.minimum(forward, reverse))
+
+def minhash(sequence, k, params):
+    """MinHash signature of a sequence's canonical k-mers (the same for both strands)."""
+    if NUMPY_AVAILABLE and k <= 32:
+        x = _canonical_kmer_array(sequence, k)
+        if not len(x):
+            return tuple(0 for _ in params)
+        # uint64 arithmetic wraps, matching the & _MASK64 below
+        a = np.array([a for a, _ in params], dtype=np.uint64)[:, None]
+        b = np.array([b for _, b in params], dtype=np.uint64)[:, None]
+        return tuple(int(v) for v in ((a * x + b) >> np.uint64(32)).min(axis=1))
+    kmers = canonical_kmers(sequence, k)
+    if not kmers:
+        return tuple(0 for _ in params)
+    return tuple(min(((a * x + b) & _MASK64) >> 32 for x in kmers) for a, b in params)
+
+def _votes(reads, qualities=None):
+    """
+    Per-position votes of equal-length reads as a (length, 4) table in ACGT
+    order. Each base votes 1, or its Phred score + 1 with qualities; other
+    characters do not vote.
+    """
+    if NUMPY_AVAILABLE:
+        columns = np.frombuffer(''.join(reads).encode('ascii'), dtype=np.uint8).reshape(len(reads), -1)
+        if qualities is None:
+            return np.stack([(columns == base).sum(axis=0) for base in _BASES], axis=1)
+        weights = np.frombuffer(''.join(qualities).encode('ascii'), dtype=np.uint8).reshape(len(reads), -1)
+        weights = weights.astype(np.int64) - 32
+        return np.stack([((columns == base) * weights).sum(axis=0) for base in _BASES], axis=1)
+    table = [[0, 0, 0, 0] for _ in reads[0]]
+    for n, read in enumerate(reads):
+        weights = qualities[n] if qualities is not None else None
+        for i, base in enumerate(read):
+            code = _CODE.get(base)
+            if code is not None:
+                table[i][code] += ord(weights[i]) - 32 if weights is not None else 1
+    return table
+
+def _flip(table):
+    """Votes of the reverse complement: rows reversed, A<->T and C<->G swapped."""
+    if NUMPY_AVAILABLE:
+        return table[::-1, ::-1]
+    return [row[::-1] for row in reversed(table)]
+
+def _add(total, table):
+    if total is None:
+        return table.copy() if NUMPY_AVAILABLE else [row[:] for row in table]
+    if NUMPY_AVAILABLE:
+        total += table
+    else:
+        for row, other in zip(total, table):
+            for code in range(4):
+                row[code] += other[code]
+    return total
+
+def _call(table, weighted):
+    """The majority base of each position; with weights, 'N' where nothing voted."""
+    if NUMPY_AVAILABLE:
+        called = _BASES[table.argmax(axis=1)]
+        if weighted:
+            called = np.where(table.sum(axis=1) > 0, called, ord('N')).astype(np.uint8)
+        return called.tobytes().decode('ascii')
+    out = []
+    for row in table:
+        best = max(range(4), key=row.__getitem__)
+        out.append('N' if weighted and not row[best] else 'ACGT'[best])
+    return ''.join(out)
+
+def consensus(reads, qualities=None):
+    """
+    Per-position majority of equal-length reads in the same orientation.
+    qualities: optional FASTQ quality strings; each base then votes with
+    its Phred score instead of 1.
+    """
+    if len(reads) == 1:
+        return reads[0]
+    if qualities is not None and any(q is None for q in qualities):
+        qualities = None
+    return _call(_votes(reads, qualities), qualities is not None)
+
+def _orientation(leader, read, max_mismatch):
+    """False/True if read matches leader as is/reverse complemented, None if neither is close."""
+    if len(leader) != len(read):
+        return None
+    limit = max_mismatch * len(leader)
+    if sum(map(ne, leader, read)) <= limit:
+        return False
+    if sum(map(ne, leader, reverse_complement(read))) <= limit:
+        return True
+    return None
+
+def _read_spill(path):
+    """(sequence, quality or None) of each read in a spill file."""
+    with open(path) as f:
+        for line in f:
+            sequence, quality = line.rstrip('\n').split('\t')
+            yield sequence, quality or None
+
+def _summarize_worker(args):
+    """
+    Buckets one spill file by exact key. Returns (representative, size)
+    per bucket and saves each read's bucket number next to the file.
+
+    A bucket can hold a stray read whose error made its end key another
+    oligo's, so each is represented by its consensus (or first read, if too
+    small for a vote) and reads far from it become buckets of their own,
+    after the others.
+    """
+    path, prefix, max_mismatch = args
+    reads = [sequence for sequence, _ in _read_spill(path)]
+    buckets = {}
+    for n, sequence in enumerate(reads):
+        buckets.setdefault((len(sequence), sequence[:prefix]), []).append(n)
+    members = array('i', bytes(4 * len(reads)))
+    summary = []
+    strays = []
+    for positions in buckets.values():
+        group = [reads[n] for n in positions]
+        representative = group[0] if len(group) < _MIN_LEADER else consensus(group)
+        limit = max_mismatch * len(representative)
+        keep = [n for n in positions if sum(map(ne, representative, reads[n])) <= limit]
+        if len(keep) < len(positions):
+            kept = set(keep)
+            strays.extend(n for n in positions if n not in kept)
+            if len(keep) >= _MIN_LEADER:
+                representative = consensus([reads[n] for n in keep])
+            elif keep:
+                representative = reads[keep[0]]
+        if keep:
+            for n in keep:
+                members[n] = len(summary)
+            summary.append((representative, len(keep)))
+    for n in strays:
+        members[n] = len(summary)
+        summary.append((reads[n], 1))
+    with open(path + '.buckets', 'wb') as f:
+        members.tofile(f)
+    return summary
+
+def _signature_worker(args):
+    sequences, k, num_hashes = args
+    params = _hash_params(num_hashes)
+    return [minhash(sequence, k, params) for sequence in sequences]
+
+def _match_worker(args):
+    """
+    Greedy leader matching inside candidate groups. A group is (members,
+    searching): members are (bucket id, sequence), largest first, and the
+    ones before index `searching` lead without looking for a match.
+    Returns (id, leader id, flipped) edges.
+    """
+    groups, max_mismatch = args
+    edges = []
+    for members, searching in groups:
+        leaders = list(members[:searching])
+        for i, sequence in members[searching:]:
+            for j, leader in leaders:
+                flipped = _orientation(leader, sequence, max_mismatch)
+                if flipped is not None:
+                    edges.append((i, j, flipped))
+                    break
+            else:
+                leaders.append((i, sequence))
+    return edges
+
+def _votes_worker(args):
+    """Vote tables of one spill file summed per cluster; assignment holds (cluster, flipped) per bucket."""
+    path, assignment, weighted = args
+    members = array('i')
+    with open(path + '.buckets', 'rb') as f:
+        members.frombytes(f.read())
+    buckets = {}
+    for number, (sequence, quality) in zip(members, _read_spill(path)):
+        bucket = buckets.setdefault(number, ([], []))
+        bucket[0].append(sequence)
+        bucket[1].append(quality)
+    totals = {}
+    for number, (reads, qualities) in buckets.items():
+        cluster, flipped = assignment[number]
+        table = _votes(reads, qualities if weighted else None)
+        totals[cluster] = _add(totals.get(cluster), _flip(table) if flipped else table)
+    return totals
+
+class _Components:
+    """Union-find over buckets that also tracks each bucket's orientation relative to its root."""
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.flipped = [False] * size
+
+    def find(self, i):
+        """(root, flipped relative to root)."""
+        flipped = False
+        path = []
+        while self.parent[i] != i:
+            path.append(i)
+            flipped ^= self.flipped[i]
+            i = self.parent[i]
+        # Path compression, keeping each node's orientation relative to the root
+        remaining = flipped
+        for node in path:
+            node_flipped = self.flipped[node]
+            self.parent[node], self.flipped[node] = i, remaining
+            remaining ^= node_flipped
+        return i, flipped
+
+    def union(self, a, b, flipped):
+        """Joins b to a, b matching a reverse complemented if flipped."""
+        root_a, flipped_a = self.find(a)
+        root_b, flipped_b = self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+            self.flipped[root_b] = flipped_a ^ flipped_b ^ flipped
+
+class ReadClusterer:
+    """
+    Groups reads of the same oligo and builds one consensus per group.
+
+    Usage:
+        clusterer = ReadClusterer(processes=8)
+        for name, sequence, quality in iter_reads(f):
+            clusterer.add(sequence, quality)
+        for sequence, size in clusterer.consensus():
+            ...
+        clusterer.close()
+
+    prefix: bases per end used for the exact bucket key.
+    k, num_hashes, band_size: MinHash parameters. Clusters sharing all
+    band_size values of any band become merge candidates; false candidates
+    only cost a Hamming check, so the default bands are single hashes.
+    max_mismatch: largest Hamming distance, as a fraction of the length,
+    for a bucket to join a cluster.
+    processes: worker processes for bucketing, matching and consensus
+    (None = all cores, 1 = run inline).
+    partitions: spill files the reads are split into. Each is bucketed in
+    one job, so a worker holds about 1/partitions of the reads.
+    tmpdir: where spill files go (default: the system temp directory).
+    """
+    def __init__(self, prefix=24, k=12, num_hashes=24, band_size=1, max_mismatch=0.2, processes=None,
+                 partitions=64, tmpdir=None):
+        self.prefix = prefix
+        self.k = k
+        self.num_hashes = num_hashes
+        self.band_size = band_size
+        self.max_mismatch = max_mismatch
+        self.processes = processes or os.cpu_count() or 1
+        self.partitions = partitions
+        self.tmpdir = tmpdir
+        self._spill_dir = None
+        self._spills = []
+        # Votes are Phred-weighted only if every read has a quality
+        self._weighted = True
+        self._pool = None
+
+    def add(self, sequence, quality=None):
+        sequence = sequence.upper()
+        head = sequence[:self.prefix]
+        tail = reverse_complement(sequence[-self.prefix:])
+        if tail < head:
+            sequence = reverse_complement(sequence)
+            quality = quality[::-1] if quality is not None else None
+            head = tail
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='dna-cluster-', dir=self.tmpdir)
+            self._spills = [open(os.path.join(self._spill_dir, f'{n}.reads'), 'w') for n in range(self.partitions)]
+        self._weighted = self._weighted and quality is not None
+        spill = self._spills[zlib.crc32(head.encode('ascii', 'replace')) % self.partitions]
+        spill.write(f"{sequence}\t{quality or ''}\n")
+
+    def close(self):
+        """Deletes the spill files; the clusterer can be reused afterwards."""
+        for spill in self._spills:
+            spill.close()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+        self._spill_dir = None
+        self._spills = []
+        self._weighted = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _map(self, func, items):
+        if self._pool is None or len(items) < 2:
+            return [func(item) for item in items]
+        return self._pool.map(func, items, chunksize=max(1, len(items) // (4 * self.processes)))
+
+    def _ends(self, sequence):
+        """The two end keys of a sequence; the same pair for either strand."""
+        return sequence[:self.prefix], reverse_complement(sequence[-self.prefix:])
+
+    def _band_keys(self, signature):
+        # Bands are hashed to ints to keep the index small; a collision only adds a candidate
+        return [hash((i,) + signature[i:i + self.band_size]) for i in range(0, self.num_hashes, self.band_size)]
+
+    def _batches(self, items, size):
+        return [items[n:n + size] for n in range(0, len(items), size)]
+
+    def _match_groups(self, groups, representatives, components):
+        """Checks (bucket ids, searching) candidate groups on the workers and joins the matches."""
+        batches = []
+        batch = []
+        weight = 0
+        # Batches of about 4096 members keep the pickling overhead per task low
+        for ids, searching in groups:
+            batch.append(([(i, representatives[i]) for i in ids], searching))
+            weight += len(ids)
+            if weight >= 4096:
+                batches.append((batch, self.max_mismatch))
+                batch, weight = [], 0
+        if batch:
+            batches.append((batch, self.max_mismatch))
+        for edges in self._map(_match_worker, batches):
+            for i, leader, flipped in edges:
+                components.union(leader, i, flipped)
+
+    def _cluster(self, paths):
+        """
+        Assigns every bucket to a cluster. Returns (assignments per spill
+        file as (cluster, flipped) per bucket, reads per cluster).
+        """
+        summaries = self._map(_summarize_worker, [(path, self.prefix, self.max_mismatch) for path in paths])
+        counts = [len(summary) for summary in summaries]
+        representatives = []
+        sizes = []
+        end_index = {}
+        for summary in summaries:
+            for representative, size in summary:
+                for end in self._ends(representative):
+                    end_index.setdefault(end, []).append(len(representatives))
+                representatives.append(representative)
+                sizes.append(size)
+        del summaries
+        components = _Components(len(representatives))
+
+        # Pass 1: buckets sharing a clean end
+        groups = [sorted(set(group), key=lambda i: (-sizes[i], i)) for group in end_index.values() if len(group) > 1]
+        del end_index
+        self._match_groups([(group, 1) for group in groups], representatives, components)
+
+        # Pass 2: clusters too small to outvote a stray read look for one
+        # sharing a MinHash band. Each cluster is stood for by its largest bucket.
+        roots = [components.find(i)[0] for i in range(len(representatives))]
+        cluster_size = {}
+        leader = {}
+        for i, root in enumerate(roots):
+            cluster_size[root] = cluster_size.get(root, 0) + sizes[i]
+            if root not in leader or sizes[i] > sizes[leader[root]]:
+                leader[root] = i
+        if any(size < _MIN_LEADER for size in cluster_size.values()):
+            leaders = sorted(leader.values())
+            signatures = self._map(_signature_worker, [([representatives[i] for i in batch], self.k, self.num_hashes)
+                                                       for batch in self._batches(leaders, 256)])
+            bands = {}
+            for i, signature in zip(leaders, (s for batch in signatures for s in batch)):
+                for key in self._band_keys(signature):
+                    bands.setdefault(key, []).append(roots[i])
+            del signatures
+            candidates = set()
+            for clusters in bands.values():
+                if 1 < len(clusters) <= _MAX_BAND_GROUP and any(cluster_size[r] < _MIN_LEADER for r in clusters):
+                    candidates.add(tuple(sorted(set(clusters), key=lambda r: (-cluster_size[r], r))))
+            del bands
+            groups = [([leader[r] for r in group], sum(cluster_size[r] >= _MIN_LEADER for r in group))
+                      for group in sorted(candidates)]
+            self._match_groups(groups, representatives, components)
+
+        numbers = {}
+        cluster_reads = []
+        assignments = []
+        first = 0
+        for count in counts:
+            assignment = []
+            for i in range(first, first + count):
+                root, flipped = components.find(i)
+                if root not in numbers:
+                    numbers[root] = len(cluster_reads)
+                    cluster_reads.append(0)
+                cluster_reads[numbers[root]] += sizes[i]
+                assignment.append((numbers[root], flipped))
+            first += count
+            assignments.append(assignment)
+        return assignments, cluster_reads
+
+    def consensus(self):
+        """List of (consensus sequence, number of reads), largest cluster first."""
+        if self._spill_dir is None:
+            return []
+        for spill in self._spills:
+            spill.flush()
+        paths = [spill.name for spill in self._spills]
+        if self.processes > 1:
+            self._pool = multiprocessing.Pool(self.processes)
+        try:
+            assignments, sizes = self._cluster(paths)
+            totals = [None] * len(sizes)
+            args = [(path, assignment, self._weighted) for path, assignment in zip(paths, assignments)]
+            for partial in self._map(_votes_worker, args):
+                for cluster, table in partial.items():
+                    totals[cluster] = _add(totals[cluster], table)
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+        result = [(_call(table, self._weighted), size) for table, size in zip(totals, sizes)]
+        result.sort(key=lambda item: -item[1])
+        return result
+
+def decode_clustered(path, storage=None, processes=None, **cluster_options):
+    """
+    Decodes a FASTA/FASTQ file by clustering its reads and decoding one
+    consensus per cluster (see ReadClusterer and PoolDecoder).
+    """
+    with ReadClusterer(processes=processes, **cluster_options) as clusterer:
+        with open(path) as f:
+            for name, sequence, quality in iter_reads(f):
+                clusterer.add(sequence, quality)
+        sequences = [sequence for sequence, size in clusterer.consensus()]
+    decoder = PoolDecoder(storage)
+    decoder.find_header(sequences)
+    for sequence in sequences:
+        decoder.add_read(sequence)
+    return decoder.result()
@@ -0,0 +1,162 @@
+import re
+from collections import Counter
+from ..chunking import ChunkManager
+from ..failures import DNAStorageError, FailureType
+from ..file_ops import DNAStorage
+from .reads import iter_reads, reverse_complement
+
+_INVALID_BASE = re.compile('[^ACGT]')
+
+def to_oligos(dna_sequence, storage=None):
+    """
+    Splits an encoded archive into the oligos a pool would hold: one for
+    the prefix and header, then one per chunk.
+    """
+    storage = storage or DNAStorage()
+    offsets = storage.chunk_offsets(dna_sequence)
+    return [dna_sequence[:offsets[0]]] + [dna_sequence[a:b] for a, b in zip(offsets, offsets[1:])]
+
+class PoolDecoder:
+    """
+    Decodes an unordered pool of reads, in either orientation, with
+    duplicates and dropouts.
+
+    Every read is decoded on its own and its payload is placed by the chunk
+    index embedded in the packet. Memory grows with the number of distinct
+    chunks, not with the number of reads. Reads are decoded batch_size at a
+    time. A read that matches the header oligo sets total_chunks and the
+    coding parameters. Until one is seen, the storage's own parameters are
+    used, so pass a storage configured like the encoder, or put the header
+    read first.
+
+    FASTQ bases with Phred quality below min_quality are decoded as RS
+    erasures.
+    """
+    def __init__(self, storage=None, total_chunks=None, min_quality=10):
+        self.storage = storage or DNAStorage()
+        self.total_chunks = total_chunks
+        self.min_quality = min_quality
+        self.payloads = {}
+        # reads, decoded, duplicates, reverse_complement, header, wrong_length, failed
+        self.stats = Counter()
+        self._pending = []
+        self.chunk_len = self.storage._indexer().calculate_chunk_dna_length()
+
+    def add_read(self, sequence, quality=None):
+        self.stats['reads'] += 1
+        sequence = sequence.upper()
+        if len(sequence) != self.chunk_len:
+            if not (self._try_header(sequence) or self._try_header(reverse_complement(sequence))):
+                self.stats['wrong_length'] += 1
+            return
+        erased = []
+        if quality is not None and self.storage._supports_erasures():
+            erased = [i for i, q in enumerate(quality) if ord(q) - 33 < self.min_quality]
+        if _INVALID_BASE.search(sequence):
+            if self.storage._supports_erasures():
+                erased.extend(m.start() for m in _INVALID_BASE.finditer(sequence))
+            sequence = _INVALID_BASE.sub('A', sequence)
+        self._pending.append((sequence, sorted(set(erased))))
+        if len(self._pending) >= self.storage.batch_size:
+            self.flush()
+
+    def add_reads(self, stream):
+        """Adds every record of a FASTA/FASTQ text stream."""
+        for name, sequence, quality in iter_reads(stream):
+            self.add_read(sequence, quality)
+        self.flush()
+
+    def scan_header(self, stream):
+        """
+        Looks through a FASTA/FASTQ stream for the header read and configures
+        from it, without decoding anything else. Returns True if found.
+        """
+        return self.find_header(sequence for name, sequence, quality in iter_reads(stream))
+
+    def find_header(self, sequences):
+        """As scan_header, over an iterable of sequences."""
+        for sequence in sequences:
+            sequence = sequence.upper()
+            if self._try_header(sequence) or self._try_header(reverse_complement(sequence)):
+                return True
+        return False
+
+    def _try_header(self, sequence):
+        try:
+            header_end, metadata = self.storage._parse_header(sequence)
+        except ValueError:
+            return False
+        if header_end != len(sequence):
+            return False
+        # Reads buffered so far are decoded with the parameters they were queued under
+        self.flush()
+        self.storage._configure(metadata)
+        self.stats['header'] += 1
+        self.total_chunks = metadata.get('total_chunks', 0)
+        self.chunk_len = self.storage._indexer().calculate_chunk_dna_length()
+        return True
+
+    def _place(self, packet):
+        if packet is None:
+            return False
+        try:
+            idx, data, nonce = ChunkManager.parse_chunk(packet)
+        except (ValueError, DNAStorageError):
+            return False
+        if self.total_chunks is not None and idx >= self.total_chunks:
+            return False
+        if idx in self.payloads:
+            self.stats['duplicates'] += 1
+        else:
+            self.payloads[idx] = data
+            self.stats['decoded'] += 1
+        return True
+
+    def flush(self):
+        """Decodes the buffered reads."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        packets = self.storage._try_decode_batch([s for s, _ in batch], [e for _, e in batch])
+        retry = [read for read, packet in zip(batch, packets) if not self._place(packet)]
+        if not retry:
+            return
+        # Reads that fail forward are tried as reverse complements, again as one batch
+        last = self.chunk_len - 1
+        packets = self.storage._try_decode_batch([reverse_complement(s) for s, _ in retry],
+                               [[last - i for i in reversed(e)] for _, e in retry])
+        for packet in packets:
+            if self._place(packet):
+                self.stats['reverse_complement'] += 1
+            else:
+                self.stats['failed'] += 1
+
+    def missing(self):
+        """Chunk indices not recovered yet (needs total_chunks)."""
+        self.flush()
+        if self.total_chunks is None:
+            raise ValueError("total_chunks unknown: no header read seen and none given")
+        return [i for i in range(self.total_chunks) if i not in self.payloads]
+
+    def result(self):
+        """The decoded data; raises DNAStorageError (MISSING_DATA) if chunks are missing."""
+        missing = self.missing()
+        if missing:
+            preview = ', '.join(map(str, missing[:10])) + (', ...' if len(missing) > 10 else '')
+            raise DNAStorageError(f"{len(missing)} chunks missing from pool: {preview}",
+                                  FailureType.MISSING_DATA)
+        return b''.join(self.payloads[i] for i in range(self.total_chunks))
+
+def decode_pool(path, storage=None, total_chunks=None, min_quality=10):
+    """
+    Decodes a FASTA/FASTQ file of reads (see PoolDecoder). Unless
+    total_chunks is given, a first pass finds the header read, so chunk
+    reads before it are not decoded with the wrong parameters.
+    """
+    decoder = PoolDecoder(storage, total_chunks, min_quality)
+    if total_chunks is None:
+        with open(path) as f:
+            decoder.scan_header(f)
+    with open(path) as f:
+        decoder.add_reads(f)
+    return decoder.result()
@@ -0,0 +1,58 @@
+"""Streaming FASTA/FASTQ parsing and oligo helpers for sequencing pools."""
+
+_COMPLEMENT = str.maketrans('ACGTacgt', 'TGCAtgca')
+
+def reverse_complement(dna_sequence):
+    return dna_sequence.translate(_COMPLEMENT)[::-1]
+
+def iter_reads(stream):
+    """
+    Yields (name, sequence, quality) from a FASTA or FASTQ text stream, one
+    record at a time. quality is the FASTQ quality string, or None for
+    FASTA. Multi-line FASTA records are joined.
+    """
+    lines = iter(stream)
+    for line in lines:
+        line = line.strip()
+        if line:
+            break
+    else:
+        return
+    if line.startswith('>'):
+        yield from _iter_fasta(line, lines)
+    elif line.startswith('@'):
+        yield from _iter_fastq(line, lines)
+    else:
+        raise ValueError("Input is neither FASTA nor FASTQ")
+
+def _iter_fasta(header, lines):
+    name, parts = header[1:], []
+    for line in lines:
+        line = line.strip()
+        if line.startswith('>'):
+            yield name, ''.join(parts), None
+            name, parts = line[1:], []
+        elif line:
+            parts.append(line)
+    yield name, ''.join(parts), None
+
+def _iter_fastq(header, lines):
+    while header:
+        if not header.startswith('@'):
+            raise ValueError(f"Malformed FASTQ record {header!r}")
+        sequence = next(lines, '').strip()
+        next(lines, '')  # '+' separator
+        quality = next(lines, '').strip()
+        if len(quality) != len(sequence):
+            raise ValueError(f"Truncated FASTQ record {header[1:]!r}")
+        yield header[1:], sequence, quality
+        header = ''
+        for line in lines:
+            header = line.strip()
+            if header:
+                break
+
+def write_fasta(stream, sequences, prefix='oligo'):
+    """Writes sequences as FASTA records named prefix_0, prefix_1, ..."""
+    for i, sequence in enumerate(sequences):
+        stream.write(f">{prefix}_{i}\n{sequence}\n")
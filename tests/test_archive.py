@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+import unittest
+from dna_storage.archive import DNAArchive, write_dna2
+from dna_storage.file_ops import DNAStorage
+
+class TestDNAArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = bytes(random.Random(11).randrange(256) for _ in range(5000))
+        self.storage = DNAStorage(chunk_size=64, batch_size=16)
+        self.dna = self.storage.encode(self.data)
+        self.text_path = os.path.join(self.tmp.name, 'a.dna')
+        self.dna2_path = os.path.join(self.tmp.name, 'a.dna2')
+        with open(self.text_path, 'w') as f:
+            f.write(self.dna + '\n')
+        write_dna2(self.dna2_path, self.dna)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_random_access(self):
+        rng = random.Random(5)
+        for path in (self.text_path, self.dna2_path):
+            with self.subTest(path=os.path.basename(path)), DNAArchive.open(path) as archive:
+                self.assertEqual(len(archive), -(-len(self.data) // 64))
+                self.assertEqual(archive.read_chunk(0), self.data[:64])
+                self.assertEqual(archive.read_chunk(len(archive) - 1), self.data[64 * (len(archive) - 1):])
+                for _ in range(50):
+                    offset = rng.randrange(len(self.data) + 100)
+                    length = rng.randrange(300)
+                    self.assertEqual(archive.read_range(offset, length), self.data[offset:offset + length])
+                self.assertEqual(b''.join(archive), self.data)
+                self.assertEqual(archive.read(), self.data)
+                with self.assertRaises(IndexError):
+                    archive.read_chunk(len(archive))
+
+    def test_header_parsed_once(self):
+        archive = DNAArchive(self.dna)
+        calls = []
+        original = archive.storage._parse_header_and_configure
+        archive.storage._parse_header_and_configure = lambda *a: calls.append(a) or original(*a)
+        for i in range(len(archive)):
+            archive.read_chunk(i)
+        self.assertEqual(calls, [])
+
+    def test_corrupted_base_in_text_file(self):
+        with open(self.text_path, 'r+b') as f:
+            f.seek(len(self.dna) - 10)
+            f.write(b'N')
+        with DNAArchive.open(self.text_path) as archive:
+            self.assertEqual(archive.read(), self.data)
+
+class TestDecodeRange(unittest.TestCase):
+    def test_matches_slices(self):
+        data = bytes(random.Random(2).randrange(256) for _ in range(4000))
+        rng = random.Random(9)
+        for encoding in ('baseline', 'rotating_block'):
+            storage = DNAStorage(chunk_size=32, encoding=encoding)
+            dna = storage.encode(data)
+            # Small windows and several workers exercise the parallel path
+            reader = DNAStorage(batch_size=4, threads=4)
+            for _ in range(30):
+                offset = rng.randrange(len(data) + 50)
+                length = rng.randrange(1000)
+                with self.subTest(encoding=encoding, offset=offset, length=length):
+                    self.assertEqual(reader.decode_range(dna, offset, length), data[offset:offset + length])
+
+    def test_pool_reused_and_native_batches_single_threaded(self):
+        data = bytes(range(256)) * 8
+        dna = DNAStorage(chunk_size=32).encode(data)
+        reader = DNAStorage(batch_size=4, threads=4)
+        threads = []
+        original = reader._decode_batch
+        reader._decode_batch = lambda *a, **k: threads.append(reader._native_threads()) or original(*a, **k)
+        self.assertEqual(reader.decode_range(dna, 0, len(data)), data)
+        pool = reader._range_pool
+        self.assertEqual(reader.decode_range(dna, 100, 900), data[100:1000])
+        self.assertIs(reader._range_pool, pool)
+        # The pool already uses every worker, so batches inside it must not fan out again
+        self.assertEqual(set(threads), {1})
+        self.assertEqual(reader._native_threads(), 4)
+        reader.close()
+        self.assertIsNone(reader._range_pool)
+
+    def test_only_overlapping_chunks_decoded(self):
+        data = bytes(range(256)) * 8
+        storage = DNAStorage(chunk_size=64)
+        dna = storage.encode(data)
+        decoded = []
+        original = storage._decode_chunks
+        storage._decode_chunks = lambda seq, idx, end, window, *a: decoded.extend(window) or original(seq, idx, end, window, *a)
+        self.assertEqual(storage.decode_range(dna, 100, 100), data[100:200])
+        self.assertEqual(decoded, [1, 2, 3])
+
+    def test_erasures_and_bad_arguments(self):
+        data = bytes(range(200)) * 5
+        storage = DNAStorage(chunk_size=50)
+        dna = storage.encode(data)
+        pos = len(dna) - 30
+        corrupted = dna[:pos] + 'N' + dna[pos + 1:]
+        self.assertEqual(storage.decode_range(corrupted, 950, 50, erasures=[pos]), data[950:])
+        self.assertEqual(storage.decode_range(dna, 10, 0), b'')
+        with self.assertRaises(ValueError):
+            storage.decode_range(dna, -1, 10)
+
+if __name__ == '__main__':
+    unittest.main()
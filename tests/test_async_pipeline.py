@@ -0,0 +1,112 @@
+import asyncio
+import io
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dna_storage.async_pipeline import AsyncStreamPipeline
+from dna_storage.file_ops import DNAStorage
+from dna_storage.pipeline import StreamPipeline
+
+class Sink:
+    """A StreamWriter stand-in: write() plus an async drain()."""
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+async def blocks(data, size):
+    for i in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[i:i + size]
+
+def stream_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+def encode_sync(data, chunk_size):
+    out = io.StringIO()
+    StreamPipeline(DNAStorage(chunk_size=chunk_size), window=8).encode_stream(io.BytesIO(data), out, len(data))
+    return out.getvalue()
+
+class TestAsyncStreamPipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_roundtrip_matches_sync(self):
+        data = random.Random(1).randbytes(6000)
+        sink = Sink()
+        await AsyncStreamPipeline(DNAStorage(chunk_size=32), window=8).encode_stream(
+            blocks(data, 1000), sink, len(data))
+        self.assertEqual(sink.data.decode('ascii'), encode_sync(data, 32))
+        self.assertGreater(sink.drains, 1)
+
+        out = Sink()
+        await AsyncStreamPipeline(DNAStorage(), window=8).decode_stream(stream_reader(bytes(sink.data)), out)
+        self.assertEqual(bytes(out.data), data)
+
+    async def test_concurrent_jobs_share_a_pool(self):
+        payloads = [random.Random(n).randbytes(3000 + 500 * n) for n in range(4)]
+        with ThreadPoolExecutor(2) as pool:
+            async def encode(data):
+                pipeline = AsyncStreamPipeline(DNAStorage(chunk_size=32), window=4, executor=pool)
+                return ''.join([dna async for dna in pipeline.encode_iter(stream_reader(data), len(data))])
+            results = await asyncio.gather(*(encode(data) for data in payloads))
+        for data, dna in zip(payloads, results):
+            self.assertEqual(dna, encode_sync(data, 32))
+
+    async def test_process_pool_decode_with_resync(self):
+        data = random.Random(2).randbytes(4000)
+        dna = encode_sync(data, 32)
+        p = len(dna) // 2
+        with ProcessPoolExecutor(2) as pool:
+            pipeline = AsyncStreamPipeline(DNAStorage(), window=4, executor=pool)
+            decoded = b''.join([block async for block in pipeline.decode_iter(blocks(dna[:p] + dna[p + 1:], 700))])
+        self.assertEqual(decoded, data)
+        self.assertEqual(pipeline.stats['repaired'] + pipeline.stats['resynced'], 1)
+
+    async def test_shared_storage_left_alone_and_resync_on_executor(self):
+        class Recorder(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                jobs.append((args[1].__name__, args[0]['threads']))
+                return super().submit(fn, *args, **kwargs)
+
+        jobs = []
+        payloads = [random.Random(n).randbytes(3000) for n in (3, 4)]
+        archives = [encode_sync(data, size) for data, size in zip(payloads, (32, 64))]
+        p = len(archives[0]) // 2
+        archives[0] = archives[0][:p] + archives[0][p + 1:]
+        storage = DNAStorage(chunk_size=100)
+        with Recorder(2) as pool:
+            async def decode(dna):
+                pipeline = AsyncStreamPipeline(storage, window=4, executor=pool)
+                return b''.join([block async for block in pipeline.decode_iter(blocks(dna, 700))])
+            results = await asyncio.gather(*(decode(dna) for dna in archives))
+        self.assertEqual(results, payloads)
+        self.assertEqual(storage.chunk_size, 100)
+        self.assertIn(('_resync', 1), jobs)
+        self.assertEqual({threads for _, threads in jobs}, {1})
+
+    async def test_cancel(self):
+        async def endless():
+            while True:
+                await asyncio.sleep(0.001)
+                yield bytes(1024)
+
+        sink = Sink()
+        pipeline = AsyncStreamPipeline(DNAStorage(chunk_size=32), window=4)
+        task = asyncio.create_task(pipeline.encode_stream(endless(), sink, 1 << 40))
+        while len(sink.data) < 10000:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        size = len(sink.data)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(sink.data), size)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import io
+import unittest
+from dna_storage.file_ops import DNAStorage, CPP_AVAILABLE
+from dna_storage.pipeline import StreamPipeline
+
+class TestBatch(unittest.TestCase):
+    DATA = bytes(range(256)) * 12 + b'tail'
+
+    def _configs(self):
+        backends = ['python', 'cpp'] if CPP_AVAILABLE else ['python']
+        for backend in backends:
+            for ecc in ('rs', 'hamming', 'none'):
+                for encoding in ('baseline', 'rotating_block'):
+                    yield backend, ecc, encoding
+
+    def test_batch_matches_per_chunk_encoding(self):
+        for backend, ecc, encoding in self._configs():
+            with self.subTest(backend=backend, ecc=ecc, encoding=encoding):
+                storage = DNAStorage(ecc_method=ecc, chunk_size=64, encoding=encoding,
+                                     backend=backend, threads=2, batch_size=7)
+                single = DNAStorage(ecc_method=ecc, chunk_size=64, encoding=encoding, batch_size=1)
+                encoded = storage.encode(self.DATA)
+                self.assertEqual(encoded, single.encode(self.DATA))
+                self.assertEqual(storage.decode(encoded), self.DATA)
+
+    def test_constraint_fallback(self):
+        data = b'\x00' * 64 * 10
+        storage = DNAStorage(chunk_size=64, constraints={'max_homopolymer': 4}, batch_size=4)
+        encoded = storage.encode(data)
+        self.assertEqual(DNAStorage().decode(encoded), data)
+
+    def test_windowed_stream(self):
+        storage = DNAStorage(chunk_size=32, batch_size=3)
+        pipeline = StreamPipeline(storage)
+        encoded = io.StringIO()
+        pipeline.encode_stream(io.BytesIO(self.DATA), encoded, len(self.DATA))
+        self.assertEqual(encoded.getvalue(), DNAStorage(chunk_size=32).encode(self.DATA))
+
+        decoded = io.BytesIO()
+        StreamPipeline(DNAStorage(), window=5).decode_stream(io.StringIO(encoded.getvalue()), decoded)
+        self.assertEqual(decoded.getvalue(), self.DATA)
+
+if __name__ == '__main__':
+    unittest.main()
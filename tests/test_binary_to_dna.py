@@ -0,0 +1,35 @@
+import os
+import unittest
+from dna_storage.binary_to_dna import (
+    bytes_to_dna, dna_to_bytes, bytes_to_binary, binary_to_dna_sequence, NUMPY_MIN_SIZE
+)
+
+class TestBytesCodec(unittest.TestCase):
+    def test_matches_string_path(self):
+        data = bytes(range(256))
+        expected = binary_to_dna_sequence(bytes_to_binary(data))
+        self.assertEqual(bytes_to_dna(data), expected)
+        self.assertEqual(dna_to_bytes(expected), data)
+
+    def test_large_roundtrip(self):
+        # Exercises the bulk (NumPy) path when available
+        data = os.urandom(NUMPY_MIN_SIZE + 4)
+        dna = bytes_to_dna(data)
+        self.assertEqual(len(dna), len(data) * 4)
+        self.assertEqual(dna_to_bytes(dna), data)
+        self.assertEqual(dna_to_bytes(dna.encode('ascii')), data)
+
+    def test_leading_zero_bytes(self):
+        data = b'\x00\x00\x01'
+        self.assertEqual(dna_to_bytes(bytes_to_dna(data)), data)
+
+    def test_invalid_base(self):
+        with self.assertRaisesRegex(ValueError, "Invalid DNA base 'N'"):
+            dna_to_bytes("ACGN")
+        with self.assertRaises(ValueError):
+            dna_to_bytes("AC G")
+        with self.assertRaises(ValueError):
+            dna_to_bytes("ACG")
+
+if __name__ == '__main__':
+    unittest.main()
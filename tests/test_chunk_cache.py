@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from dna_storage.archive import DNAArchive
+from dna_storage.chunking import ChunkCache
+from dna_storage.file_ops import DNAStorage
+
+class TestChunkCache(unittest.TestCase):
+    def test_lru_byte_budget(self):
+        cache = ChunkCache(max_bytes=10)
+        cache.put('a', b'1234')
+        cache.put('b', b'5678')
+        self.assertEqual(cache.get('a'), b'1234')
+        cache.put('c', b'9999')  # 12 bytes > 10: evicts 'b', the least recently used
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.current_bytes, 8)
+        self.assertIsNone(cache.get('b'))
+        cache.put('huge', b'x' * 11)  # larger than the budget, never stored
+        self.assertNotIn('huge', cache)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 1, 'entries': 2, 'bytes': 8})
+
+    def test_decode_chunk_hits_skip_decoding(self):
+        data = bytes(range(256)) * 4
+        dna = DNAStorage(chunk_size=64).encode(data, packed=True)
+        storage = DNAStorage(chunk_cache=ChunkCache())
+        self.assertEqual(storage.decode_chunk(dna, 3), data[192:256])
+        storage._parse_header_and_configure = None  # a hit must not touch the header again
+        self.assertEqual(storage.decode_chunk(dna, 3), data[192:256])
+        self.assertEqual((storage.chunk_cache.hits, storage.chunk_cache.misses), (1, 1))
+
+    def test_decode_range_decodes_only_misses(self):
+        data = bytes(range(256)) * 4
+        dna = DNAStorage(chunk_size=64).encode(data)
+        storage = DNAStorage(chunk_cache=ChunkCache())
+        self.assertEqual(storage.decode_range(dna, 100, 100, archive_key='a'), data[100:200])
+        decoded = []
+        original = storage._decode_batch
+        storage._decode_batch = lambda segments, *a: decoded.append(len(segments)) or original(segments, *a)
+        self.assertEqual(storage.decode_range(dna, 150, 150, archive_key='a'), data[150:300])
+        self.assertEqual(decoded, [1])  # chunks 2 and 3 were cached, only 4 is new
+        self.assertEqual(storage.chunk_cache.hits, 2)
+
+    def test_in_memory_keys_follow_identity(self):
+        encoder = DNAStorage(chunk_size=64)
+        first, second = (bytes([n]) * 512 for n in (1, 2))
+        a, b = encoder.encode(first, packed=True), encoder.encode(second, packed=True)
+        self.assertEqual(len(a), len(b))
+        storage = DNAStorage(chunk_cache=ChunkCache())
+        for _ in range(2):
+            self.assertEqual(storage.decode_chunk(a, 0), first[:64])
+            self.assertEqual(storage.decode_chunk(b, 0), second[:64])
+        self.assertEqual((storage.chunk_cache.misses, storage.chunk_cache.hits), (2, 2))
+        # A str has no identity to key on, so it is only cached under an explicit key
+        text = str(a)
+        storage.chunk_cache.clear()
+        storage.decode_chunk(text, 0)
+        self.assertEqual(len(storage.chunk_cache), 0)
+        storage.decode_chunk(text, 0, archive_key='a.dna')
+        self.assertIn(('a.dna', 0), storage.chunk_cache)
+
+    def test_extend_drops_cached_chunks(self):
+        dna = DNAStorage(chunk_size=64).encode(bytes(512), packed=True)
+        storage = DNAStorage(chunk_cache=ChunkCache())
+        for _ in range(2):
+            self.assertEqual(storage.decode_chunk(dna, 0), bytes(64))
+        self.assertEqual((storage.chunk_cache.misses, storage.chunk_cache.hits), (1, 1))
+        dna.extend('ACGT')
+        self.assertEqual(storage.decode_chunk(dna, 0), bytes(64))
+        self.assertEqual((storage.chunk_cache.misses, storage.chunk_cache.hits), (2, 1))
+
+    def test_shared_between_archives(self):
+        cache = ChunkCache()
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for n, payload in enumerate((b'first' * 100, b'second' * 100)):
+                paths.append(os.path.join(tmp, f'{n}.dna'))
+                with open(paths[-1], 'w') as f:
+                    f.write(DNAStorage(chunk_size=32).encode(payload))
+            for _ in range(2):
+                for path, payload in zip(paths, (b'first' * 100, b'second' * 100)):
+                    with DNAArchive.open(path, chunk_cache=cache) as archive:
+                        self.assertEqual(archive.read_range(10, 100), payload[10:110])
+        self.assertEqual((cache.misses, cache.hits), (8, 8))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import random
+import unittest
+from dna_storage.chunking import ChunkManager
+
+class TestChunker(unittest.TestCase):
+    def test_scramble_matches_random_mask(self):
+        for length in (0, 1, 16, 128, 1000):
+            data = os.urandom(length)
+            for nonce in (0, 1, 2, 999):
+                mask = random.Random(nonce).randbytes(length) if nonce else bytes(length)
+                expected = bytes(a ^ b for a, b in zip(data, mask))
+                self.assertEqual(ChunkManager._apply_scramble(data, nonce), expected)
+
+    def test_header_mask_is_involution(self):
+        header = os.urandom(ChunkManager.HEADER_SIZE)
+        masked = ChunkManager._apply_header_mask(header)
+        self.assertEqual(masked, bytes(a ^ b for a, b in zip(header, ChunkManager.HEADER_MASK)))
+        self.assertEqual(ChunkManager._apply_header_mask(masked), header)
+
+    def test_pack_parse_with_nonce(self):
+        packet = ChunkManager.pack_chunk(7, b'payload!', 7, nonce=42)
+        self.assertEqual(ChunkManager.parse_chunk(packet), (7, b'payload', 42))
+        self.assertEqual(ChunkManager.unpack_chunk_components(packet), (7, b'payload!', 7, 42))
+    def test_iter_chunks_matches_pack_chunk(self):
+        data = os.urandom(1000)
+        expected = []
+        for i, offset in enumerate(range(0, len(data), 128), 5):
+            piece = data[offset:offset + 128]
+            expected.append(ChunkManager.pack_chunk(i, piece + bytes(128 - len(piece)), len(piece)))
+        for source in (data, bytearray(data), memoryview(data)):
+            self.assertEqual(list(ChunkManager.iter_chunks(source, 128, start_index=5)), expected)
+        self.assertEqual(ChunkManager.chunk_data(b'', 128), [])
+
+    def test_iter_payloads_are_views(self):
+        data = bytearray(b'abcdefghij')
+        views = list(ChunkManager.iter_payloads(data, 4))
+        self.assertEqual([bytes(v) for v in views], [b'abcd', b'efgh', b'ij'])
+        data[0] = ord('z')
+        self.assertEqual(bytes(views[0]), b'zbcd')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from dna_storage.error_models import SubstitutionModel
+from dna_storage.file_ops import DNAStorage
+from dna_storage.pool import ReadClusterer, consensus, decode_clustered, reverse_complement, to_oligos, write_fasta
+from dna_storage.pool import cluster
+from dna_storage.pool.cluster import _hash_params, canonical_kmers, minhash
+
+class TestConsensus(unittest.TestCase):
+    def test_majority(self):
+        self.assertEqual(consensus(['ACGT', 'ACCT', 'TCGT']), 'ACGT')
+
+    def test_quality_weighted(self):
+        # One confident read outvotes two low-quality ones; N never wins
+        reads = ['AAAA', 'AAAA', 'CCCN']
+        qualities = ['####', '####', 'IIII']
+        self.assertEqual(consensus(reads, qualities), 'CCCA')
+
+    def test_signature_is_strand_independent(self):
+        seq = ''.join(random.Random(3).choice('ACGT') for _ in range(200))
+        self.assertEqual(canonical_kmers(seq, 12), canonical_kmers(reverse_complement(seq), 12))
+        params = _hash_params(8)
+        self.assertEqual(minhash(seq, 12, params), minhash(reverse_complement(seq), 12, params))
+
+class TestReadClusterer(unittest.TestCase):
+    def setUp(self):
+        self.data = random.Random(1).randbytes(4000)
+        self.storage = DNAStorage(chunk_size=64)
+        self.oligos = to_oligos(self.storage.encode(self.data), self.storage)
+
+    def _reads(self, seed, copies=8, error_rate=0.01):
+        rng = random.Random(seed)
+        noise = SubstitutionModel(error_rate, seed=seed)
+        reads = []
+        for n, oligo in enumerate(self.oligos):
+            for _ in range(copies):
+                # The 16-base length prefix of the header oligo has no ECC of its own
+                read = noise.apply(oligo) if n else oligo
+                reads.append(reverse_complement(read) if rng.random() < 0.5 else read)
+        rng.shuffle(reads)
+        return reads
+
+    def test_one_cluster_per_oligo(self):
+        clusterer = ReadClusterer(processes=1)
+        for read in self._reads(5):
+            clusterer.add(read)
+        result = clusterer.consensus()
+        expected = set(self.oligos[1:])
+        recovered = {s if s in expected else reverse_complement(s) for s, size in result}
+        self.assertEqual(len(result), len(self.oligos))
+        self.assertEqual(recovered & expected, expected)
+        self.assertTrue(all(size == 8 for s, size in result))
+
+    def _consensus(self, reads, qualities=None, **options):
+        with ReadClusterer(**options) as clusterer:
+            for read, quality in zip(reads, qualities or [None] * len(reads)):
+                clusterer.add(read, quality)
+            return clusterer.consensus()
+
+    def test_partitions_and_workers_agree(self):
+        reads = self._reads(7)
+        expected = sorted(self._consensus(reads, processes=1))
+        self.assertEqual(sorted(self._consensus(reads, processes=2, partitions=5)), expected)
+        self.assertEqual(sorted(self._consensus(reads, processes=1, partitions=1)), expected)
+        with mock.patch.object(cluster, 'NUMPY_AVAILABLE', False):
+            self.assertEqual(sorted(self._consensus(reads, processes=1, partitions=3)), expected)
+
+    def test_quality_weighted_votes(self):
+        # Three low-quality copies agree on a wrong base; one confident copy outvotes them
+        reads, qualities = [], []
+        for oligo in self.oligos[1:]:
+            pos = len(oligo) // 2
+            wrong = oligo[:pos] + 'ACGT'[('ACGT'.index(oligo[pos]) + 1) % 4] + oligo[pos + 1:]
+            reads += [wrong] * 3 + [oligo]
+            qualities += ['I' * pos + '#' + 'I' * (len(oligo) - pos - 1)] * 3 + ['I' * len(oligo)]
+        expected = set(self.oligos[1:])
+        for weighted, found in ((qualities, expected), (None, set())):
+            result = self._consensus(reads, weighted, processes=1)
+            self.assertEqual({s if s in expected else reverse_complement(s) for s, size in result} & expected, found)
+
+    def test_spill_files_removed_on_close(self):
+        clusterer = ReadClusterer(processes=1, partitions=4)
+        for read in self._reads(9, copies=2):
+            clusterer.add(read)
+        spill_dir = clusterer._spill_dir
+        self.assertEqual(len(os.listdir(spill_dir)), 4)
+        clusterer.consensus()
+        clusterer.close()
+        self.assertFalse(os.path.exists(spill_dir))
+
+    def test_decode_clustered(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.fasta')
+            with open(path, 'w') as f:
+                write_fasta(f, self._reads(6, copies=5, error_rate=0.02))
+            self.assertEqual(decode_clustered(path, processes=1), self.data)
+            self.assertEqual(decode_clustered(path, processes=2), self.data)
+
+if __name__ == '__main__':
+    unittest.main()
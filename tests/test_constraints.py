@@ -1,6 +1,8 @@
+import random
 import unittest
 from dna_storage.file_ops import DNAStorage
-from dna_storage.constraints import ConstraintValidator
+from dna_storage.chunking import ChunkManager
+from dna_storage.constraints import ConstraintValidator, ConstraintChecker
 
 class TestConstraints(unittest.TestCase):
     def test_gc_content(self):
@@ -27,6 +29,35 @@ class TestConstraints(unittest.TestCase):
         decoder = DNAStorage()
         decoded = decoder.decode(encoded)
         self.assertEqual(decoded, data)
+    def test_checker_matches_validator(self):
+        rng = random.Random(7)
+        constraints = {'min_gc': 0.45, 'max_gc': 0.55, 'max_homopolymer': 3}
+        checker = ConstraintChecker(constraints)
+        for _ in range(500):
+            dna = ''.join(rng.choice('ACGT') for _ in range(rng.randint(1, 40)))
+            expected = (ConstraintValidator.validate_gc_content(dna, 0.45, 0.55)
+                        and ConstraintValidator.validate_homopolymers(dna, 3))
+            self.assertEqual(checker(dna), expected)
+        self.assertEqual(checker.first_violation('ACGTTTTA'), 'homopolymer')
+        self.assertEqual(checker.first_violation('ACACATAT'), 'gc')
+
+    def test_batched_nonce_search_matches_serial(self):
+        data = bytes(random.Random(5).getrandbits(8) for _ in range(2048))
+        storage = DNAStorage(chunk_size=16, constraints={'max_homopolymer': 5, 'min_gc': 0.48, 'max_gc': 0.52})
+        packets = ChunkManager.chunk_data(data, 16)
+
+        def serial(chunk):
+            idx, payload, length, _ = ChunkManager.unpack_chunk_components(chunk)
+            for nonce in range(1001):
+                dna = storage._encode_body(ChunkManager.pack_chunk(idx, payload, length, nonce))
+                if storage._satisfies_constraints(dna):
+                    return dna, nonce
+
+        self.assertEqual(storage.encode_packets(packets), [serial(p)[0] for p in packets])
+        histogram = storage.retry_histogram
+        self.assertEqual(sum(histogram.values()), len(packets))
+        self.assertEqual(sum(n * c for n, c in histogram.items()), sum(serial(p)[1] for p in packets))
+        self.assertGreater(len(histogram), 1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from dna_storage.archive import DNAArchive, DNAContainer, pack_container, write_dna2
+from dna_storage.failures import DNAStorageError
+from dna_storage.file_ops import DNAStorage
+
+class TestContainer(unittest.TestCase):
+    def setUp(self):
+        self.files = {f'file_{i}.bin': os.urandom(i * 37) for i in range(40)}
+        self.files['notes.txt'] = b'hello container'
+
+    def test_roundtrip(self):
+        storage = DNAStorage(chunk_size=32)
+        dna = pack_container(self.files, storage, packed=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'many.dna2')
+            write_dna2(path, dna)
+            with DNAContainer.open(path) as container:
+                self.assertEqual(container.names(), list(self.files))
+                for name, data in self.files.items():
+                    self.assertEqual(container.extract(name), data)
+        # The directory spans several chunks here; its layout must still line up
+        first_chunk, length, crc = DNAContainer(DNAArchive(dna)).directory['file_1.bin']
+        self.assertGreater(first_chunk, 1)
+
+    def test_extract_decodes_only_that_file(self):
+        storage = DNAStorage(chunk_size=64)
+        container = DNAContainer(DNAArchive(pack_container(self.files, storage)))
+        decoded = []
+        original = container.archive.storage._decode_chunks
+        container.archive.storage._decode_chunks = lambda seq, idx, end, window, *a, **kw: \
+            decoded.extend(window) or original(seq, idx, end, window, *a, **kw)
+        self.assertEqual(container.extract('file_20.bin'), self.files['file_20.bin'])
+        first_chunk = container.directory['file_20.bin'][0]
+        self.assertEqual(decoded, list(range(first_chunk, first_chunk + 12)))
+
+    def test_crc_mismatch_and_bad_input(self):
+        container = DNAContainer(DNAArchive(pack_container({'a': b'x' * 100})))
+        first_chunk, length, crc = container.directory['a']
+        container.directory['a'] = (first_chunk, length, crc ^ 1)
+        with self.assertRaises(DNAStorageError):
+            container.extract('a')
+        with self.assertRaises(ValueError):
+            DNAContainer(DNAArchive(DNAStorage().encode(b'plain archive')))
+        with self.assertRaises(ValueError):
+            pack_container([('a', b'1'), ('a', b'2')])
+
+if __name__ == '__main__':
+    unittest.main()
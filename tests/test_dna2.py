@@ -0,0 +1,93 @@
+import io
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from dna_storage.archive import Dna2File, Dna2Writer, is_dna2, write_dna2
+from dna_storage.archive.dna2 import HEADER_SIZE
+from dna_storage.file_ops import DNAStorage
+from dna_storage.packed_dna import PackedDNA
+from dna_storage.pipeline import StreamPipeline
+from dna_storage import encode_file, decode_file
+
+class TestDna2(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'out.dna2')
+        self.data = bytes(random.Random(7).randrange(256) for _ in range(3000))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip_with_offset_table(self):
+        storage = DNAStorage(chunk_size=64)
+        dna = storage.encode(self.data, packed=True)
+        offsets = storage.chunk_offsets(dna)
+        write_dna2(self.path, dna, offsets)
+
+        self.assertTrue(is_dna2(self.path))
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + (len(dna) + 3) // 4 + 8 * len(offsets))
+        with Dna2File(self.path) as archive:
+            self.assertEqual(len(archive), len(dna))
+            self.assertEqual(list(archive.chunk_offsets), offsets)
+            self.assertEqual(offsets[-1], len(dna))
+            sequence = archive.sequence()
+            self.assertEqual(sequence, dna)
+            self.assertEqual(DNAStorage().decode(sequence), self.data)
+            self.assertEqual(DNAStorage().decode_chunk(sequence, 3), self.data[192:256])
+            del sequence
+
+    def test_writer_accepts_unaligned_pieces(self):
+        rng = random.Random(3)
+        text = ''.join(rng.choice('ACGT') for _ in range(1001))
+        with open(self.path, 'wb') as f:
+            writer = Dna2Writer(f)
+            pos = 0
+            while pos < len(text):
+                step = rng.randint(0, 37)
+                piece = text[pos:pos + step]
+                writer.write(piece if rng.random() < 0.5 else PackedDNA.from_str(piece))
+                pos += step
+            writer.close()
+        with Dna2File(self.path) as archive:
+            self.assertIsNone(archive.chunk_offsets)
+            self.assertEqual(str(archive.sequence()), text)
+
+    def test_streaming_roundtrip(self):
+        storage = DNAStorage(chunk_size=32, encoding='rotating_block')
+        with open(self.path, 'wb') as f:
+            writer = Dna2Writer(f)
+            StreamPipeline(storage, window=4).encode_stream(io.BytesIO(self.data), writer, len(self.data))
+            writer.close()
+        out = io.BytesIO()
+        with Dna2File(self.path) as archive:
+            StreamPipeline(DNAStorage()).decode_stream(archive.reader(), out)
+        self.assertEqual(out.getvalue(), self.data)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'w') as f:
+            f.write('ACGT' * 20)
+        self.assertFalse(is_dna2(self.path))
+        with self.assertRaises(ValueError):
+            Dna2File(self.path)
+
+    def test_cli_format_autodetect(self):
+        src = os.path.join(self.tmp.name, 'in.bin')
+        restored = os.path.join(self.tmp.name, 'restored.bin')
+        with open(src, 'wb') as f:
+            f.write(self.data)
+        for stream in ([], ['--stream']):
+            argv = ['encode_file', src, self.path, '--format', 'dna2'] + stream
+            with mock.patch.object(sys, 'argv', argv), mock.patch('builtins.print'):
+                encode_file.main()
+            self.assertTrue(is_dna2(self.path))
+            argv = ['decode_file', self.path, restored] + stream
+            with mock.patch.object(sys, 'argv', argv), mock.patch('builtins.print'):
+                decode_file.main()
+            with open(restored, 'rb') as f:
+                self.assertEqual(f.read(), self.data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import io
+import os
+import random
+import tarfile
+import tempfile
+import unittest
+from dna_storage.archive import DNAArchive, DNAReader, write_dna2
+from dna_storage.file_ops import DNAStorage
+
+class TestDNAReader(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(random.Random(4).randrange(256) for _ in range(3000))
+        self.dna = DNAStorage(chunk_size=64).encode(self.data)
+
+    def test_seek_and_read(self):
+        rng = random.Random(8)
+        with DNAReader(DNAArchive(self.dna)) as reader:
+            self.assertTrue(reader.seekable())
+            self.assertEqual(reader.seek(0, io.SEEK_END), len(self.data))
+            for _ in range(100):
+                pos = rng.randrange(len(self.data) + 20)
+                size = rng.randrange(400)
+                reader.seek(pos)
+                self.assertEqual(reader.read(size), self.data[pos:pos + size])
+                self.assertEqual(reader.tell(), min(pos + size, max(pos, len(self.data))))
+            reader.seek(-10, io.SEEK_END)
+            self.assertEqual(reader.read(), self.data[-10:])
+            self.assertEqual(reader.read(5), b'')
+            with self.assertRaises(ValueError):
+                reader.seek(-1)
+
+    def test_sequential_reads_grow_window(self):
+        archive = DNAArchive(self.dna)
+        windows = []
+        original = archive._iter_chunks
+        archive._iter_chunks = lambda chunks: windows.append(len(chunks)) or original(chunks)
+        reader = DNAReader(archive, readahead=8)
+        self.assertEqual(b''.join(iter(lambda: reader.read(100), b'')), self.data)
+        self.assertEqual(windows[:5], [2, 2, 4, 8, 8])
+        self.assertEqual(sum(windows), archive.total_chunks)
+
+    def test_extract_tar_member(self):
+        members = {'a.txt': b'alpha' * 300, 'b.bin': os.urandom(5000), 'c.txt': b'gamma' * 10}
+        tar_bytes = io.BytesIO()
+        with tarfile.open(fileobj=tar_bytes, mode='w') as tar:
+            for name, payload in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'backup.dna2')
+            write_dna2(path, DNAStorage(chunk_size=128).encode(tar_bytes.getvalue(), packed=True))
+            with DNAReader.open(path) as reader, tarfile.open(fileobj=reader, mode='r:') as tar:
+                self.assertEqual(tar.extractfile('c.txt').read(), members['c.txt'])
+                self.assertEqual(tar.extractfile('b.bin').read(), members['b.bin'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from dna_storage.file_ops import DNAStorage, CPP_AVAILABLE
+from dna_storage.ecc.reed_solomon import ReedSolomonError
+
+SWAP = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
+
+class TestErasures(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 2
+        self.backends = ['python', 'cpp'] if CPP_AVAILABLE else ['python']
+
+    def _corrupt(self, encoded, positions, replace=None):
+        body = list(encoded)
+        for pos in positions:
+            body[pos] = replace or SWAP[body[pos]]
+        return ''.join(body)
+
+    def test_known_positions_double_capacity(self):
+        for backend in self.backends:
+            storage = DNAStorage(ecc_method='rs', nsym=10, chunk_size=128, backend=backend)
+            encoded = storage.encode(self.data)
+            offset, _ = storage._parse_header_and_configure(encoded)
+            # 8 bad bases, 16 bases apart: 8 corrupted bytes, beyond nsym / 2 = 5 errors
+            positions = [offset + 20 + 16 * k for k in range(8)]
+            corrupted = self._corrupt(encoded, positions)
+
+            with self.subTest(backend=backend):
+                with self.assertRaises(ReedSolomonError):
+                    storage.decode(corrupted)
+                self.assertEqual(storage.decode(corrupted, erasures=positions), self.data)
+                self.assertEqual(storage.decode_chunk(corrupted, 0, erasures=positions), self.data[:128])
+
+    def test_rotating_block_erasures(self):
+        for backend in self.backends:
+            storage = DNAStorage(ecc_method='rs', nsym=10, chunk_size=128, encoding='rotating_block', backend=backend)
+            encoded = storage.encode(self.data)
+            offset, _ = storage._parse_header_and_configure(encoded)
+            # A bad base spoils its own 11-bit block and maybe the next one
+            positions = [offset + 30, offset + 100, offset + 400]
+            corrupted = self._corrupt(encoded, positions)
+            with self.subTest(backend=backend):
+                self.assertEqual(storage.decode(corrupted, erasures=positions), self.data)
+
+    def test_invalid_bases_become_erasures(self):
+        storage = DNAStorage(ecc_method='rs', nsym=10, chunk_size=128)
+        encoded = storage.encode(self.data)
+        offset, _ = storage._parse_header_and_configure(encoded)
+        corrupted = self._corrupt(encoded, [offset + 7 + 16 * k for k in range(8)], replace='N')
+        self.assertEqual(storage.decode(corrupted), self.data)
+
+    def test_truncated_tail(self):
+        storage = DNAStorage(ecc_method='rs', nsym=10, chunk_size=128)
+        encoded = storage.encode(self.data)
+        # 12 bases = 3 bytes of the last chunk's parity
+        self.assertEqual(storage.decode(encoded[:-12]), self.data)
+        with self.assertRaisesRegex(ValueError, "Unexpected end of stream"):
+            storage.decode(encoded[:-200])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,5 +27,14 @@ class TestFullRoundtrip(unittest.TestCase):
         self.assertEqual(decoded_data, data)
         self.assertEqual(decoder.ecc_method, 'hamming')
 
+    def test_rs_multi_block_chunk(self):
+        # Packets longer than one 255-byte RS block get parity per block
+        storage = DNAStorage(ecc_method='rs', nsym=10, chunk_size=1024)
+        data = bytes(range(256)) * 9
+        encoded_dna = storage.encode(data)
+
+        decoder = DNAStorage()
+        self.assertEqual(decoder.decode(encoded_dna), data)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from dna_storage.ecc.hamming import hamming_encode, hamming_encode_bytes, hamming_decode_bytes
+from dna_storage.binary_to_dna import bytes_to_binary, packed_to_bits
+
+class TestHammingBytes(unittest.TestCase):
+    def test_matches_bit_list_codec(self):
+        data = bytes(range(256)) + b'xyz'
+        packed, bit_length = hamming_encode_bytes(data)
+        self.assertEqual(bit_length, len(data) * 14)
+
+        expected = hamming_encode([int(c) for c in bytes_to_binary(data)])
+        self.assertEqual(packed_to_bits(packed, bit_length), ''.join(map(str, expected)))
+
+        decoded, corrected = hamming_decode_bytes(packed, bit_length)
+        self.assertEqual(decoded, data)
+        self.assertEqual(corrected, 0)
+
+    def test_single_bit_error_per_block(self):
+        data = b'Hamming'
+        packed, bit_length = hamming_encode_bytes(data)
+        corrupted = bytearray(packed)
+        corrupted[0] ^= 0x80  # first block
+        corrupted[3] ^= 0x01  # a later block
+        decoded, corrected = hamming_decode_bytes(bytes(corrupted), bit_length)
+        self.assertEqual(decoded, data)
+        self.assertEqual(corrected, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from dna_storage.ecc import ECC
+from dna_storage.ecc.hamming import hamming_encode, hamming_decode
+from dna_storage.ecc.hamming import vectorized
+
+@unittest.skipUnless(vectorized.NUMPY_AVAILABLE, "NumPy not available")
+class TestHammingVectorized(unittest.TestCase):
+    def test_matches_reference(self):
+        bits = [1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1, 0, 0]  # pads to 16
+        expected = hamming_encode(bits)
+        encoded = vectorized.encode_bits(bits)
+        self.assertEqual(encoded.tolist(), expected)
+
+        decoded, corrected = vectorized.decode_bits(encoded)
+        self.assertEqual(decoded.tolist(), hamming_decode(expected)[0])
+        self.assertFalse(corrected.any())
+
+    def test_per_block_corrections(self):
+        packets = [bytes(range(16)), bytes(range(16, 32)), bytes(range(32, 48))]
+        packed, bit_length = ECC.hamming_encode_batch(packets)
+        self.assertEqual(bit_length, 16 * 14)
+
+        corrupted = [bytearray(p) for p in packed]
+        corrupted[0][0] ^= 0x40   # block 0 of packet 0
+        corrupted[2][5] ^= 0x01   # one block of packet 2
+        corrupted[2][20] ^= 0x10  # another block of packet 2
+        decoded, counts = ECC.hamming_decode_batch([bytes(c) for c in corrupted], bit_length)
+        self.assertEqual(decoded, packets)
+        self.assertEqual(counts, [1, 0, 2])
+
+        _, corrected = vectorized.decode_packets(
+            [list(c) for c in corrupted], bit_length
+        )
+        self.assertEqual(corrected.shape, (3, 32))
+        self.assertTrue(corrected[0, 0])
+
+    def test_string_adapters(self):
+        binary = '0110100111'
+        encoded = ECC.hamming_encode(binary)
+        self.assertEqual(encoded, ''.join(map(str, hamming_encode([int(c) for c in binary]))))
+        self.assertEqual(ECC.hamming_decode(encoded)[:len(binary)], binary)
+
+    def test_string_adapters_reject_non_bits(self):
+        for text in ('0120', '01a0', '01 0', '01/0', '01\u00e90'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    ECC.hamming_encode(text)
+                with self.assertRaises(ValueError):
+                    ECC.hamming_decode(text * 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from dna_storage.file_ops import DNAStorage
+from dna_storage.io_stages import ReadAhead, WriteBehind
+from dna_storage.pipeline import StreamPipeline
+
+class CountingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def write(self, data):
+        self.calls += 1
+        return super().write(data)
+
+class FailingStream:
+    def read(self, size=-1):
+        raise OSError("disk gone")
+
+    def write(self, data):
+        raise OSError("disk full")
+
+class ViewStream:
+    """Returns bytearray and memoryview blocks, as some raw and socket readers do."""
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read(self, size=-1):
+        block = self.data[self.pos:self.pos + size]
+        self.pos += len(block)
+        return bytearray(block) if self.pos % 2 else memoryview(block)
+
+class TestReadAhead(unittest.TestCase):
+    def test_reads_across_blocks(self):
+        data = random.Random(1).randbytes(10000)
+        reader = ReadAhead(io.BytesIO(data), block_size=333, depth=2)
+        buffer = bytearray(1000)
+        self.assertEqual(reader.readinto(buffer), 1000)
+        self.assertEqual(reader.read(17) + reader.read(), data[1000:])
+        self.assertEqual(reader.read(5), b'')
+        reader.close()
+
+        text = ReadAhead(io.StringIO('ACGT' * 100), block_size=7)
+        self.assertEqual(text.read(10), 'ACGTACGTAC')
+        text.close()
+
+    def test_bytes_like_blocks(self):
+        data = random.Random(2).randbytes(1001)
+        reader = ReadAhead(ViewStream(data), block_size=100)
+        self.assertEqual(reader.read(), data)
+        reader.close()
+        # Anything else is refused rather than turned into text
+        reader = ReadAhead(type('NoneStream', (), {'read': lambda self, size: None})())
+        with self.assertRaises(TypeError):
+            reader.read(10)
+        reader.close()
+
+    def test_error_reaches_caller(self):
+        reader = ReadAhead(FailingStream())
+        with self.assertRaisesRegex(OSError, "disk gone"):
+            reader.read(10)
+        reader.close()
+
+class TestWriteBehind(unittest.TestCase):
+    def test_coalesces_in_order(self):
+        out = CountingWriter()
+        writer = WriteBehind(out, block_size=100)
+        seen = []
+        for i in range(50):
+            writer.write(f'{i:04d}')
+            if i == 30:
+                writer.then(lambda: seen.append(out.getvalue()))
+        writer.close()
+        self.assertEqual(out.getvalue(), ''.join(f'{i:04d}' for i in range(50)))
+        self.assertEqual(out.calls, 3)  # 100, 24 (flushed by then()), 76
+        self.assertEqual(seen, [''.join(f'{i:04d}' for i in range(31))])
+
+    def test_error_reaches_caller(self):
+        writer = WriteBehind(FailingStream(), block_size=1)
+        with self.assertRaisesRegex(OSError, "disk full"):
+            for _ in range(100):
+                writer.write('A')
+            writer.close()
+
+class TestStagedPipeline(unittest.TestCase):
+    def test_roundtrip_with_checkpoint(self):
+        data = random.Random(4).randbytes(20000)
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, 'cp.json')
+            encoded = io.StringIO()
+            StreamPipeline(DNAStorage(chunk_size=64), window=16, staged=True, io_block_size=4096).encode_stream(
+                io.BytesIO(data), encoded, len(data), checkpoint_path=checkpoint)
+            with open(checkpoint) as f:
+                self.assertIn(str(-(-len(data) // 64)), f.read())
+        decoded = io.BytesIO()
+        StreamPipeline(DNAStorage(), window=16, staged=True, io_block_size=4096).decode_stream(
+            io.StringIO(encoded.getvalue()), decoded)
+        self.assertEqual(decoded.getvalue(), data)
+
+if __name__ == '__main__':
+    unittest.main()
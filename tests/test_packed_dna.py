@@ -0,0 +1,57 @@
+import random
+import unittest
+from unittest import mock
+from dna_storage import packed_dna
+from dna_storage.packed_dna import PackedDNA
+from dna_storage.file_ops import DNAStorage
+
+class TestPackedDNA(unittest.TestCase):
+    def _check_ops(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            dna = ''.join(rng.choice('ACGT') for _ in range(rng.randint(0, 40)))
+            packed = PackedDNA.from_str(dna)
+            self.assertEqual(str(packed), dna)
+            self.assertEqual(len(packed), len(dna))
+            self.assertEqual(len(packed.tobytes()), (len(dna) + 3) // 4)
+            start, stop = sorted(rng.randint(-5, 45) for _ in range(2))
+            self.assertEqual(str(packed[start:stop]), dna[start:stop])
+            self.assertEqual(str(packed[::3]), dna[::3])
+            if dna:
+                i = rng.randrange(len(dna))
+                self.assertEqual(packed[i], dna[i])
+            tail = ''.join(rng.choice('ACGT') for _ in range(rng.randint(0, 13)))
+            self.assertEqual(packed + tail, PackedDNA.from_str(dna + tail))
+
+    def test_operations(self):
+        self._check_ops()
+
+    def test_operations_without_native(self):
+        with mock.patch.object(packed_dna, 'CPP_AVAILABLE', False):
+            self._check_ops()
+
+    def test_packed_form_is_baseline_bytes(self):
+        self.assertEqual(PackedDNA.from_str('ATCG').tobytes(), b'\x1b')
+        with self.assertRaises(ValueError):
+            PackedDNA.from_str('ACGN')
+
+    def test_unhashable(self):
+        # extend() mutates in place, so a content hash would go stale
+        with self.assertRaises(TypeError):
+            hash(PackedDNA.from_str('ACGT'))
+
+    def test_storage_roundtrip(self):
+        data = bytes(range(256)) * 5
+        for encoding in ('baseline', 'rotating_block'):
+            for ecc in ('rs', 'hamming'):
+                storage = DNAStorage(ecc_method=ecc, chunk_size=100, encoding=encoding, batch_size=4)
+                text = storage.encode(data)
+                packed = storage.encode(data, packed=True)
+                with self.subTest(encoding=encoding, ecc=ecc):
+                    self.assertIsInstance(packed, PackedDNA)
+                    self.assertEqual(str(packed), text)
+                    self.assertEqual(storage.decode(packed), data)
+                    self.assertEqual(storage.decode_chunk(packed, 3), data[300:400])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from dna_storage.error_models import SubstitutionModel
+from dna_storage.failures import DNAStorageError
+from dna_storage.file_ops import DNAStorage
+from dna_storage.pool import PoolDecoder, decode_pool, iter_reads, reverse_complement, to_oligos, write_fasta
+
+class TestPoolDecoder(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(random.Random(1).randrange(256) for _ in range(4000))
+        self.storage = DNAStorage(chunk_size=64)
+        self.oligos = to_oligos(self.storage.encode(self.data), self.storage)
+
+    def _reads(self, rng, copies=3, error_rate=0.0):
+        noise = SubstitutionModel(error_rate, seed=rng.random())
+        reads = []
+        for n, oligo in enumerate(self.oligos):
+            for _ in range(rng.randint(1, copies)):
+                # The 16-base length prefix of the header oligo has no ECC of its own
+                read = noise.apply(oligo) if n else oligo
+                reads.append(reverse_complement(read) if rng.random() < 0.5 else read)
+        rng.shuffle(reads)
+        return reads
+
+    def test_shuffled_reverse_complemented_duplicated(self):
+        rng = random.Random(2)
+        reads = self._reads(rng, error_rate=0.005)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.fasta')
+            with open(path, 'w') as f:
+                write_fasta(f, reads)
+            decoded = decode_pool(path, DNAStorage(batch_size=16))
+        self.assertEqual(decoded, self.data)
+
+    def test_missing_chunks_reported(self):
+        reads = [o for i, o in enumerate(self.oligos) if i not in (3, 10)]
+        decoder = PoolDecoder()
+        for read in reads:
+            decoder.add_read(read)
+        self.assertEqual(decoder.missing(), [2, 9])
+        with self.assertRaisesRegex(DNAStorageError, "2 chunks missing"):
+            decoder.result()
+
+    def test_header_prefix_in_longer_read_ignored(self):
+        other = to_oligos(DNAStorage(chunk_size=32, nsym=4).encode(b'x' * 100))[0]
+        decoder = PoolDecoder(DNAStorage(chunk_size=64))
+        decoder.add_read(other + 'ACGT' * 5)
+        self.assertEqual((decoder.storage.chunk_size, decoder.storage.nsym), (64, 10))
+        self.assertEqual((decoder.stats['header'], decoder.stats['wrong_length']), (0, 1))
+        for oligo in self.oligos:
+            decoder.add_read(oligo)
+        self.assertEqual(decoder.result(), self.data)
+
+    def test_fastq_quality_marks_erasures(self):
+        rng = random.Random(4)
+        lines = []
+        for n, oligo in enumerate(self.oligos):
+            read, quality = list(oligo), ['I'] * len(oligo)
+            if n:
+                # More bad bases than RS can correct as errors, all flagged by quality
+                for pos in rng.sample(range(len(read)), 8):
+                    read[pos] = 'N' if pos % 2 else 'ACGT'[('ACGT'.index(read[pos]) + 1) % 4]
+                    quality[pos] = '#'
+            lines.append(f"@read{n}\n{''.join(read)}\n+\n{''.join(quality)}\n")
+        decoder = PoolDecoder()
+        decoder.add_reads(io.StringIO(''.join(lines)))
+        self.assertEqual(decoder.result(), self.data)
+        self.assertEqual(decoder.stats['failed'], 0)
+
+    def test_iter_reads_formats(self):
+        fasta = ">a\nACGT\nTT\n\n>b\nGG\n"
+        self.assertEqual(list(iter_reads(io.StringIO(fasta))), [('a', 'ACGTTT', None), ('b', 'GG', None)])
+        fastq = "@r1\nACG\n+\nII#\n@r2\nT\n+r2\nI\n"
+        self.assertEqual(list(iter_reads(io.StringIO(fastq))), [('r1', 'ACG', 'II#'), ('r2', 'T', 'I')])
+        with self.assertRaises(ValueError):
+            list(iter_reads(io.StringIO("ACGT\n")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import unittest
+import reedsolo
+from dna_storage.ecc import ECC
+from dna_storage.ecc.reed_solomon import get_codec, vectorized as rs_vec
+
+class TestReedSolomon(unittest.TestCase):
+    def test_codec_is_shared(self):
+        self.assertIs(get_codec(10), get_codec(10))
+        self.assertIsNot(get_codec(10), get_codec(12))
+
+    def test_batch_encode_matches_reedsolo(self):
+        # 300 and 600 bytes span several 255-byte RS blocks
+        for nsym in (4, 10, 32):
+            for size in (1, 16, 128, 245, 300, 600):
+                packets = [os.urandom(size) for _ in range(5)]
+                expected = [bytes(reedsolo.RSCodec(nsym).encode(p)) for p in packets]
+                with self.subTest(nsym=nsym, size=size):
+                    self.assertEqual(ECC.rs_encode_batch(packets, nsym), expected)
+
+    def test_batch_decode_corrects_errors(self):
+        packets = [os.urandom(300) for _ in range(4)]
+        encoded = [bytearray(e) for e in ECC.rs_encode_batch(packets, 10)]
+        encoded[1][5] ^= 0xFF
+        encoded[3][260] ^= 0x01
+        encoded = [bytes(e) for e in encoded]
+
+        if rs_vec.NUMPY_AVAILABLE:
+            import numpy as np
+            matrix = np.frombuffer(b''.join(encoded), dtype=np.uint8).reshape(4, -1)
+            self.assertEqual(rs_vec.check_packets(matrix, 10).tolist(), [True, False, True, False])
+        self.assertEqual(ECC.rs_decode_batch(encoded, 10), packets)
+
+    def test_batch_decode_skip_errors(self):
+        packets = [os.urandom(100) for _ in range(3)]
+        encoded = ECC.rs_encode_batch(packets, 10)
+        encoded[1] = os.urandom(len(encoded[1]))
+        with self.assertRaises(reedsolo.ReedSolomonError):
+            ECC.rs_decode_batch(encoded, 10)
+        self.assertEqual(ECC.rs_decode_batch(encoded, 10, skip_errors=True), [packets[0], None, packets[2]])
+
+if __name__ == '__main__':
+    unittest.main()
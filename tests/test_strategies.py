@@ -1,6 +1,8 @@
 import unittest
 from dna_storage.file_ops import DNAStorage
-from dna_storage.encoding_strategies import RotatingStrategy
+from dna_storage.encoding_strategies import RotatingStrategy, BaselineStrategy, BlockRotatingStrategy
+from dna_storage.constraints import ConstraintValidator
+from dna_storage.binary_to_dna import bits_to_packed
 
 class TestStrategies(unittest.TestCase):
     def test_rotating_strategy_logic(self):
@@ -13,6 +15,21 @@ class TestStrategies(unittest.TestCase):
         decoded = strategy.decode(encoded)
         self.assertEqual(decoded, data)
         
+    def test_packed_matches_string_interface(self):
+        bits = "1011001110001"  # 13 bits, not byte aligned
+        packed, bit_length = bits_to_packed(bits)
+        strategy = RotatingStrategy()
+        encoded = strategy.encode_packed(packed, bit_length)
+        self.assertEqual(encoded, strategy.encode(bits))
+        self.assertEqual(strategy.decode_packed(encoded, bit_length), packed)
+
+        bits = bits + "0"
+        packed, bit_length = bits_to_packed(bits)
+        baseline = BaselineStrategy()
+        encoded = baseline.encode_packed(packed, bit_length)
+        self.assertEqual(encoded, baseline.encode(bits))
+        self.assertEqual(baseline.decode_packed(encoded, bit_length), packed)
+
     def test_rotating_integration(self):
         storage = DNAStorage(encoding='rotating')
         data = b'Hello Rotating World'
@@ -21,5 +38,26 @@ class TestStrategies(unittest.TestCase):
         self.assertEqual(decoded, data)
         self.assertEqual(storage.encoding_name, 'rotating')
 
+    def test_block_rotating_lengths(self):
+        strategy = BlockRotatingStrategy()
+        for bit_length in (0, 1, 10, 11, 12, 88, 100, 1232):
+            data = bytes((i * 37) & 0xFF for i in range((bit_length + 7) // 8))
+            if bit_length % 8:
+                data = data[:-1] + bytes([data[-1] & (0xFF << (8 - bit_length % 8)) & 0xFF])
+            encoded = strategy.encode_packed(data, bit_length)
+            # Exact length lets AddressIndexer compute offsets with bits_per_base
+            self.assertEqual(len(encoded), -(-bit_length // strategy.bits_per_base()))
+            self.assertTrue(ConstraintValidator.validate_homopolymers(encoded, 1))
+            self.assertEqual(strategy.decode_packed(encoded, bit_length), data)
+
+    def test_block_rotating_large_chunks(self):
+        data = bytes(range(256)) * 20
+        for ecc in ('rs', 'hamming'):
+            storage = DNAStorage(ecc_method=ecc, chunk_size=2048, encoding='rotating_block')
+            encoded = storage.encode(data)
+            decoder = DNAStorage()
+            self.assertEqual(decoder.decode(encoded), data)
+            self.assertEqual(decoder.decode_chunk(encoded, 1), data[2048:4096])
+
 if __name__ == '__main__':
     unittest.main()
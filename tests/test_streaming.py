@@ -1,7 +1,11 @@
 import unittest
 import io
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dna_storage.failures import DNAStorageError, FailureType
 from dna_storage.file_ops import DNAStorage
 from dna_storage.pipeline import StreamPipeline
+from dna_storage.pool import to_oligos
 
 class TestStreaming(unittest.TestCase):
     def test_streaming_roundtrip(self):
@@ -24,5 +28,104 @@ class TestStreaming(unittest.TestCase):
         
         self.assertEqual(decoded_output.getvalue(), data)
 
+    def test_decode_binary_stream(self):
+        data = random.Random(5).randbytes(3000)
+        encoded = io.StringIO()
+        StreamPipeline(DNAStorage(chunk_size=32)).encode_stream(io.BytesIO(data), encoded, len(data))
+        for staged in (False, True):
+            with self.subTest(staged=staged):
+                out = io.BytesIO()
+                StreamPipeline(DNAStorage(), staged=staged, io_block_size=500).decode_stream(
+                    io.BytesIO(encoded.getvalue().encode('ascii')), out)
+                self.assertEqual(out.getvalue(), data)
+
+class TestParallelStreaming(unittest.TestCase):
+    def test_matches_serial_output(self):
+        data = random.Random(2).randbytes(5000)
+        serial = io.StringIO()
+        StreamPipeline(DNAStorage(chunk_size=32), window=8).encode_stream(io.BytesIO(data), serial, len(data))
+        storage = DNAStorage(chunk_size=32)
+        parallel = io.StringIO()
+        StreamPipeline(storage, window=8, workers=2, max_in_flight=3).encode_stream(
+            io.BytesIO(data), parallel, len(data))
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+        self.assertEqual(sum(storage.retry_histogram.values()), -(-len(data) // 32))
+
+        out = io.BytesIO()
+        StreamPipeline(DNAStorage(), window=8, workers=2).decode_stream(io.StringIO(serial.getvalue()), out)
+        self.assertEqual(out.getvalue(), data)
+
+    def test_shared_executor_with_resync(self):
+        data = random.Random(3).randbytes(3000)
+        dna = DNAStorage(chunk_size=32).encode(data)
+        p = len(dna) // 3
+        with ProcessPoolExecutor(2) as executor:
+            pipeline = StreamPipeline(DNAStorage(), window=4, workers=2, executor=executor)
+            out = io.BytesIO()
+            pipeline.decode_stream(io.StringIO(dna[:p] + dna[p + 1:]), out)
+            self.assertEqual(out.getvalue(), data)
+            self.assertEqual(pipeline.stats['repaired'] + pipeline.stats['resynced'], 1)
+            # The pool belongs to the caller and is still usable
+            self.assertEqual(executor.submit(abs, -1).result(), 1)
+
+class TestIndelResync(unittest.TestCase):
+    def setUp(self):
+        self.data = random.Random(5).randbytes(2000)
+        storage = DNAStorage(chunk_size=64)
+        self.dna = storage.encode(self.data)
+        oligos = to_oligos(self.dna, storage)
+        self.header_end = len(oligos[0])
+        self.chunk_len = len(oligos[1])
+
+    def _decode(self, dna):
+        pipeline = StreamPipeline(DNAStorage(), window=4)
+        out = io.BytesIO()
+        try:
+            pipeline.decode_stream(io.StringIO(dna), out)
+        finally:
+            self.out = out.getvalue()
+        return pipeline
+
+    def _at(self, chunk, offset):
+        return self.header_end + chunk * self.chunk_len + offset
+
+    def test_insertion_and_deletion_repaired(self):
+        p, q = self._at(3, 100), self._at(17, 250)
+        dna = self.dna[:p] + 'G' + self.dna[p:q] + self.dna[q + 2:]
+        pipeline = self._decode(dna)
+        self.assertEqual(self.out, self.data)
+        self.assertEqual(pipeline.stats['repaired'], 2)
+
+    def test_shift_from_corrected_chunk(self):
+        # Deleting the last base leaves chunk 5 within RS reach, but shifts every later chunk
+        p = self._at(5, self.chunk_len - 1)
+        pipeline = self._decode(self.dna[:p] + self.dna[p + 1:])
+        self.assertEqual(self.out, self.data)
+        self.assertEqual(pipeline.stats['resynced'], 1)
+
+    def test_unrecoverable_chunk_reported(self):
+        p = self._at(8, 0)
+        wrecked = ''.join(random.Random(1).choice('ACGT') for _ in range(self.chunk_len - 5))
+        with self.assertRaises(DNAStorageError) as cm:
+            self._decode(self.dna[:p] + wrecked + self.dna[p + self.chunk_len:])
+        self.assertEqual(cm.exception.failure_type, FailureType.MISSING_DATA)
+        self.assertIn("8", str(cm.exception))
+        # Every other chunk is written at its own offset
+        self.assertEqual(self.out[:8 * 64], self.data[:8 * 64])
+        self.assertEqual(self.out[9 * 64:], self.data[9 * 64:])
+
+    def test_only_decode_failures_absorbed(self):
+        storage = DNAStorage(encoding='rotating')
+        segments = ['ACGT' * 10, 'ACGN' * 10]
+        self.assertEqual(storage._try_decode_batch(segments), [None, None])
+        # A bug in a decoder must surface, not turn into lost chunks
+        storage._decode_batch = lambda *a, **k: [][0]
+        with self.assertRaises(IndexError):
+            storage._try_decode_batch(segments)
+
+    def test_truncated(self):
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            self._decode(self.dna[:self._at(10, 0)])
+
 if __name__ == '__main__':
     unittest.main()